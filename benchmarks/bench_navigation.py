@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+导航树构建基准测试
+
+使用合成的端点路径（宽目录，类似 Claude 下 60+ 个模型目录）测量
+add_api_to_navigation 构建导航树的耗时，验证每个端点的耗时不随规模增长，
+并与旧的线性查找子节点实现对比。
+
+使用方法:
+    python benchmarks/bench_navigation.py                       # 默认规模 1k/10k/100k
+    python benchmarks/bench_navigation.py --sizes 1000 100000   # 自定义规模
+    python benchmarks/bench_navigation.py --skip-legacy         # 跳过旧实现
+"""
+
+import argparse
+import gc
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from generate_docs import NavigationNode, add_api_to_navigation, register_folder  # noqa: E402
+
+def synthetic_paths(count: int) -> List[Tuple[List[str], str]]:
+    """生成合成的 (文件夹路径, API 名称) 列表
+
+    顶级分类固定为 16 个，模型目录数量随规模增长，使同级目录足够宽。
+    """
+    categories = [f'Provider {i}' for i in range(16)]
+    formats = ['OpenAI Format', 'Official Format', 'GPTProto Format']
+    endpoints_per_folder = 4
+    models_per_category = max(1, count // (len(categories) * len(formats) * endpoints_per_folder))
+
+    paths = []
+    index = 0
+    while len(paths) < count:
+        category = categories[index % len(categories)]
+        model = f'model-{(index // len(categories)) % models_per_category}'
+        fmt = formats[(index // (len(categories) * models_per_category)) % len(formats)]
+        paths.append(([category, model, fmt], f'Endpoint {index}'))
+        index += 1
+    return paths
+
+def legacy_add_api_to_navigation(
+    navigation_tree: Dict[str, NavigationNode],
+    folder_path: List[str],
+    api_name: str,
+    relative_path: str
+):
+    """旧实现：线性扫描 children 查找文件夹节点（仅用于对比）"""
+    current_node = navigation_tree[folder_path[0]]
+    for folder_name in folder_path[1:]:
+        found = False
+        for child in current_node.children:
+            if child.is_folder and child.name == folder_name:
+                current_node = child
+                found = True
+                break
+        if not found:
+            new_folder_node = NavigationNode(folder_name, is_folder=True)
+            current_node.add_child(new_folder_node)
+            current_node = new_folder_node
+
+    api_node = NavigationNode(api_name, is_folder=False)
+    api_node.file_path = relative_path
+    current_node.add_child(api_node)
+
+def build_tree(paths: List[Tuple[List[str], str]], add_api) -> float:
+    """构建导航树并返回耗时（秒）；与 timeit 一样在计时期间关闭 GC"""
+    navigation_tree: Dict[str, NavigationNode] = {}
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for folder_path, api_name in paths:
+            register_folder(folder_path, navigation_tree)
+            add_api(navigation_tree, folder_path, api_name, 'docs/api/' + '/'.join(folder_path + [api_name]))
+        for node in navigation_tree.values():
+            node.to_dict()
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark navigation tree construction')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='Endpoint counts to benchmark (default: 1000 10000 100000)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per size, best is reported (default: 3)')
+    parser.add_argument('--skip-legacy', action='store_true', help='Do not run the linear-scan implementation')
+    args = parser.parse_args()
+
+    print(f"{'endpoints':>10}  {'indexed (s)':>12}  {'us/endpoint':>12}  {'legacy (s)':>11}  {'us/endpoint':>12}")
+    for size in args.sizes:
+        paths = synthetic_paths(size)
+        indexed = min(build_tree(paths, add_api_to_navigation) for _ in range(args.repeat))
+        row = f"{size:>10}  {indexed:>12.4f}  {indexed / size * 1e6:>12.2f}"
+        if not args.skip_legacy:
+            legacy = min(build_tree(paths, legacy_add_api_to_navigation) for _ in range(args.repeat))
+            row += f"  {legacy:>11.4f}  {legacy / size * 1e6:>12.2f}"
+        print(row)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+文档生成流水线的规模基准测试
+
+使用 synthetic_apifox 生成不同规模的合成导出文件，分阶段测量耗时和峰值内存：
+
+- load:             json.load 读取导出文件
+- extract:          遍历集合、规划输出路径（含创建目录）并构建导航树
+- render:           generate_api_doc 渲染所有页面
+- write:            OutputWriter 写入所有页面
+- update_mint_json: 更新 mint.json 导航
+
+render 和 write 与真实流程一样逐个端点交替执行，分别累计耗时，
+因此内存不会随渲染结果累积。峰值内存使用 tracemalloc 在单独的一轮中测量
+（每个阶段相对阶段开始时的增量峰值），不影响计时结果。
+
+结果以 JSON 输出，可以用 --compare 与之前保存的结果对比。
+
+使用方法:
+    python benchmarks/bench_pipeline.py                                # 1k 和 10k 端点
+    python benchmarks/bench_pipeline.py --sizes 1000 10000 100000 -o results.json
+    python benchmarks/bench_pipeline.py --compare baseline.json       # 与之前的结果对比
+"""
+
+import argparse
+import gc
+import json
+import logging
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(BENCH_DIR))
+
+import generate_docs  # noqa: E402
+from synthetic_apifox import BODY_MODES, generate_collection  # noqa: E402
+
+PHASES = ('load', 'extract', 'render', 'write', 'update_mint_json')
+
+class PhaseRecorder:
+    """累计每个阶段的耗时，可选地记录 tracemalloc 增量峰值"""
+    def __init__(self, trace_memory: bool):
+        self.trace_memory = trace_memory
+        self.seconds = {phase: 0.0 for phase in PHASES}
+        self.peak_bytes = {phase: 0 for phase in PHASES}
+        self._phase = None
+        self._start = 0.0
+        self._base = 0
+
+    def start(self, phase: str):
+        self._phase = phase
+        if self.trace_memory:
+            self._base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        self._start = time.perf_counter()
+
+    def stop(self):
+        self.seconds[self._phase] += time.perf_counter() - self._start
+        if self.trace_memory:
+            peak = tracemalloc.get_traced_memory()[1] - self._base
+            self.peak_bytes[self._phase] = max(self.peak_bytes[self._phase], peak)
+
+def run_pipeline(input_path: Path, work_dir: Path, trace_memory: bool) -> PhaseRecorder:
+    """按阶段运行一次完整的生成流程"""
+    recorder = PhaseRecorder(trace_memory)
+    output_base = work_dir / 'docs' / 'api'
+    mint_json_path = work_dir / 'mint.json'
+    work_dir.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(REPO_ROOT / 'mint.json', mint_json_path)
+
+    recorder.start('load')
+    with open(input_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    recorder.stop()
+
+    recorder.start('extract')
+    navigation_tree: Dict[str, generate_docs.NavigationNode] = {}
+    planner = generate_docs.OutputPlanner(output_base)
+    jobs = []
+    for folder_path, item in generate_docs.iter_collection_items(
+            data.get('item', []), [], on_folder=lambda path: generate_docs.register_folder(path, navigation_tree)):
+        job = generate_docs.plan_api_item(item, folder_path, planner)
+        if job is not None:
+            jobs.append(job)
+            generate_docs.add_api_to_navigation(navigation_tree, job.folder_path, job.api_name, job.relative_path)
+    recorder.stop()
+
+    context = generate_docs.RenderContext(base_url='https://gptproto.com')
+    writer = generate_docs.OutputWriter()
+    for job in jobs:
+        recorder.start('render')
+        content = generate_docs.generate_api_doc(job.item, '/'.join(job.folder_path), context)
+        recorder.stop()
+
+        recorder.start('write')
+        writer.write_text(job.filepath, content)
+        recorder.stop()
+
+    recorder.start('update_mint_json')
+    generate_docs.update_mint_json(navigation_tree, mint_json_path, writer)
+    recorder.stop()
+
+    return recorder
+
+def git_revision() -> Optional[str]:
+    """当前 git 提交（不在 git 仓库中时返回 None）"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                              check=True, capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def benchmark(sizes: List[int], depth: int, fanout: int, body_modes: List[str], seed: int,
+              memory: bool) -> Dict:
+    """运行所有规模的基准测试并返回结果字典"""
+    results = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory(prefix='bench_pipeline_') as tmp:
+            tmp_path = Path(tmp)
+            input_path = tmp_path / 'apifox.json'
+            collection = generate_collection(size, depth, fanout, body_modes, seed)
+            with open(input_path, 'w', encoding='utf-8') as f:
+                json.dump(collection, f, ensure_ascii=False, indent=2)
+            del collection
+            input_bytes = input_path.stat().st_size
+
+            # 计时轮不做内存插桩，tracemalloc 会显著拖慢分配
+            gc.collect()
+            timing = run_pipeline(input_path, tmp_path / 'timing', trace_memory=False)
+
+            phases = {phase: {'seconds': round(timing.seconds[phase], 6)} for phase in PHASES}
+            if memory:
+                gc.collect()
+                tracemalloc.start()
+                try:
+                    traced = run_pipeline(input_path, tmp_path / 'memory', trace_memory=True)
+                finally:
+                    tracemalloc.stop()
+                for phase in PHASES:
+                    phases[phase]['peak_bytes'] = traced.peak_bytes[phase]
+
+        total = sum(timing.seconds.values())
+        results.append({
+            'endpoints': size,
+            'depth': depth,
+            'fanout': fanout,
+            'body_modes': body_modes,
+            'seed': seed,
+            'input_bytes': input_bytes,
+            'total_seconds': round(total, 6),
+            'phases': phases
+        })
+        print(f"{size:>8} endpoints: {total:.3f}s  " +
+              '  '.join(f"{phase}={timing.seconds[phase]:.3f}s" for phase in PHASES), file=sys.stderr)
+
+    return {
+        'meta': {
+            'generated_at': datetime.now().isoformat(),
+            'generator_version': generate_docs.GENERATOR_VERSION,
+            'git_revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform()
+        },
+        'results': results
+    }
+
+def compare(current: Dict, baseline: Dict):
+    """逐阶段打印当前结果相对基线的耗时比例（< 1 表示更快）"""
+    def key(result):
+        return (result['endpoints'], result['depth'], result['fanout'], tuple(result['body_modes']))
+
+    baseline_results = {key(result): result for result in baseline.get('results', [])}
+    print(f"{'endpoints':>10}  {'phase':<18}{'baseline (s)':>13}{'current (s)':>13}{'ratio':>8}")
+    for result in current['results']:
+        base = baseline_results.get(key(result))
+        if base is None:
+            print(f"{result['endpoints']:>10}  (no matching baseline result)")
+            continue
+        for phase in PHASES:
+            before = base['phases'][phase]['seconds']
+            after = result['phases'][phase]['seconds']
+            ratio = after / before if before else float('nan')
+            print(f"{result['endpoints']:>10}  {phase:<18}{before:>13.4f}{after:>13.4f}{ratio:>8.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark generate_docs.py phases on synthetic Apifox exports')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000],
+                        help='Endpoint counts (default: 1000 10000; add 100000 for the large run)')
+    parser.add_argument('--depth', type=int, default=3, help='Folder depth (default: 3)')
+    parser.add_argument('--fanout', type=int, default=8, help='Sub-folders per folder (default: 8)')
+    parser.add_argument('--body-modes', nargs='+', default=list(BODY_MODES), choices=BODY_MODES,
+                        help='Request body modes to mix (default: raw formdata none)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for the synthetic export (default: 0)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc memory pass')
+    parser.add_argument('-o', '--output', help='Write JSON results to this file (default: stdout)')
+    parser.add_argument('--compare', help='Previous JSON results to compare against')
+    args = parser.parse_args()
+
+    # 合成数据中不含解析失败的示例，但仍然屏蔽生成器的日志输出
+    generate_docs.logger.setLevel(logging.ERROR)
+
+    results = benchmark(args.sizes, args.depth, args.fanout, args.body_modes, args.seed, not args.no_memory)
+
+    text = json.dumps(results, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + '\n', encoding='utf-8')
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare(results, json.load(f))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+页面渲染基准测试
+
+对输入文件中的每个端点调用 generate_api_doc，测量渲染吞吐量。
+使用 --compare-rev 时会从 git 中取出指定版本的 generate_docs.py 作为对照，
+并校验两者输出逐字节一致。
+
+使用方法:
+    python benchmarks/bench_render.py                              # 使用 ./Apifox.json
+    python benchmarks/bench_render.py --compare-rev HEAD~1         # 与上一个提交对比
+    python benchmarks/bench_render.py -i big.json --repeat 10      # 自定义输入和轮数
+"""
+
+import argparse
+import importlib.util
+import gc
+import json
+import logging
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import generate_docs  # noqa: E402
+
+def load_revision(rev: str):
+    """从 git 中加载指定版本的 generate_docs.py 作为独立模块"""
+    source = subprocess.run(
+        ['git', 'show', f'{rev}:generate_docs.py'],
+        cwd=REPO_ROOT, check=True, capture_output=True, text=True
+    ).stdout
+    tmp_dir = Path(tempfile.mkdtemp(prefix='bench_render_'))
+    module_path = tmp_dir / 'generate_docs_ref.py'
+    module_path.write_text(source, encoding='utf-8')
+    spec = importlib.util.spec_from_file_location('generate_docs_ref', module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def time_render(renderers: List[Callable[[Dict, str], str]], endpoints: List[Tuple[List[str], Dict]],
+                repeat: int) -> List[float]:
+    """交替运行各实现，返回每个实现多轮中最快一轮渲染所有端点的耗时（秒）
+
+    交替执行可以让机器负载的波动均匀地影响各个实现。
+    """
+    best = [float('inf')] * len(renderers)
+    for _ in range(repeat):
+        for index, render in enumerate(renderers):
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                for folder_path, item in endpoints:
+                    render(item, '/'.join(folder_path))
+                best[index] = min(best[index], time.perf_counter() - start)
+            finally:
+                gc.enable()
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark generate_api_doc rendering throughput')
+    parser.add_argument('-i', '--input', default=str(REPO_ROOT / 'Apifox.json'), help='Apifox JSON file')
+    parser.add_argument('--repeat', type=int, default=20, help='Rounds per implementation, best is reported (default: 20)')
+    parser.add_argument('--compare-rev', help='Git revision whose generate_docs.py is used as the reference')
+    args = parser.parse_args()
+
+    # 示例 JSON 解析失败的警告与渲染耗时无关
+    logging.getLogger().setLevel(logging.ERROR)
+    generate_docs.logger.setLevel(logging.ERROR)
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    endpoints = list(generate_docs.iter_collection_items(data.get('item', []), []))
+
+    print(f"endpoints: {len(endpoints)}")
+
+    if not args.compare_rev:
+        current, = time_render([generate_docs.generate_api_doc], endpoints, args.repeat)
+        print(f"current:   {current:.4f}s  ({len(endpoints) / current:,.0f} pages/s)")
+        return
+
+    reference = load_revision(args.compare_rev)
+    reference.logger.setLevel(logging.ERROR)
+    for folder_path, item in endpoints:
+        if reference.generate_api_doc(item, '/'.join(folder_path)) != \
+                generate_docs.generate_api_doc(item, '/'.join(folder_path)):
+            print(f"output differs from {args.compare_rev} for: {'/'.join(folder_path + [item.get('name', '')])}")
+            sys.exit(1)
+
+    current, baseline = time_render(
+        [generate_docs.generate_api_doc, reference.generate_api_doc], endpoints, args.repeat
+    )
+    print(f"current:   {current:.4f}s  ({len(endpoints) / current:,.0f} pages/s)")
+    print(f"{args.compare_rev}: {baseline:.4f}s  ({len(endpoints) / baseline:,.0f} pages/s)")
+    print(f"speedup:   {baseline / current:.2f}x (output identical)")
+
+if __name__ == '__main__':
+    main()
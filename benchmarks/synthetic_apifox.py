@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+合成 Apifox 导出文件生成器
+
+生成与真实 Apifox.json 结构一致的集合（info / item / variable，目录和 API 条目
+带有 description、event、auth、request、response 等字段），用于基准测试。
+相同参数和随机种子总是生成完全相同的文件。
+
+使用方法:
+    python benchmarks/synthetic_apifox.py -n 10000 -o /tmp/synthetic.json
+    python benchmarks/synthetic_apifox.py -n 1000 --depth 4 --fanout 6 --body-modes raw none
+"""
+
+import argparse
+import json
+import math
+import random
+from typing import Any, Dict, List, Optional, Sequence
+
+# 真实导出中的顶级分类，合成数据按顺序循环使用
+CATEGORY_NAMES = [
+    'OpenAI', 'Gemini', 'Grok', 'Claude', 'Kling', 'Runway', 'Suno', 'Midjourney',
+    'Ideogram', 'Flux', 'Doubao', 'higgsfield', 'qwen', 'MiniMax', 'Gprproto', 'DeepSeek'
+]
+
+FORMAT_NAMES = ['OpenAI Format', 'Official Format', 'GPTProto Format']
+
+ENDPOINT_KINDS = [
+    ('Text to Text', ['v1', 'chat', 'completions']),
+    ('Image to Text', ['v1', 'chat', 'completions']),
+    ('Text to Image', ['v1', 'images', 'generations']),
+    ('Image to Image', ['v1', 'images', 'edits']),
+    ('Text to Video', ['api', 'v3', 'video', 'submit']),
+    ('Query Task', ['api', 'v3', 'video', 'query']),
+]
+
+BODY_MODES = ('raw', 'formdata', 'none')
+
+def _folder_name(level: int, index: int) -> str:
+    """第 level 层第 index 个目录的名称"""
+    if level == 0:
+        name = CATEGORY_NAMES[index % len(CATEGORY_NAMES)]
+        return name if index < len(CATEGORY_NAMES) else f'{name} {index // len(CATEGORY_NAMES)}'
+    if level == 1:
+        return f'model-{index}'
+    if level == 2:
+        return FORMAT_NAMES[index % len(FORMAT_NAMES)] + ('' if index < len(FORMAT_NAMES) else f' {index}')
+    return f'Group {level}-{index}'
+
+def _raw_body(rng: random.Random, model: str) -> str:
+    """生成 raw 模式的 JSON 请求体文本"""
+    body: Dict[str, Any] = {'model': model}
+    if rng.random() < 0.6:
+        body['messages'] = [{'role': 'user', 'content': f'Prompt {rng.randrange(10_000)}'}]
+    else:
+        body['prompt'] = f'Prompt {rng.randrange(10_000)}'
+    if rng.random() < 0.5:
+        body['temperature'] = round(rng.random(), 2)
+    if rng.random() < 0.4:
+        body['max_tokens'] = rng.choice([256, 1024, 4096])
+    if rng.random() < 0.3:
+        body['stream'] = rng.random() < 0.5
+    if rng.random() < 0.2:
+        body['size'] = rng.choice(['1024x1024', '1792x1024'])
+    return json.dumps(body, ensure_ascii=False, indent=2)
+
+def _formdata_body(rng: random.Random, model: str) -> List[Dict]:
+    """生成 formdata 模式的字段列表"""
+    fields = [
+        {'key': 'image', 'type': 'file', 'disabled': False},
+        {'key': 'prompt', 'type': 'text', 'disabled': False},
+        {'key': 'model', 'value': model, 'type': 'text', 'disabled': False},
+    ]
+    if rng.random() < 0.5:
+        fields.append({'key': 'n', 'value': str(rng.randrange(1, 5)), 'type': 'text', 'disabled': False})
+    return fields
+
+def _endpoint(rng: random.Random, index: int, model: str, body_mode: str) -> Dict:
+    """生成一个 API 条目"""
+    kind, path = ENDPOINT_KINDS[index % len(ENDPOINT_KINDS)]
+    request: Dict[str, Any] = {
+        'auth': {},
+        'method': 'GET' if body_mode == 'none' else 'POST',
+        'header': [],
+        'url': {
+            'raw': '{{baseUrl}}/' + '/'.join(path),
+            'path': list(path),
+            'host': ['{{baseUrl}}'],
+            'query': [],
+            'variable': []
+        }
+    }
+    if body_mode == 'raw':
+        request['body'] = {'mode': 'raw', 'raw': _raw_body(rng, model), 'options': {'raw': {'language': 'json'}}}
+    elif body_mode == 'formdata':
+        request['body'] = {'mode': 'formdata', 'formdata': _formdata_body(rng, model)}
+
+    return {
+        'name': f'{kind} {index}',
+        'description': f'Synthetic endpoint {index} for {model}.\n\n',
+        'event': [],
+        'auth': {},
+        'request': request,
+        'response': [],
+        'protocolProfileBehavior': {'strictSSL': False, 'followRedirects': True}
+    }
+
+def generate_collection(
+    endpoints: int,
+    depth: int = 3,
+    fanout: int = 8,
+    body_modes: Sequence[str] = BODY_MODES,
+    seed: int = 0,
+    mode_weights: Optional[Sequence[float]] = None
+) -> Dict:
+    """生成合成的 Apifox 集合
+
+    目录是深度为 depth、每层 fanout 个子目录的完全树，API 按顺序填充到叶子目录；
+    端点数超过叶子目录数时每个叶子目录包含多个 API。
+
+    Args:
+        endpoints: API 数量
+        depth: 目录层数（至少 1）
+        fanout: 每个目录的子目录数
+        body_modes: 请求体模式（raw / formdata / none）
+        seed: 随机种子
+        mode_weights: 各请求体模式的权重，默认与真实导出的比例接近
+
+    Returns:
+        Apifox 集合字典
+    """
+    depth = max(1, depth)
+    fanout = max(1, fanout)
+    for mode in body_modes:
+        if mode not in BODY_MODES:
+            raise ValueError(f"Unknown body mode: {mode}")
+    if mode_weights is None:
+        default_weights = {'raw': 0.74, 'formdata': 0.08, 'none': 0.18}
+        mode_weights = [default_weights[mode] for mode in body_modes]
+
+    rng = random.Random(seed)
+    leaf_count = min(fanout ** depth, max(1, endpoints))
+    per_leaf = math.ceil(endpoints / leaf_count) if endpoints else 0
+
+    root: Dict[str, Any] = {
+        'info': {
+            'name': 'Synthetic collection',
+            'description': f'{endpoints} endpoints, depth {depth}, fanout {fanout}',
+            'schema': 'https://schema.getpostman.com/json/collection/v2.1.0/collection.json'
+        },
+        'item': [],
+        'variable': []
+    }
+
+    created = 0
+    for leaf in range(leaf_count):
+        if created >= endpoints:
+            break
+
+        # 按叶子编号确定每一层的目录，复用已创建的目录
+        items = root['item']
+        model = 'model'
+        remainder = leaf
+        digits = []
+        for _ in range(depth):
+            digits.append(remainder % fanout)
+            remainder //= fanout
+        digits.reverse()
+        for level, index in enumerate(digits):
+            name = _folder_name(level, index)
+            if level == 1:
+                model = name
+            if items and items[-1]['name'] == name:
+                folder = items[-1]
+            else:
+                folder = {'name': name, 'description': '', 'item': [], 'event': [], 'auth': {}}
+                items.append(folder)
+            items = folder['item']
+
+        for _ in range(min(per_leaf, endpoints - created)):
+            body_mode = rng.choices(list(body_modes), weights=mode_weights)[0]
+            items.append(_endpoint(rng, created, model, body_mode))
+            created += 1
+
+    return root
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a deterministic synthetic Apifox export')
+    parser.add_argument('-n', '--endpoints', type=int, default=1000, help='Number of endpoints (default: 1000)')
+    parser.add_argument('--depth', type=int, default=3, help='Folder depth (default: 3)')
+    parser.add_argument('--fanout', type=int, default=8, help='Sub-folders per folder (default: 8)')
+    parser.add_argument('--body-modes', nargs='+', default=list(BODY_MODES), choices=BODY_MODES,
+                        help='Request body modes to mix (default: raw formdata none)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser.add_argument('-o', '--output', default='synthetic_apifox.json', help='Output file')
+    args = parser.parse_args()
+
+    collection = generate_collection(args.endpoints, args.depth, args.fanout, args.body_modes, args.seed)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(collection, f, ensure_ascii=False, indent=2)
+    print(f"Wrote {args.endpoints} endpoints to {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -11,28 +11,63 @@ GPTProto API 文档生成器
 - 智能推断参数类型和描述
 - Request Body 参数自动显示默认值
 - GPTProto 标准错误响应格式
+- 基于内容哈希清单的增量生成（仅重写新增或变更的端点）
+- 流式解析大型 Apifox 导出文件，峰值内存取决于最大的单个端点
+- 多进程并行渲染、写入线程池与渲染重叠，导航顺序和输出与串行运行逐字节一致
+- 原子写入输出文件，内容未变化时跳过写入以保持 mtime 不变
+- 监视模式：输入文件变化时只重新生成变化的端点和导航
+- 根据清单自动清理已删除或重命名端点遗留的文档文件和空目录
+- 缓存已解析的输入文件，输入未变化时跳过 JSON 解析
+- 分阶段耗时、渲染/写入耗时百分位数、最慢端点和峰值内存记录在 _summary.json 中
 - 详细的日志记录和错误处理
 
 使用方法:
     python generate_docs.py                              # 使用默认配置
     python generate_docs.py -i input.json -o ./docs     # 自定义路径
     python generate_docs.py -v                          # 详细输出
+    python generate_docs.py --force                     # 忽略清单，全量重新生成
+    python generate_docs.py --stream                    # 流式解析，内存占用与单个端点相关
+    python generate_docs.py --jobs 8                    # 多进程并行渲染，输出与串行一致
+    python generate_docs.py --watch                     # 监视 Apifox.json，变化时只重新生成受影响的端点
+    python generate_docs.py --profile build.prof        # 保存 cProfile 统计，阶段耗时写入 _summary.json
     python generate_docs.py --help                      # 查看所有选项
 
 作者: Generated with Claude Code
-版本: 3.1
+版本: 3.2
 """
 
 import json
+import cProfile
+import hashlib
+import heapq
+import math
 import os
+import pickle
 import re
+import string
+import struct
 import sys
 import logging
 import argparse
+import bisect
+import tempfile
+import threading
+import time
+import zlib
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterator, Iterable, Callable, Deque
 from datetime import datetime
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
+from itertools import chain
+from types import MappingProxyType
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 
 # 配置日志
 logging.basicConfig(
@@ -42,6 +77,36 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 生成器版本，写入清单；版本变化时所有端点都会重新生成
+GENERATOR_VERSION = '3.2'
+
+# 页面渲染逻辑的修订号：模板文本的变化由 page_template_fingerprint 自动发现，
+# 只有渲染代码本身（而非模板）的变化改变了已有页面的输出时才需要递增
+TEMPLATE_REVISION = 2
+
+# 增量生成清单文件名（与 _summary.json 位于同一目录）
+MANIFEST_FILENAME = '_manifest.json'
+
+# 默认写入线程数（写入与渲染重叠进行）
+DEFAULT_WRITE_THREADS = 4
+
+# 已解析输入的缓存目录
+DEFAULT_CACHE_DIR = '.cache/generate_docs'
+
+# 跨运行的请求示例缓存默认的大小上限（MiB）
+DEFAULT_SAMPLE_CACHE_MB = 64
+
+# --format pack 归档的文件头/尾部标识、格式版本和尾部结构（索引偏移、索引长度、标识）
+PACK_MAGIC = b'GPDPACK\x01'
+PACK_FORMAT_VERSION = 2
+_PACK_TRAILER = struct.Struct('<QQ8s')
+
+# 共享请求示例 snippet 的目录（相对于 mint.json 所在的文档根目录）
+SNIPPETS_DIRNAME = 'snippets/api'
+
+# 客户端搜索索引文件名（与 _summary.json 位于同一目录）
+SEARCH_INDEX_FILENAME = '_search_index.json'
+
 # 全局配置
 class Config:
     """全局配置类"""
@@ -51,6 +116,434 @@ class Config:
     def set_base_url(cls, url: str):
         cls.base_url = url
 
+class RenderContext:
+    """渲染上下文
+
+    显式传入 generate_api_doc 的渲染参数，不依赖进程级的 Config，
+    因此可以安全地发送到多进程渲染的工作进程中。
+    """
+    def __init__(self, base_url: str, shared_snippets: bool = False, search_index: bool = False,
+                 production_samples: bool = False):
+        self.base_url = base_url
+        # 为 True 时请求示例输出为按内容寻址的共享 snippet，页面中只保留引用
+        self.shared_snippets = shared_snippets
+        # 为 True 时渲染的同时提取搜索索引记录（方法、路径和参数名）
+        self.search_index = search_index
+        # 为 True 时非流式端点额外输出生产环境客户端示例
+        self.production_samples = production_samples
+
+    @classmethod
+    def from_config(cls) -> 'RenderContext':
+        """使用当前全局配置创建渲染上下文"""
+        return cls(base_url=Config.base_url)
+
+# 当前进程的 umask，用于让临时文件的权限与普通 open() 创建的文件一致
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+class OutputWriter:
+    """文件输出层
+
+    先写入同目录下的临时文件再原子重命名，中途崩溃不会留下截断的文件；
+    磁盘上的字节与新内容一致时跳过写入，保持 mtime 不变。
+    可以被多个写入线程同时使用（不同线程写入不同的文件）。
+    """
+    def __init__(self):
+        self.written = 0
+        self.unchanged = 0
+        self.bytes_written = 0
+        self._lock = threading.Lock()
+
+    def write_text(self, path: Path, content: str) -> bool:
+        """写入文本文件（UTF-8）
+
+        Args:
+            path: 目标文件路径
+            content: 文件内容
+
+        Returns:
+            是否实际写入了文件
+        """
+        data = content.encode('utf-8')
+
+        try:
+            if path.stat().st_size == len(data) and path.read_bytes() == data:
+                with self._lock:
+                    self.unchanged += 1
+                return False
+            mode = path.stat().st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+
+        fd, tmp_path = tempfile.mkstemp(prefix=f'.{path.name}.', suffix='.tmp', dir=path.parent)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        with self._lock:
+            self.written += 1
+            self.bytes_written += len(data)
+        return True
+
+    def write_json(self, path: Path, data: Any) -> bool:
+        """以与 json.dump(indent=2, ensure_ascii=False) 相同的格式写入 JSON 文件"""
+        return self.write_text(path, json.dumps(data, ensure_ascii=False, indent=2))
+
+    def ensure_dir(self, path: Path):
+        """创建输出目录（包括上级目录）"""
+        path.mkdir(parents=True, exist_ok=True)
+
+class CheckWriter(OutputWriter):
+    """--check 使用的输出层：只与磁盘上的文件比较，不写入也不创建目录
+
+    记录所有目标文件，以及内容不一致或缺失的文件；
+    written 和 bytes_written 表示实际运行时将会写入的文件数和字节数。
+    """
+    def __init__(self):
+        super().__init__()
+        self.targets: set = set()
+        self.differences: Dict[Path, str] = {}
+
+    def write_text(self, path: Path, content: str) -> bool:
+        """比较文件内容；与磁盘不一致时记录为 changed，文件不存在时记录为 missing"""
+        data = content.encode('utf-8')
+        try:
+            same = path.stat().st_size == len(data) and path.read_bytes() == data
+            status = 'changed'
+        except FileNotFoundError:
+            same = False
+            status = 'missing'
+
+        with self._lock:
+            self.targets.add(path)
+            if same:
+                self.unchanged += 1
+                return False
+            self.differences[path] = status
+            self.written += 1
+            self.bytes_written += len(data)
+        return True
+
+    def ensure_dir(self, path: Path):
+        """不创建目录"""
+
+class PackWriter(OutputWriter):
+    """--format pack 使用的输出层：所有文件追加到单个带索引的归档中，不创建目录
+
+    归档布局：PACK_MAGIC、依次追加的文件内容、JSON 索引（路径 → [偏移, 长度, CRC-32]，
+    以及 mint.json 的 API 导航分组），最后是定长的尾部（索引偏移、索引长度、PACK_MAGIC）。
+    内容先追加到归档所在目录的临时文件中，finish 时写入索引并原子替换归档，
+    中途失败不会留下不完整的归档。路径使用相对于文档根目录（mint.json 所在目录）的 POSIX 路径，
+    同一路径写入多次时以最后一次为准。
+    """
+    def __init__(self, pack_path: Path, root: Path):
+        super().__init__()
+        self.pack_path = pack_path
+        self.root = os.path.abspath(root)
+        self.entries: Dict[str, Tuple[int, int, int]] = {}
+        self.navigation: Optional[List[Dict]] = None
+        self._file = None
+        self._tmp_path: Optional[str] = None
+        self._offset = 0
+
+    def key(self, path: Path) -> str:
+        """文件在归档中的路径
+
+        Raises:
+            ValueError: 文件不在文档根目录下
+        """
+        relative = os.path.relpath(os.path.abspath(path), self.root)
+        if relative == os.curdir or relative.split(os.sep)[0] == os.pardir:
+            raise ValueError(f"{path} is outside the pack root {self.root}")
+        return relative.replace(os.sep, '/')
+
+    def write_text(self, path: Path, content: str) -> bool:
+        """把文件内容追加到归档（总是写入）"""
+        data = content.encode('utf-8')
+        key = self.key(path)
+        with self._lock:
+            if self._file is None:
+                self._open()
+            self._file.write(data)
+            self.entries[key] = (self._offset, len(data), zlib.crc32(data))
+            self._offset += len(data)
+            self.written += 1
+            self.bytes_written += len(data)
+        return True
+
+    def _open(self):
+        """在归档所在目录创建临时文件并写入文件头"""
+        self.pack_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(prefix=f'.{self.pack_path.name}.', suffix='.tmp',
+                                              dir=self.pack_path.parent)
+        self._file = os.fdopen(fd, 'wb')
+        self._file.write(PACK_MAGIC)
+        self._offset = len(PACK_MAGIC)
+
+    def ensure_dir(self, path: Path):
+        """不创建目录"""
+
+    def finish(self) -> int:
+        """写入索引和尾部并原子替换归档
+
+        Returns:
+            归档的字节数
+        """
+        if self._file is None:
+            self._open()
+        index = json.dumps({
+            'version': PACK_FORMAT_VERSION,
+            'entries': {key: list(entry) for key, entry in self.entries.items()},
+            'navigation': self.navigation
+        }, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        try:
+            self._file.write(index)
+            self._file.write(_PACK_TRAILER.pack(self._offset, len(index), PACK_MAGIC))
+            self._file.close()
+            os.chmod(self._tmp_path, 0o666 & ~_UMASK)
+            os.replace(self._tmp_path, self.pack_path)
+        except BaseException:
+            self.abort()
+            raise
+        self._file = None
+        self._tmp_path = None
+        return self._offset + len(index) + _PACK_TRAILER.size
+
+    def abort(self):
+        """丢弃未完成的归档（临时文件）"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._tmp_path is not None:
+            try:
+                os.unlink(self._tmp_path)
+            except OSError:
+                pass
+            self._tmp_path = None
+
+class PackReader:
+    """读取 --format pack 生成的归档
+
+    打开时只读取尾部和索引，按路径读取文件是一次字典查找加一次定位读取（O(1)），
+    不随归档中的文件数增长。可以被多个线程同时使用。
+    打开时校验尾部、索引和每个文件的偏移范围，读取时校验文件内容的 CRC-32，
+    截断或损坏的归档抛出 ValueError。
+    """
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._lock = threading.Lock()
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size < len(PACK_MAGIC) + _PACK_TRAILER.size or self._file.read(len(PACK_MAGIC)) != PACK_MAGIC:
+                raise ValueError(f"{path} is not a documentation pack")
+            data_end = size - _PACK_TRAILER.size
+            self._file.seek(data_end)
+            index_offset, index_length, magic = _PACK_TRAILER.unpack(self._file.read(_PACK_TRAILER.size))
+            if magic != PACK_MAGIC:
+                raise ValueError(f"{path} is truncated or not a documentation pack")
+            # 索引紧接在尾部之前
+            if index_offset < len(PACK_MAGIC) or index_offset + index_length != data_end:
+                raise ValueError(f"Invalid index offset in pack {path}")
+            self._file.seek(index_offset)
+            index = json.loads(self._file.read(index_length).decode('utf-8'))
+            if not isinstance(index, dict):
+                raise ValueError(f"Invalid index in pack {path}")
+            if index.get('version') != PACK_FORMAT_VERSION:
+                raise ValueError(f"Unsupported pack format version in {path}: {index.get('version')}")
+            self.entries = self._parse_entries(index.get('entries'), index_offset)
+            self.navigation: Optional[List[Dict]] = index.get('navigation')
+            if self.navigation is not None and not isinstance(self.navigation, list):
+                raise ValueError(f"Invalid navigation in pack {path}")
+        except BaseException:
+            self._file.close()
+            raise
+
+    def _parse_entries(self, entries: Any, data_end: int) -> Dict[str, Tuple[int, int, int]]:
+        """校验索引中的条目，每个文件都必须位于文件头和索引之间"""
+        if not isinstance(entries, dict):
+            raise ValueError(f"Invalid index in pack {self.path}")
+        parsed: Dict[str, Tuple[int, int, int]] = {}
+        for key, entry in entries.items():
+            if not (isinstance(entry, list) and len(entry) == 3 and all(type(value) is int for value in entry)):
+                raise ValueError(f"Invalid index entry for {key} in pack {self.path}")
+            offset, length, crc = entry
+            if offset < len(PACK_MAGIC) or length < 0 or offset + length > data_end:
+                raise ValueError(f"Invalid offset for {key} in pack {self.path}")
+            parsed[key] = (offset, length, crc)
+        return parsed
+
+    def __enter__(self) -> 'PackReader':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    def __contains__(self, path: str) -> bool:
+        return path in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def paths(self) -> Iterator[str]:
+        """按写入顺序产出归档中的所有路径"""
+        return iter(self.entries)
+
+    def read_bytes(self, path: str) -> bytes:
+        """读取文件内容
+
+        Raises:
+            KeyError: 归档中没有该路径
+            ValueError: 文件内容与索引中的 CRC-32 不一致
+        """
+        offset, length, crc = self.entries[path]
+        with self._lock:
+            self._file.seek(offset)
+            data = self._file.read(length)
+        if len(data) != length or zlib.crc32(data) != crc:
+            raise ValueError(f"Corrupted file {path} in pack {self.path}")
+        return data
+
+    def read_text(self, path: str) -> str:
+        """以 UTF-8 读取文件内容
+
+        Raises:
+            ValueError: 文件内容损坏或不是合法的 UTF-8
+        """
+        return self.read_bytes(path).decode('utf-8')
+
+    def page(self, relative_path: str) -> Optional[str]:
+        """按 mint.json 中的页面路径（如 docs/api/openai/...，不含扩展名）读取 MDX 页面，不存在时返回 None"""
+        key = relative_path + '.mdx'
+        return self.read_text(key) if key in self.entries else None
+
+class SnippetStore:
+    """共享请求示例 snippet 的输出
+
+    snippet 按内容哈希命名，同一次运行中每个 snippet 只写入一次；
+    同时统计与把代码块内联到每个页面相比节省的字节数。
+    """
+    def __init__(self, directory: Path, writer: Optional[OutputWriter] = None):
+        self.directory = directory
+        self.writer = writer or OutputWriter()
+        self.written: set = set()
+        self.references = 0
+        self.inline_bytes = 0
+        self.reference_bytes = 0
+        self.snippet_bytes = 0
+        self._lock = threading.Lock()
+
+    def add(self, snippets: Dict[str, str]):
+        """记录一个页面引用的 snippet，首次出现的 snippet 写入文件（可在写入线程中调用）"""
+        for name, block in snippets.items():
+            size = len(block.encode('utf-8'))
+            with self._lock:
+                self.references += 1
+                self.inline_bytes += size
+                self.reference_bytes += len(snippet_reference(name).encode('utf-8'))
+                if name in self.written:
+                    continue
+                if not self.written:
+                    self.writer.ensure_dir(self.directory)
+                self.written.add(name)
+                self.snippet_bytes += size
+            self.writer.write_text(self.directory / f"{name}.mdx", block)
+
+    def stats(self) -> Dict[str, int]:
+        """输出到 _summary.json 的 snippets 字段"""
+        return {
+            'files': len(self.written),
+            'references': self.references,
+            'bytes_saved': self.inline_bytes - self.reference_bytes - self.snippet_bytes
+        }
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """最近秩法百分位数（sorted_values 已排序且非空）"""
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+def peak_memory_bytes() -> Optional[int]:
+    """当前进程（及已结束的子进程）的峰值常驻内存，平台不支持时返回 None
+
+    ru_maxrss 在 Linux 上以 KB 为单位，在 macOS 上以字节为单位。
+    """
+    if resource is None:
+        return None
+    scale = 1 if sys.platform == 'darwin' else 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return max(own, children) * scale
+
+class BuildMetrics:
+    """一次生成的耗时统计
+
+    记录各阶段的墙钟时间，以及每个端点的渲染和写入耗时，
+    用于在 _summary.json 中输出百分位数和最慢的端点。
+    """
+    def __init__(self, slowest: int = 10):
+        self.slowest = slowest
+        self.phases: Dict[str, float] = {}
+        self.endpoints: List[Tuple[str, float, float]] = []
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str):
+        """累计 with 块的耗时到指定阶段"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def record_endpoint(self, key: str, render_seconds: float, write_seconds: float):
+        """记录单个端点的渲染和写入耗时"""
+        self.endpoints.append((key, render_seconds, write_seconds))
+
+    @staticmethod
+    def _distribution(values: List[float]) -> Dict[str, Any]:
+        """耗时分布：总和、p50/p90/p99 和最大值（秒）"""
+        if not values:
+            return {'count': 0}
+        values = sorted(values)
+        return {
+            'count': len(values),
+            'total': round(sum(values), 6),
+            'p50': round(_percentile(values, 0.50), 6),
+            'p90': round(_percentile(values, 0.90), 6),
+            'p99': round(_percentile(values, 0.99), 6),
+            'max': round(values[-1], 6)
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """输出到 _summary.json 的 timing 字段"""
+        slowest = heapq.nlargest(self.slowest, self.endpoints, key=lambda entry: entry[1] + entry[2])
+        return {
+            'total_seconds': round(time.perf_counter() - self._start, 6),
+            'phases': {name: round(seconds, 6) for name, seconds in self.phases.items()},
+            'render': self._distribution([entry[1] for entry in self.endpoints]),
+            'write': self._distribution([entry[2] for entry in self.endpoints]),
+            'slowest_endpoints': [
+                {'endpoint': key, 'render_seconds': round(render, 6), 'write_seconds': round(write, 6)}
+                for key, render, write in slowest
+            ]
+        }
+
+# 文件名和目录名清理使用的正则（预编译）
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s-]')
+_SEPARATORS_RE = re.compile(r'[-\s]+')
+
+@lru_cache(maxsize=None)
 def sanitize_filename(name: str) -> str:
     """将 API 名称转换为安全的文件名
 
@@ -64,12 +557,13 @@ def sanitize_filename(name: str) -> str:
         return 'unnamed'
 
     # 移除特殊字符
-    name = re.sub(r'[^\w\s-]', '', name.lower())
+    name = _SPECIAL_CHARS_RE.sub('', name.lower())
     # 将空格和多个连字符替换为单个连字符
-    name = re.sub(r'[-\s]+', '-', name)
+    name = _SEPARATORS_RE.sub('-', name)
     # 移除首尾的连字符
     return name.strip('-') or 'unnamed'
 
+@lru_cache(maxsize=None)
 def sanitize_folder_name(name: str) -> str:
     """将文件夹名称转换为安全的路径名
 
@@ -83,9 +577,9 @@ def sanitize_folder_name(name: str) -> str:
         return 'other'
 
     # 移除特殊字符，保留中文字符
-    name = re.sub(r'[^\w\s-]', '', name.lower())
+    name = _SPECIAL_CHARS_RE.sub('', name.lower())
     # 将空格和多个连字符替换为单个连字符
-    name = re.sub(r'[-\s]+', '-', name)
+    name = _SEPARATORS_RE.sub('-', name)
     # 移除首尾的连字符
     return name.strip('-') or 'other'
 
@@ -99,6 +593,24 @@ def format_json(obj: Any, indent: int = 2) -> str:
         logger.warning(f"Failed to format JSON: {e}")
         return str(obj)
 
+def format_python_literal(obj: Any, indent: int = 4, level: int = 0) -> str:
+    """把 JSON 值格式化为等价的 Python 字面量（true/false/null 写作 True/False/None，布局与 format_json 相同）"""
+    if obj is None or isinstance(obj, bool):
+        return repr(obj)
+    if isinstance(obj, (str, int, float)):
+        return json.dumps(obj, ensure_ascii=False)
+    if not obj:
+        return '{}' if isinstance(obj, dict) else '[]'
+    pad = ' ' * (indent * (level + 1))
+    if isinstance(obj, dict):
+        items = [f"{pad}{json.dumps(str(key), ensure_ascii=False)}: {format_python_literal(value, indent, level + 1)}"
+                 for key, value in obj.items()]
+        brackets = '{}'
+    else:
+        items = [pad + format_python_literal(value, indent, level + 1) for value in obj]
+        brackets = '[]'
+    return brackets[0] + '\n' + ',\n'.join(items) + '\n' + ' ' * (indent * level) + brackets[1]
+
 def parse_json_example(example_str: str) -> Dict:
     """解析 JSON 示例字符串"""
     try:
@@ -165,8 +677,16 @@ def format_default_value(value: Any) -> str:
     else:
         return f'"{value}"'
 
-def parse_request_body_params(request_body: Dict) -> List[Dict]:
-    """解析请求体参数"""
+def parse_request_body_params(request_body: Dict, example_obj: Any = None) -> List[Dict]:
+    """解析请求体参数
+
+    Args:
+        request_body: 请求体定义
+        example_obj: 已解析的 raw 请求体；为 None 时从 request_body 中解析
+
+    Returns:
+        参数列表
+    """
     params = []
 
     if not request_body:
@@ -174,8 +694,8 @@ def parse_request_body_params(request_body: Dict) -> List[Dict]:
 
     # 处理 JSON 格式
     if request_body.get('mode') == 'raw':
-        raw_data = request_body.get('raw', '{}')
-        example_obj = parse_json_example(raw_data)
+        if example_obj is None:
+            example_obj = parse_json_example(request_body.get('raw', '{}'))
 
         if isinstance(example_obj, dict):
             for key, value in example_obj.items():
@@ -249,137 +769,157 @@ def validate_api_data(api_info: Dict) -> bool:
 
     return True
 
-def generate_api_doc(api_info: Dict, folder_path: str) -> str:
-    """为单个 API 生成 MDX 文档
+_STREAM_TRUE_RE = re.compile(r'"stream"\s*:\s*true\b')
 
-    Args:
-        api_info: API 信息字典
-        folder_path: 文件夹路径
+class EndpointModel:
+    """单个 API 的中间模型
 
-    Returns:
-        生成的 MDX 文档内容
+    每个 API 只构建一次：请求体只解析一次，URL、方法和参数只计算一次，
+    示例 JSON 的序列化结果按缩进级别缓存，所有文档段落和语言示例共享。
     """
-    name = escape_mdx_string(api_info.get('name', 'Unnamed API'))
-    description = escape_mdx_string(api_info.get('description', ''))
-    request = api_info.get('request', {})
+    __slots__ = ('name', 'description', 'method', 'path', 'full_url',
+                 'path_params', 'query_params', 'request_body', 'body_mode',
+                 'example_obj', 'body_params', 'stream_format', '_json_cache')
 
-    method = request.get('method', 'GET').upper()
-    url_data = request.get('url', {})
-
-    # 构建路径
-    if isinstance(url_data, str):
-        path = url_data
-    else:
-        path_parts = url_data.get('path', [])
-        path = '/' + '/'.join(path_parts) if path_parts else '/'
-
-    # 确定完整URL
-    if path.startswith('http'):
-        full_url = path
-    else:
-        # 处理变量占位符
-        base = url_data.get('host', [Config.base_url])[0] if isinstance(url_data, dict) else Config.base_url
-        base = base.replace('{{baseUrl}}', Config.base_url)
-        full_url = f'{base}{path}'
-
-    # 开始生成 MDX 内容
-    mdx = f"""---
-title: '{name}'
-api: '{method} {path}'
-description: '{description or name}'
----
+    def __init__(self, api_info: Dict, context: RenderContext):
+        self.name = escape_mdx_string(api_info.get('name', 'Unnamed API'))
+        self.description = escape_mdx_string(api_info.get('description', ''))
+        request = api_info.get('request', {})
 
-## Overview
+        self.method = request.get('method', 'GET').upper()
+        url_data = request.get('url', {})
 
-{description or f'This endpoint provides {name.lower()} functionality.'}
+        # 构建路径
+        if isinstance(url_data, str):
+            self.path = url_data
+        else:
+            path_parts = url_data.get('path', [])
+            self.path = '/' + '/'.join(path_parts) if path_parts else '/'
 
-"""
+        # 确定完整URL
+        if self.path.startswith('http'):
+            self.full_url = self.path
+        else:
+            # 处理变量占位符
+            base = url_data.get('host', [context.base_url])[0] if isinstance(url_data, dict) else context.base_url
+            base = base.replace('{{baseUrl}}', context.base_url)
+            self.full_url = f'{base}{self.path}'
+
+        self.path_params = url_data.get('variable', []) if isinstance(url_data, dict) else []
+        self.query_params = url_data.get('query', []) if isinstance(url_data, dict) else []
+
+        # 请求体：raw 模式只解析一次
+        self.request_body = request.get('body', {})
+        self.body_mode = self.request_body.get('mode') if self.request_body else None
+        self.example_obj = None
+        if self.body_mode == 'raw':
+            self.example_obj = parse_json_example(self.request_body.get('raw', '{}'))
+        self.body_params = parse_request_body_params(self.request_body, self.example_obj) if self.request_body else []
+
+        # 流式端点：Gemini 的 streamGenerateContent，或请求体中 "stream": true 的 OpenAI 兼容接口
+        # （示例带注释等无法解析时按原始文本判断）
+        if self.path.endswith(':streamGenerateContent'):
+            self.stream_format: Optional[str] = 'gemini'
+        elif isinstance(self.example_obj, dict) and self.example_obj.get('stream') is True:
+            self.stream_format = 'openai'
+        elif self.body_mode == 'raw' and not self.example_obj and \
+                _STREAM_TRUE_RE.search(self.request_body.get('raw', '')):
+            self.stream_format = 'openai'
+        else:
+            self.stream_format = None
 
-    # 添加认证
-    mdx += """## Authentication
+        self._json_cache: Dict[int, str] = {}
 
-This endpoint requires authentication using a Bearer token.
+    def example_json(self, indent: int = 2) -> str:
+        """返回请求示例的 JSON 文本（按缩进级别缓存）"""
+        text = self._json_cache.get(indent)
+        if text is None:
+            text = format_json(self.example_obj, indent=indent)
+            self._json_cache[indent] = text
+        return text
 
-<ParamField header="Authorization" type="string" required default="sk-***********">
-  Your API key in the format: `Bearer YOUR_API_KEY`
-</ParamField>
+class SectionTemplate:
+    """文档段落模板
 
-"""
+    模板使用 str.format 的语法（`{field}` 占位符，`{{`/`}}` 转义花括号），
+    定义时校验字段并记录字段名，渲染时使用 str.format_map。
+    字段只支持简单名称，不支持格式说明符。
+    """
+    __slots__ = ('text', 'fields')
 
-    # 添加路径参数
-    path_params = url_data.get('variable', []) if isinstance(url_data, dict) else []
-    if path_params:
-        mdx += "## Path Parameters\n\n"
-        for param in path_params:
-            param_name = param.get('key', '')
-            param_desc = param.get('description', f'{param_name} parameter')
+    _formatter = string.Formatter()
 
-            mdx += f"""<ParamField path="{param_name}" type="string">
-  {param_desc}
-</ParamField>
+    def __init__(self, text: str):
+        self.text = text
+        fields = set()
+        for _, field, spec, conversion in self._formatter.parse(text):
+            if field is not None:
+                if spec or conversion or not field.isidentifier():
+                    raise ValueError(f"Unsupported template field: {{{field}}}")
+                fields.add(field)
+        self.fields = frozenset(fields)
 
-"""
+    def render(self, values: Dict[str, str]) -> str:
+        """使用字段值渲染模板"""
+        return self.text.format_map(values)
 
-    # 添加查询参数
-    query_params = url_data.get('query', []) if isinstance(url_data, dict) else []
-    if query_params:
-        mdx += "## Query Parameters\n\n"
-        for param in query_params:
-            param_name = param.get('key', '')
-            param_desc = param.get('description', f'{param_name} parameter')
+# 请求示例的语言模板，按注册顺序出现在 CodeGroup 中
+CODE_SAMPLE_TEMPLATES: List[Tuple[str, SectionTemplate]] = []
 
-            mdx += f"""<ParamField query="{param_name}" type="string">
-  {param_desc}
-</ParamField>
+# 流式端点使用的语言模板，逐个解析 SSE 的 data: 事件
+STREAMING_CODE_SAMPLE_TEMPLATES: List[Tuple[str, SectionTemplate]] = []
 
-"""
+# 可选的生产环境客户端示例（连接池、有界并发、429/503 退避重试）
+PRODUCTION_CODE_SAMPLE_TEMPLATES: List[Tuple[str, SectionTemplate]] = []
 
-    # 添加请求体
-    request_body = request.get('body', {})
-    if request_body:
-        body_params = parse_request_body_params(request_body)
-
-        if body_params:
-            mdx += "## Request Body\n\n"
-
-            for param in body_params:
-                param_name = param['name']
-                param_type = param['type']
-                param_desc = param['description']
-                param_required = 'required' if param['required'] else ''
-                param_default = param.get('default', '')
-
-                # 将默认值作为 default 属性
-                if param_default:
-                    mdx += f"""<ParamField body="{param_name}" type="{param_type}" {param_required} default={param_default}>
-  {param_desc}
-</ParamField>
+# 异步任务端点的提交+轮询示例（指数退避、超时、批量任务）
+TASK_POLLING_CODE_SAMPLE_TEMPLATES: List[Tuple[str, SectionTemplate]] = []
 
-"""
-                else:
-                    mdx += f"""<ParamField body="{param_name}" type="{param_type}" {param_required}>
-  {param_desc}
-</ParamField>
+CODE_SAMPLE_GROUPS: Dict[str, List[Tuple[str, SectionTemplate]]] = {
+    'request': CODE_SAMPLE_TEMPLATES,
+    'streaming': STREAMING_CODE_SAMPLE_TEMPLATES,
+    'production': PRODUCTION_CODE_SAMPLE_TEMPLATES,
+    'polling': TASK_POLLING_CODE_SAMPLE_TEMPLATES,
+}
 
-"""
+def register_code_sample(language: str, template: str, group: str = 'request') -> SectionTemplate:
+    """注册一个请求示例语言模板
 
-    # 添加请求示例
-    if request_body and request_body.get('mode') == 'raw':
-        raw_data = request_body.get('raw', '{}')
-        example_obj = parse_json_example(raw_data)
+    模板可用字段: method, method_lower, full_url, body_json（缩进 2）,
+    body_json_compact（缩进 0，单行）, body_python（Python 字面量，缩进 4）。
+    流式模板另有 stream_url 以及 STREAM_FORMAT_FIELDS 中按流式格式提供的
+    *_print / go_chunk_type 字段；任务轮询模板另有 query_url（任务 ID 位置为
+    `{task_id}` 的查询地址）。同名语言再次注册时替换原模板。
 
-        mdx += f"""## Request Example
+    Args:
+        language: 语言名称（仅用于标识和替换）
+        template: 模板文本，应以代码块结尾并包含末尾空行
+        group: 模板分组：request（默认请求示例）、streaming（流式端点）、production（生产环境客户端）
+            或 polling（异步任务的提交和轮询）
 
-<CodeGroup>
+    Returns:
+        模板对象
+    """
+    templates = CODE_SAMPLE_GROUPS[group]
+    section = SectionTemplate(template)
+    for index, (existing, _) in enumerate(templates):
+        if existing == language:
+            templates[index] = (language, section)
+            break
+    else:
+        templates.append((language, section))
+    return section
 
-```bash cURL
+register_code_sample('curl', """```bash cURL
 curl -X {method} "{full_url}" \\
   -H "Authorization: Bearer YOUR_API_KEY" \\
   -H "Content-Type: application/json" \\
-  -d '{format_json(example_obj)}'
+  -d '{body_json}'
 ```
 
-```python Python
+""")
+
+register_code_sample('python', """```python Python
 import requests
 import json
 
@@ -389,21 +929,23 @@ headers = {{
     "Content-Type": "application/json"
 }}
 
-data = {format_json(example_obj)}
+data = {body_json}
 
-response = requests.{method.lower()}(url, headers=headers, json=data)
+response = requests.{method_lower}(url, headers=headers, json=data)
 result = response.json()
 print(json.dumps(result, indent=2))
 ```
 
-```javascript JavaScript
+""")
+
+register_code_sample('javascript', """```javascript JavaScript
 const url = "{full_url}";
 const headers = {{
   "Authorization": "Bearer YOUR_API_KEY",
   "Content-Type": "application/json"
 }};
 
-const data = {format_json(example_obj)};
+const data = {body_json};
 
 fetch(url, {{
   method: "{method}",
@@ -415,7 +957,9 @@ fetch(url, {{
   .catch(error => console.error("Error:", error));
 ```
 
-```go Go
+""")
+
+register_code_sample('go', """```go Go
 package main
 
 import (
@@ -429,7 +973,7 @@ import (
 func main() {{
     url := "{full_url}"
 
-    payload := []byte(`{format_json(example_obj, indent=0)}`)
+    payload := []byte(`{body_json_compact}`)
 
     req, _ := http.NewRequest("{method}", url, bytes.NewBuffer(payload))
     req.Header.Set("Authorization", "Bearer YOUR_API_KEY")
@@ -447,300 +991,3311 @@ func main() {{
 }}
 ```
 
-</CodeGroup>
-
-"""
-
-    # 添加响应
-    mdx += """## Response
-
-<ResponseField name="Success" type="200">
-  Successful response
-
-```json
-{
-  "status": "success"
+""")
+
+# 流式示例中按流式格式输出增量文本的代码（已按模板中的位置缩进）
+STREAM_FORMAT_FIELDS: Dict[str, Dict[str, str]] = {
+    'openai': {
+        'python_print': """\
+        for choice in chunk.get("choices", []):
+            print(choice.get("delta", {}).get("content") or "", end="", flush=True)""",
+        'javascript_print': """\
+      for (const choice of chunk.choices ?? []) {
+        process.stdout.write(choice.delta?.content ?? "");
+      }""",
+        'go_chunk_type': """\
+type Chunk struct {
+    Choices []struct {
+        Delta struct {
+            Content string `json:"content"`
+        } `json:"delta"`
+    } `json:"choices"`
+}""",
+        'go_print': """\
+        for _, choice := range chunk.Choices {
+            fmt.Print(choice.Delta.Content)
+        }""",
+    },
+    'gemini': {
+        'python_print': """\
+        for candidate in chunk.get("candidates", []):
+            for part in candidate.get("content", {}).get("parts", []):
+                print(part.get("text", ""), end="", flush=True)""",
+        'javascript_print': """\
+      for (const candidate of chunk.candidates ?? []) {
+        for (const part of candidate.content?.parts ?? []) {
+          process.stdout.write(part.text ?? "");
+        }
+      }""",
+        'go_chunk_type': """\
+type Chunk struct {
+    Candidates []struct {
+        Content struct {
+            Parts []struct {
+                Text string `json:"text"`
+            } `json:"parts"`
+        } `json:"content"`
+    } `json:"candidates"`
+}""",
+        'go_print': """\
+        for _, candidate := range chunk.Candidates {
+            for _, part := range candidate.Content.Parts {
+                fmt.Print(part.Text)
+            }
+        }""",
+    },
 }
+
+register_code_sample('curl', """```bash cURL
+curl -N -X {method} "{stream_url}" \\
+  -H "Authorization: Bearer YOUR_API_KEY" \\
+  -H "Content-Type: application/json" \\
+  -H "Accept: text/event-stream" \\
+  -d '{body_json}'
 ```
-</ResponseField>
 
-"""
+""", group='streaming')
 
-    # 添加错误响应
-    mdx += """## Error Responses
+register_code_sample('python', """```python Python
+import json
+import requests
 
-<ResponseExample>
+url = "{stream_url}"
+headers = {{
+    "Authorization": "Bearer YOUR_API_KEY",
+    "Content-Type": "application/json",
+    "Accept": "text/event-stream"
+}}
 
-```json 401 - Invalid signature
-{
-  "error": {
-    "message": "Invalid signature",
-    "type": "401"
-  }
-}
+data = {body_json}
+
+with requests.{method_lower}(url, headers=headers, json=data, stream=True) as response:
+    response.raise_for_status()
+    for line in response.iter_lines():
+        line = line.decode("utf-8")
+        if not line.startswith("data:"):
+            continue
+        payload = line[len("data:"):].strip()
+        if payload == "[DONE]":
+            break
+        chunk = json.loads(payload)
+{python_print}
+print()
 ```
 
-```json 403 - Invalid Token
-{
-  "error": {
-    "message": "Invalid Token",
-    "type": "403"
-  }
-}
-```
+""", group='streaming')
 
-```json 403 - Insufficient balance
-{
-  "error": {
-    "message": "Insufficient balance",
-    "type": "403"
-  }
-}
-```
+register_code_sample('javascript', """```javascript JavaScript
+const url = "{stream_url}";
+const headers = {{
+  "Authorization": "Bearer YOUR_API_KEY",
+  "Content-Type": "application/json",
+  "Accept": "text/event-stream"
+}};
 
-```json 500 - Internal server error
-{
-  "error": {
-    "message": "Internal server error",
-    "type": "500"
-  }
-}
-```
+const data = {body_json};
+
+async function main() {{
+  const response = await fetch(url, {{
+    method: "{method}",
+    headers: headers,
+    body: JSON.stringify(data)
+  }});
+  if (!response.ok) {{
+    throw new Error(`HTTP ${{response.status}}: ${{await response.text()}}`);
+  }}
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  while (true) {{
+    const {{ done, value }} = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, {{ stream: true }});
+    const lines = buffer.split("\\n");
+    buffer = lines.pop();
+    for (const line of lines) {{
+      if (!line.startsWith("data:")) continue;
+      const payload = line.slice("data:".length).trim();
+      if (payload === "[DONE]") return;
+      const chunk = JSON.parse(payload);
+{javascript_print}
+    }}
+  }}
+}}
 
-```json 503 - Content policy violation
-{
-  "error": {
-    "message": "Input may not meet the guidelines. Please adjust and try again.",
-    "type": "503"
-  }
-}
+main().catch(error => console.error("Error:", error));
 ```
 
-</ResponseExample>
+""", group='streaming')
 
-"""
+register_code_sample('go', """```go Go
+package main
 
-    return mdx
+import (
+    "bufio"
+    "bytes"
+    "encoding/json"
+    "fmt"
+    "net/http"
+    "strings"
+)
 
-class NavigationNode:
-    """导航树节点"""
-    def __init__(self, name: str, is_folder: bool = True):
-        self.name = name
-        self.is_folder = is_folder
-        self.children: List[NavigationNode] = []
-        self.file_path: Optional[str] = None
+{go_chunk_type}
 
-    def add_child(self, child: 'NavigationNode'):
-        self.children.append(child)
+func main() {{
+    url := "{stream_url}"
 
-    def to_dict(self) -> Dict:
-        """转换为 mint.json 的导航格式"""
-        if not self.is_folder:
-            # 叶子节点：直接返回文件路径
-            return self.file_path
-        else:
-            # 文件夹节点：返回包含子节点的字典
-            if not self.children:
-                return {}
+    payload := []byte(`{body_json_compact}`)
 
-            result = {
-                "group": self.name,
-                "pages": []
-            }
+    req, _ := http.NewRequest("{method}", url, bytes.NewBuffer(payload))
+    req.Header.Set("Authorization", "Bearer YOUR_API_KEY")
+    req.Header.Set("Content-Type", "application/json")
+    req.Header.Set("Accept", "text/event-stream")
 
-            for child in self.children:
-                child_dict = child.to_dict()
-                if child_dict:  # 只添加非空的子节点
-                    result["pages"].append(child_dict)
+    resp, err := http.DefaultClient.Do(req)
+    if err != nil {{
+        panic(err)
+    }}
+    defer resp.Body.Close()
 
-            return result if result["pages"] else {}
+    scanner := bufio.NewScanner(resp.Body)
+    scanner.Buffer(make([]byte, 0, 64*1024), 1024*1024)
+    for scanner.Scan() {{
+        line := scanner.Text()
+        if !strings.HasPrefix(line, "data:") {{
+            continue
+        }}
+        data := strings.TrimSpace(strings.TrimPrefix(line, "data:"))
+        if data == "[DONE]" {{
+            break
+        }}
+        var chunk Chunk
+        if err := json.Unmarshal([]byte(data), &chunk); err != nil {{
+            panic(err)
+        }}
+{go_print}
+    }}
+    if err := scanner.Err(); err != nil {{
+        panic(err)
+    }}
+    fmt.Println()
+}}
+```
 
-def extract_apis_recursive(
-    item: Dict,
-    folder_path: List[str],
-    output_base: Path,
-    navigation_tree: Dict[str, NavigationNode]
-) -> Tuple[List[Dict], int]:
-    """递归提取所有 API 并生成文档
+""", group='streaming')
 
-    Args:
-        item: API 集合项
-        folder_path: 当前文件夹路径列表
-        output_base: 输出基础路径
-        navigation_tree: 导航树字典，key 为顶级分类名
+register_code_sample('python', """```python Python
+import asyncio
+import json
+import random
 
-    Returns:
-        (API信息列表, 生成的文件数量)
-    """
-    apis = []
-    generated_count = 0
+import httpx
 
-    # 处理嵌套的文件夹（支持 'items' 和 'item' 两种格式）
-    sub_items = item.get('item') or item.get('items')
+URL = "{full_url}"
+HEADERS = {{
+    "Authorization": "Bearer YOUR_API_KEY",
+    "Content-Type": "application/json"
+}}
+DATA = {body_python}
+
+MAX_CONCURRENCY = 8
+MAX_RETRIES = 5
+RETRY_STATUSES = {{429, 503}}
+
+
+async def send(client, semaphore, data):
+    async with semaphore:
+        for attempt in range(MAX_RETRIES + 1):
+            response = await client.request("{method}", URL, json=data)
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                response.raise_for_status()
+                return response.json()
+            # Honour Retry-After, otherwise back off exponentially with full jitter
+            retry_after = response.headers.get("Retry-After", "")
+            backoff = random.uniform(0, min(30.0, 0.5 * 2 ** attempt))
+            await asyncio.sleep(max(float(retry_after) if retry_after.isdigit() else 0.0, backoff))
+
+
+async def main():
+    payloads = [DATA] * 20
+
+    # One pooled client for every request: connections are kept alive and reused
+    limits = httpx.Limits(max_connections=MAX_CONCURRENCY, max_keepalive_connections=MAX_CONCURRENCY)
+    async with httpx.AsyncClient(headers=HEADERS, limits=limits, timeout=60.0) as client:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        results = await asyncio.gather(
+            *(send(client, semaphore, payload) for payload in payloads),
+            return_exceptions=True
+        )
 
-    if sub_items:
-        folder_name = item.get('name', '')
-        new_path = folder_path + [folder_name]
+    for result in results:
+        print(result if isinstance(result, Exception) else json.dumps(result, indent=2))
 
-        # 确定顶级分类（第一层目录）
-        top_category = new_path[0] if new_path else 'Other'
 
-        # 创建或获取导航节点
-        if top_category not in navigation_tree:
-            navigation_tree[top_category] = NavigationNode(top_category, is_folder=True)
+asyncio.run(main())
+```
 
-        # 递归处理子项
-        for sub_item in sub_items:
-            sub_apis, sub_count = extract_apis_recursive(
-                sub_item,
-                new_path,
-                output_base,
-                navigation_tree
-            )
-            apis.extend(sub_apis)
-            generated_count += sub_count
+""", group='production')
 
-    # 处理 API 定义（只有 request 字段的是实际的 API）
-    if 'request' in item and not sub_items:
-        api_name = item.get('name', 'Unnamed')
+register_code_sample('javascript', """```javascript JavaScript
+const url = "{full_url}";
+const headers = {{
+  "Authorization": "Bearer YOUR_API_KEY",
+  "Content-Type": "application/json"
+}};
+const data = {body_json};
+
+const MAX_CONCURRENCY = 8;
+const MAX_RETRIES = 5;
+
+const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+
+// Node 18+ fetch keeps connections alive and reuses them across requests
+async function send(payload) {{
+  for (let attempt = 0; ; attempt++) {{
+    const response = await fetch(url, {{
+      method: "{method}",
+      headers: headers,
+      body: JSON.stringify(payload)
+    }});
+    const retryable = response.status === 429 || response.status === 503;
+    if (!retryable || attempt === MAX_RETRIES) {{
+      if (!response.ok) {{
+        throw new Error(`HTTP ${{response.status}}: ${{await response.text()}}`);
+      }}
+      return response.json();
+    }}
+    // Drain the body so the connection goes back to the pool
+    await response.arrayBuffer();
+    // Honour Retry-After, otherwise back off exponentially with full jitter
+    const retryAfter = Number(response.headers.get("retry-after")) * 1000 || 0;
+    const backoff = Math.random() * Math.min(30000, 500 * 2 ** attempt);
+    await sleep(Math.max(retryAfter, backoff));
+  }}
+}}
 
-        # 确定输出路径
-        if len(folder_path) >= 1:
-            # 使用第一级目录作为主分类
-            category = sanitize_folder_name(folder_path[0])
-            # 使用后续路径创建子目录
-            sub_folders = [sanitize_folder_name(f) for f in folder_path[1:]] if len(folder_path) > 1 else []
+async function runBatch(payloads) {{
+  const results = new Array(payloads.length);
+  let next = 0;
+  async function worker() {{
+    while (next < payloads.length) {{
+      const index = next++;
+      try {{
+        results[index] = await send(payloads[index]);
+      }} catch (error) {{
+        results[index] = error;
+      }}
+    }}
+  }}
+  await Promise.all(Array.from({{ length: Math.min(MAX_CONCURRENCY, payloads.length) }}, worker));
+  return results;
+}}
 
-            # 创建完整的输出目录
-            output_dir = output_base / category
-            for sub_folder in sub_folders:
-                output_dir = output_dir / sub_folder
-            output_dir.mkdir(parents=True, exist_ok=True)
+runBatch(Array(20).fill(data)).then(results => {{
+  for (const result of results) {{
+    console.log(result);
+  }}
+}});
+```
+
+""", group='production')
+
+register_code_sample('go', """```go Go
+package main
+
+import (
+    "bytes"
+    "context"
+    "fmt"
+    "io"
+    "math/rand"
+    "net/http"
+    "strconv"
+    "sync"
+    "time"
+)
+
+const (
+    url            = "{full_url}"
+    maxConcurrency = 8
+    maxRetries     = 5
+)
+
+// One client for the whole process: connections are pooled and reused
+var client = &http.Client{{
+    Timeout: 60 * time.Second,
+    Transport: &http.Transport{{
+        MaxIdleConns:        100,
+        MaxIdleConnsPerHost: maxConcurrency,
+        IdleConnTimeout:     90 * time.Second,
+    }},
+}}
+
+func send(ctx context.Context, payload []byte) ([]byte, error) {{
+    for attempt := 0; ; attempt++ {{
+        req, err := http.NewRequestWithContext(ctx, "{method}", url, bytes.NewReader(payload))
+        if err != nil {{
+            return nil, err
+        }}
+        req.Header.Set("Authorization", "Bearer YOUR_API_KEY")
+        req.Header.Set("Content-Type", "application/json")
+
+        resp, err := client.Do(req)
+        if err != nil {{
+            return nil, err
+        }}
+        body, err := io.ReadAll(resp.Body)
+        resp.Body.Close()
+        if err != nil {{
+            return nil, err
+        }}
+
+        retryable := resp.StatusCode == http.StatusTooManyRequests || resp.StatusCode == http.StatusServiceUnavailable
+        if !retryable || attempt == maxRetries {{
+            if resp.StatusCode >= 400 {{
+                return nil, fmt.Errorf("HTTP %d: %s", resp.StatusCode, body)
+            }}
+            return body, nil
+        }}
+
+        // Honour Retry-After, otherwise back off exponentially with full jitter
+        backoff := time.Duration(500<<attempt) * time.Millisecond
+        if backoff > 30*time.Second {{
+            backoff = 30 * time.Second
+        }}
+        delay := time.Duration(rand.Int63n(int64(backoff)))
+        if seconds, err := strconv.Atoi(resp.Header.Get("Retry-After")); err == nil && time.Duration(seconds)*time.Second > delay {{
+            delay = time.Duration(seconds) * time.Second
+        }}
+        select {{
+        case <-time.After(delay):
+        case <-ctx.Done():
+            return nil, ctx.Err()
+        }}
+    }}
+}}
+
+func main() {{
+    payload := []byte(`{body_json_compact}`)
+    payloads := make([][]byte, 20)
+    for i := range payloads {{
+        payloads[i] = payload
+    }}
+
+    results := make([]string, len(payloads))
+    semaphore := make(chan struct{{}}, maxConcurrency)
+    var wg sync.WaitGroup
+    for i, p := range payloads {{
+        wg.Add(1)
+        go func(i int, p []byte) {{
+            defer wg.Done()
+            semaphore <- struct{{}}{{}}
+            defer func() {{ <-semaphore }}()
+            body, err := send(context.Background(), p)
+            if err != nil {{
+                results[i] = "error: " + err.Error()
+                return
+            }}
+            results[i] = string(body)
+        }}(i, p)
+    }}
+    wg.Wait()
+
+    for _, result := range results {{
+        fmt.Println(result)
+    }}
+}}
+```
+
+""", group='production')
+
+PRODUCTION_CLIENT_INTRO = ("Reuse one pooled client, cap the number of requests in flight and retry `429` / `503` "
+                           "responses with jittered exponential backoff (honouring `Retry-After`).\n\n")
+
+register_code_sample('python', """```python Python
+import asyncio
+import json
+import random
+from urllib.parse import quote
+
+import httpx
+
+SUBMIT_URL = "{full_url}"
+QUERY_URL = "{query_url}"
+HEADERS = {{
+    "Authorization": "Bearer YOUR_API_KEY",
+    "Content-Type": "application/json"
+}}
+DATA = {body_python}
+
+MAX_TASKS_IN_FLIGHT = 16
+INITIAL_DELAY = 2.0
+MAX_DELAY = 30.0
+TIMEOUT = 15 * 60
+
+TASK_ID_KEYS = ("task_id", "taskId", "id")
+STATUS_KEYS = ("status", "state", "task_status")
+DONE_STATUSES = {{"succeeded", "success", "completed", "complete", "finished", "done"}}
+FAILED_STATUSES = {{"failed", "failure", "error", "cancelled", "canceled", "expired"}}
+
+
+def find_value(obj, keys):
+    \"\"\"Return the first non-empty value stored under one of keys, searching nested objects.\"\"\"
+    if isinstance(obj, dict):
+        for key in keys:
+            value = obj.get(key)
+            if isinstance(value, (str, int)) and value != "":
+                return value
+        children = obj.values()
+    elif isinstance(obj, list):
+        children = obj
+    else:
+        return None
+    for child in children:
+        found = find_value(child, keys)
+        if found is not None:
+            return found
+    return None
+
+
+async def run_task(client, data):
+    response = await client.request("{method}", SUBMIT_URL, json=data)
+    response.raise_for_status()
+    task_id = find_value(response.json(), TASK_ID_KEYS)
+    if task_id is None:
+        raise RuntimeError(f"No task id in response: {{response.text}}")
+
+    # Poll with exponential backoff and jitter until the task finishes or times out
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + TIMEOUT
+    delay = INITIAL_DELAY
+    while loop.time() < deadline:
+        await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+        response = await client.get(QUERY_URL.format(task_id=quote(str(task_id), safe="")))
+        response.raise_for_status()
+        result = response.json()
+        status = str(find_value(result, STATUS_KEYS) or "").lower()
+        if status in DONE_STATUSES:
+            return result
+        if status in FAILED_STATUSES:
+            raise RuntimeError(f"Task {{task_id}} {{status}}: {{result}}")
+        delay = min(delay * 2, MAX_DELAY)
+    raise TimeoutError(f"Task {{task_id}} did not finish within {{TIMEOUT}}s")
+
+
+async def main():
+    payloads = [DATA] * 50
+    semaphore = asyncio.Semaphore(MAX_TASKS_IN_FLIGHT)
+
+    async with httpx.AsyncClient(headers=HEADERS, timeout=60.0) as client:
+        async def limited(payload):
+            async with semaphore:
+                return await run_task(client, payload)
+
+        results = await asyncio.gather(*(limited(payload) for payload in payloads), return_exceptions=True)
+
+    for result in results:
+        print(result if isinstance(result, Exception) else json.dumps(result, indent=2))
+
+
+asyncio.run(main())
+```
+
+""", group='polling')
+
+register_code_sample('javascript', """```javascript JavaScript
+const SUBMIT_URL = "{full_url}";
+const QUERY_URL = "{query_url}";
+const headers = {{
+  "Authorization": "Bearer YOUR_API_KEY",
+  "Content-Type": "application/json"
+}};
+const data = {body_json};
+
+const MAX_TASKS_IN_FLIGHT = 16;
+const INITIAL_DELAY = 2000;
+const MAX_DELAY = 30000;
+const TIMEOUT = 15 * 60 * 1000;
+
+const TASK_ID_KEYS = ["task_id", "taskId", "id"];
+const STATUS_KEYS = ["status", "state", "task_status"];
+const DONE_STATUSES = new Set(["succeeded", "success", "completed", "complete", "finished", "done"]);
+const FAILED_STATUSES = new Set(["failed", "failure", "error", "cancelled", "canceled", "expired"]);
+
+const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+
+// Return the first non-empty value stored under one of keys, searching nested objects
+function findValue(obj, keys) {{
+  if (obj === null || typeof obj !== "object") return undefined;
+  if (!Array.isArray(obj)) {{
+    for (const key of keys) {{
+      const value = obj[key];
+      if ((typeof value === "string" && value !== "") || typeof value === "number") return value;
+    }}
+  }}
+  for (const child of Object.values(obj)) {{
+    const found = findValue(child, keys);
+    if (found !== undefined) return found;
+  }}
+  return undefined;
+}}
+
+async function requestJson(url, options) {{
+  const response = await fetch(url, {{ headers, ...options }});
+  if (!response.ok) {{
+    throw new Error(`HTTP ${{response.status}}: ${{await response.text()}}`);
+  }}
+  return response.json();
+}}
+
+async function runTask(payload) {{
+  const submitted = await requestJson(SUBMIT_URL, {{ method: "{method}", body: JSON.stringify(payload) }});
+  const taskId = findValue(submitted, TASK_ID_KEYS);
+  if (taskId === undefined) {{
+    throw new Error(`No task id in response: ${{JSON.stringify(submitted)}}`);
+  }}
+
+  // Poll with exponential backoff and jitter until the task finishes or times out
+  const deadline = Date.now() + TIMEOUT;
+  let delay = INITIAL_DELAY;
+  while (Date.now() < deadline) {{
+    await sleep(delay * (0.8 + Math.random() * 0.4));
+    const result = await requestJson(QUERY_URL.replace("{{task_id}}", encodeURIComponent(taskId)), {{ method: "GET" }});
+    const status = String(findValue(result, STATUS_KEYS) ?? "").toLowerCase();
+    if (DONE_STATUSES.has(status)) return result;
+    if (FAILED_STATUSES.has(status)) {{
+      throw new Error(`Task ${{taskId}} ${{status}}: ${{JSON.stringify(result)}}`);
+    }}
+    delay = Math.min(delay * 2, MAX_DELAY);
+  }}
+  throw new Error(`Task ${{taskId}} did not finish within ${{TIMEOUT / 1000}}s`);
+}}
+
+// Run every task with at most MAX_TASKS_IN_FLIGHT submitted or polling at once
+async function runTasks(payloads) {{
+  const results = new Array(payloads.length);
+  let next = 0;
+  async function worker() {{
+    while (next < payloads.length) {{
+      const index = next++;
+      try {{
+        results[index] = await runTask(payloads[index]);
+      }} catch (error) {{
+        results[index] = error;
+      }}
+    }}
+  }}
+  await Promise.all(Array.from({{ length: Math.min(MAX_TASKS_IN_FLIGHT, payloads.length) }}, worker));
+  return results;
+}}
+
+runTasks(Array(50).fill(data)).then(results => {{
+  for (const result of results) {{
+    console.log(result instanceof Error ? result.message : JSON.stringify(result, null, 2));
+  }}
+}});
+```
+
+""", group='polling')
+
+register_code_sample('go', """```go Go
+package main
+
+import (
+    "bytes"
+    "encoding/json"
+    "fmt"
+    "io"
+    "math/rand"
+    "net/http"
+    "net/url"
+    "strings"
+    "sync"
+    "time"
+)
+
+const (
+    submitURL        = "{full_url}"
+    queryURL         = "{query_url}"
+    maxTasksInFlight = 16
+    initialDelay     = 2 * time.Second
+    maxDelay         = 30 * time.Second
+    timeout          = 15 * time.Minute
+)
+
+var (
+    taskIDKeys     = []string{{"task_id", "taskId", "id"}}
+    statusKeys     = []string{{"status", "state", "task_status"}}
+    doneStatuses   = map[string]bool{{"succeeded": true, "success": true, "completed": true, "complete": true, "finished": true, "done": true}}
+    failedStatuses = map[string]bool{{"failed": true, "failure": true, "error": true, "cancelled": true, "canceled": true, "expired": true}}
+)
+
+// One client shared by all tasks reuses pooled connections
+var client = &http.Client{{Timeout: 60 * time.Second}}
+
+func requestJSON(method, target string, payload []byte) (any, error) {{
+    req, err := http.NewRequest(method, target, bytes.NewReader(payload))
+    if err != nil {{
+        return nil, err
+    }}
+    req.Header.Set("Authorization", "Bearer YOUR_API_KEY")
+    req.Header.Set("Content-Type", "application/json")
+
+    resp, err := client.Do(req)
+    if err != nil {{
+        return nil, err
+    }}
+    defer resp.Body.Close()
+    body, err := io.ReadAll(resp.Body)
+    if err != nil {{
+        return nil, err
+    }}
+    if resp.StatusCode >= 400 {{
+        return nil, fmt.Errorf("HTTP %d: %s", resp.StatusCode, body)
+    }}
+
+    decoder := json.NewDecoder(bytes.NewReader(body))
+    decoder.UseNumber()
+    var result any
+    err = decoder.Decode(&result)
+    return result, err
+}}
+
+// findValue returns the first non-empty value stored under one of keys, searching nested objects
+func findValue(value any, keys []string) string {{
+    switch v := value.(type) {{
+    case map[string]any:
+        for _, key := range keys {{
+            switch found := v[key].(type) {{
+            case string:
+                if found != "" {{
+                    return found
+                }}
+            case json.Number:
+                return found.String()
+            }}
+        }}
+        for _, child := range v {{
+            if found := findValue(child, keys); found != "" {{
+                return found
+            }}
+        }}
+    case []any:
+        for _, child := range v {{
+            if found := findValue(child, keys); found != "" {{
+                return found
+            }}
+        }}
+    }}
+    return ""
+}}
+
+func runTask(payload []byte) (any, error) {{
+    submitted, err := requestJSON("{method}", submitURL, payload)
+    if err != nil {{
+        return nil, err
+    }}
+    taskID := findValue(submitted, taskIDKeys)
+    if taskID == "" {{
+        return nil, fmt.Errorf("no task id in response: %v", submitted)
+    }}
+
+    // Poll with exponential backoff and jitter until the task finishes or times out
+    deadline := time.Now().Add(timeout)
+    delay := initialDelay
+    for time.Now().Before(deadline) {{
+        time.Sleep(time.Duration(float64(delay) * (0.8 + 0.4*rand.Float64())))
+        result, err := requestJSON("GET", strings.Replace(queryURL, "{{task_id}}", url.PathEscape(taskID), 1), nil)
+        if err != nil {{
+            return nil, err
+        }}
+        status := strings.ToLower(findValue(result, statusKeys))
+        if doneStatuses[status] {{
+            return result, nil
+        }}
+        if failedStatuses[status] {{
+            return nil, fmt.Errorf("task %s %s: %v", taskID, status, result)
+        }}
+        delay *= 2
+        if delay > maxDelay {{
+            delay = maxDelay
+        }}
+    }}
+    return nil, fmt.Errorf("task %s did not finish within %s", taskID, timeout)
+}}
+
+func main() {{
+    payload := []byte(`{body_json_compact}`)
+    payloads := make(chan []byte)
+    results := make(chan string)
+
+    // A fixed pool of workers keeps at most maxTasksInFlight tasks submitted or polling at once
+    var wg sync.WaitGroup
+    for i := 0; i < maxTasksInFlight; i++ {{
+        wg.Add(1)
+        go func() {{
+            defer wg.Done()
+            for p := range payloads {{
+                result, err := runTask(p)
+                if err != nil {{
+                    results <- "error: " + err.Error()
+                    continue
+                }}
+                encoded, _ := json.Marshal(result)
+                results <- string(encoded)
+            }}
+        }}()
+    }}
+    go func() {{
+        for i := 0; i < 50; i++ {{
+            payloads <- payload
+        }}
+        close(payloads)
+        wg.Wait()
+        close(results)
+    }}()
+
+    for result := range results {{
+        fmt.Println(result)
+    }}
+}}
+```
+
+""", group='polling')
+
+TASK_POLLING_INTRO = ("Submit the task, then poll {query} with jittered exponential backoff until it succeeds, "
+                      "fails or times out. Many tasks run at once with a cap on how many are in flight.\n\n")
+
+FRONTMATTER_TEMPLATE = SectionTemplate("""---
+title: '{name}'
+api: '{method} {path}'
+description: '{summary}'
+---
+
+## Overview
+
+{overview}
+
+""")
+
+PATH_PARAM_TEMPLATE = SectionTemplate("""<ParamField path="{name}" type="string">
+  {description}
+</ParamField>
+
+""")
+
+QUERY_PARAM_TEMPLATE = SectionTemplate("""<ParamField query="{name}" type="string">
+  {description}
+</ParamField>
+
+""")
+
+BODY_PARAM_TEMPLATE = SectionTemplate("""<ParamField body="{name}" type="{type}" {required}>
+  {description}
+</ParamField>
+
+""")
+
+BODY_PARAM_DEFAULT_TEMPLATE = SectionTemplate("""<ParamField body="{name}" type="{type}" {required} default={default}>
+  {description}
+</ParamField>
+
+""")
+
+# 以下段落与端点无关，只构建一次
+AUTHENTICATION_SECTION = """## Authentication
+
+This endpoint requires authentication using a Bearer token.
+
+<ParamField header="Authorization" type="string" required default="sk-***********">
+  Your API key in the format: `Bearer YOUR_API_KEY`
+</ParamField>
+
+"""
+
+RESPONSE_SECTION = """## Response
+
+<ResponseField name="Success" type="200">
+  Successful response
+
+```json
+{
+  "status": "success"
+}
+```
+</ResponseField>
+
+"""
+
+ERROR_RESPONSES_SECTION = """## Error Responses
+
+<ResponseExample>
+
+```json 401 - Invalid signature
+{
+  "error": {
+    "message": "Invalid signature",
+    "type": "401"
+  }
+}
+```
+
+```json 403 - Invalid Token
+{
+  "error": {
+    "message": "Invalid Token",
+    "type": "403"
+  }
+}
+```
+
+```json 403 - Insufficient balance
+{
+  "error": {
+    "message": "Insufficient balance",
+    "type": "403"
+  }
+}
+```
+
+```json 500 - Internal server error
+{
+  "error": {
+    "message": "Internal server error",
+    "type": "500"
+  }
+}
+```
+
+```json 503 - Content policy violation
+{
+  "error": {
+    "message": "Input may not meet the guidelines. Please adjust and try again.",
+    "type": "503"
+  }
+}
+```
+
+</ResponseExample>
+
+"""
+
+# 参与 page_template_fingerprint 的段落模板和静态段落，新增页面模板时需要加入这里
+PAGE_TEMPLATES: Tuple[str, ...] = (
+    FRONTMATTER_TEMPLATE.text,
+    PATH_PARAM_TEMPLATE.text,
+    QUERY_PARAM_TEMPLATE.text,
+    BODY_PARAM_TEMPLATE.text,
+    BODY_PARAM_DEFAULT_TEMPLATE.text,
+    AUTHENTICATION_SECTION,
+    RESPONSE_SECTION,
+    ERROR_RESPONSES_SECTION,
+    PRODUCTION_CLIENT_INTRO,
+    TASK_POLLING_INTRO,
+)
+
+def stream_url(endpoint: EndpointModel) -> str:
+    """流式示例使用的 URL：Gemini 的 streamGenerateContent 需要 alt=sse 才返回 SSE 事件"""
+    if endpoint.stream_format == 'gemini':
+        return endpoint.full_url + ('&' if '?' in endpoint.full_url else '?') + 'alt=sse'
+    return endpoint.full_url
+
+def code_sample_values(endpoint: EndpointModel) -> Dict[str, str]:
+    """所有示例模板共用的字段值，由同一个端点模型生成"""
+    return {
+        'method': endpoint.method,
+        'method_lower': endpoint.method.lower(),
+        'full_url': endpoint.full_url,
+        'body_json': endpoint.example_json(),
+        'body_json_compact': endpoint.example_json(indent=0),
+    }
+
+def render_code_samples(endpoint: EndpointModel) -> str:
+    """渲染请求示例的 CodeGroup 代码块（所有已注册的语言模板）
+
+    流式端点使用流式模板，示例逐个解析到达的 SSE 事件并输出增量文本。
+    """
+    values = code_sample_values(endpoint)
+    templates = CODE_SAMPLE_TEMPLATES
+    if endpoint.stream_format is not None:
+        values['stream_url'] = stream_url(endpoint)
+        values.update(STREAM_FORMAT_FIELDS[endpoint.stream_format])
+        templates = STREAMING_CODE_SAMPLE_TEMPLATES
+    parts = ["<CodeGroup>\n\n"]
+    for _, template in templates:
+        parts.append(template.render(values))
+    parts.append("</CodeGroup>\n\n")
+    return ''.join(parts)
+
+def render_production_client(endpoint: EndpointModel) -> str:
+    """渲染生产环境客户端段落：连接池、有界并发的批量提交和 429/503 抖动退避重试"""
+    values = code_sample_values(endpoint)
+    values['body_python'] = format_python_literal(endpoint.example_obj) if endpoint.example_obj else '{}'
+    parts = ["## Production Client\n\n", PRODUCTION_CLIENT_INTRO, "<CodeGroup>\n\n"]
+    for _, template in PRODUCTION_CODE_SAMPLE_TEMPLATES:
+        parts.append(template.render(values))
+    parts.append("</CodeGroup>\n\n")
+    return ''.join(parts)
+
+def task_query_url(task_query: Dict, context: RenderContext) -> Tuple[str, str]:
+    """任务查询端点的 (完整 URL, 路径)，任务 ID 的位置为 `{task_id}`
+
+    查询端点自带绝对地址时使用它，否则（`{{baseUrl}}` 或没有 host）使用 context.base_url。
+    """
+    path = '/' + '/'.join(task_query['path'])
+    suffix = f"?{task_query['query_key']}={{task_id}}" if task_query.get('query_key') else ''
+    base = task_query.get('base') or context.base_url
+    return base + path + suffix, path + suffix
+
+def render_task_polling(endpoint: EndpointModel, task_query: Dict, context: RenderContext) -> str:
+    """渲染任务轮询段落：提交任务后按指数退避轮询同一文件夹中的查询端点"""
+    values = code_sample_values(endpoint)
+    values['body_python'] = format_python_literal(endpoint.example_obj) if endpoint.example_obj else '{}'
+    values['query_url'], query_path = task_query_url(task_query, context)
+    name = re.sub(r'[{}<>`*_\[\]]', '', task_query.get('name', '')).strip()
+    query = f"`GET {query_path}`" + (f" ({name})" if name else '')
+    parts = ["## Task Polling\n\n", TASK_POLLING_INTRO.format(query=query), "<CodeGroup>\n\n"]
+    for _, template in TASK_POLLING_CODE_SAMPLE_TEMPLATES:
+        parts.append(template.render(values))
+    parts.append("</CodeGroup>\n\n")
+    return ''.join(parts)
+
+def render_code_group(endpoint: EndpointModel) -> str:
+    """渲染请求示例段落（标题和 CodeGroup）"""
+    return "## Request Example\n\n" + render_code_samples(endpoint)
+
+# 当前进程渲染时可查找的跨运行请求示例缓存（键见 code_sample_key）：主进程中是
+# SampleCache.entries 本身，渲染工作进程中是进程启动时的快照；为 None 时不使用缓存
+_SAMPLE_BLOCKS: Optional[Dict[str, str]] = None
+
+def install_sample_blocks(blocks: Optional[Dict[str, str]]):
+    """设置当前进程查找的请求示例代码块（同时用作渲染进程池的 initializer）"""
+    global _SAMPLE_BLOCKS
+    _SAMPLE_BLOCKS = blocks
+
+def code_sample_key(endpoint: EndpointModel) -> str:
+    """请求示例代码块的缓存键：代码块只由方法、完整 URL、流式格式和原始请求体决定
+
+    模板本身不参与计算，模板变化时 SampleCache 整体作废。
+    """
+    raw = endpoint.request_body.get('raw') or ''
+    payload = '\0'.join((endpoint.method, endpoint.full_url, endpoint.stream_format or '', str(raw)))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def cached_code_samples(endpoint: EndpointModel) -> Tuple[str, Optional[Tuple[str, Optional[str]]]]:
+    """渲染请求示例的 CodeGroup 代码块，优先使用跨运行缓存
+
+    Returns:
+        (代码块, 缓存结果)；缓存结果为 (缓存键, 新渲染的代码块，命中时为 None)，
+        由主进程交给 SampleCache.record；未启用缓存时为 None
+    """
+    if _SAMPLE_BLOCKS is None:
+        return render_code_samples(endpoint), None
+    key = code_sample_key(endpoint)
+    block = _SAMPLE_BLOCKS.get(key)
+    if block is not None:
+        return block, (key, None)
+    block = render_code_samples(endpoint)
+    return block, (key, block)
+
+_SNIPPET_NAME_RE = re.compile(r'code-[0-9a-f]{16}')
+
+def snippet_name(block: str) -> str:
+    """共享 snippet 的文件名（不含扩展名），由内容哈希决定"""
+    return 'code-' + hashlib.sha256(block.encode('utf-8')).hexdigest()[:16]
+
+def snippet_reference(name: str) -> str:
+    """页面中引用共享 snippet 的 MDX（导入语句和组件）"""
+    return f"import CodeSample from '/{SNIPPETS_DIRNAME}/{name}.mdx';\n\n<CodeSample />\n\n"
+
+def search_record(endpoint: EndpointModel) -> Dict[str, Any]:
+    """搜索索引中单个端点的方法、路径和参数名（路径、查询和请求体参数，去重并保持顺序）"""
+    params = [param.get('key', '') for param in endpoint.path_params]
+    params += [param.get('key', '') for param in endpoint.query_params]
+    params += [param['name'] for param in endpoint.body_params]
+    return {
+        'method': endpoint.method,
+        'path': endpoint.path,
+        'params': [name for name in dict.fromkeys(params) if name]
+    }
+
+def generate_api_doc(api_info: Dict, folder_path: str, context: Optional[RenderContext] = None) -> str:
+    """为单个 API 生成 MDX 文档
+
+    Args:
+        api_info: API 信息字典
+        folder_path: 文件夹路径
+        context: 渲染上下文；为 None 时使用全局 Config
+
+    Returns:
+        生成的 MDX 文档内容
+    """
+    return build_api_doc(api_info, folder_path, context)[0]
+
+def build_api_doc(
+    api_info: Dict,
+    folder_path: str,
+    context: Optional[RenderContext] = None
+) -> Tuple[str, Dict[str, str], Optional[Dict[str, Any]], Optional[Tuple[str, Optional[str]]]]:
+    """为单个 API 生成 MDX 文档、其引用的共享 snippet、搜索索引记录和请求示例缓存结果
+
+    Args:
+        api_info: API 信息字典
+        folder_path: 文件夹路径
+        context: 渲染上下文；为 None 时使用全局 Config
+
+    Returns:
+        (MDX 文档内容, {snippet 名称: snippet 内容}, 搜索索引记录, 请求示例缓存结果)；
+        未启用共享 snippet 时字典为空，未启用搜索索引时记录为 None，
+        缓存结果见 cached_code_samples
+    """
+    if context is None:
+        context = RenderContext.from_config()
+
+    endpoint = EndpointModel(api_info, context)
+    name = endpoint.name
+    description = endpoint.description
+
+    # 开始生成 MDX 内容
+    parts = [FRONTMATTER_TEMPLATE.render({
+        'name': name,
+        'method': endpoint.method,
+        'path': endpoint.path,
+        'summary': description or name,
+        'overview': description or f'This endpoint provides {name.lower()} functionality.',
+    })]
+
+    # 添加认证
+    parts.append(AUTHENTICATION_SECTION)
+
+    # 添加路径参数
+    if endpoint.path_params:
+        parts.append("## Path Parameters\n\n")
+        for param in endpoint.path_params:
+            param_name = param.get('key', '')
+            parts.append(PATH_PARAM_TEMPLATE.render({
+                'name': param_name,
+                'description': param.get('description', f'{param_name} parameter'),
+            }))
+
+    # 添加查询参数
+    if endpoint.query_params:
+        parts.append("## Query Parameters\n\n")
+        for param in endpoint.query_params:
+            param_name = param.get('key', '')
+            parts.append(QUERY_PARAM_TEMPLATE.render({
+                'name': param_name,
+                'description': param.get('description', f'{param_name} parameter'),
+            }))
+
+    # 添加请求体
+    if endpoint.request_body and endpoint.body_params:
+        parts.append("## Request Body\n\n")
+
+        for param in endpoint.body_params:
+            param_default = param.get('default', '')
+            values = {
+                'name': param['name'],
+                'type': param['type'],
+                'description': param['description'],
+                'required': 'required' if param['required'] else '',
+                'default': param_default,
+            }
+            # 将默认值作为 default 属性
+            template = BODY_PARAM_DEFAULT_TEMPLATE if param_default else BODY_PARAM_TEMPLATE
+            parts.append(template.render(values))
+
+    # 添加请求示例（相同的示例代码块共享同一个 snippet 文件）
+    snippets: Dict[str, str] = {}
+    sample = None
+    if endpoint.body_mode == 'raw':
+        block, sample = cached_code_samples(endpoint)
+        if context.shared_snippets:
+            name = snippet_name(block)
+            snippets[name] = block
+            parts.append("## Request Example\n\n" + snippet_reference(name))
+        else:
+            parts.append("## Request Example\n\n" + block)
+        # 流式端点的示例本身已是增量消费，不再附加批量客户端
+        if context.production_samples and endpoint.stream_format is None:
+            parts.append(render_production_client(endpoint))
+        # 异步任务的提交端点：附加提交后轮询同一文件夹中查询端点的示例
+        task_query = api_info.get(TASK_QUERY_KEY)
+        if task_query and endpoint.stream_format is None:
+            parts.append(render_task_polling(endpoint, task_query, context))
+
+    # 添加响应和错误响应
+    parts.append(RESPONSE_SECTION)
+    parts.append(ERROR_RESPONSES_SECTION)
+
+    # 搜索索引复用本次解析出的参数，不再单独遍历请求体
+    search = search_record(endpoint) if context.search_index else None
+
+    return ''.join(parts), snippets, search, sample
+
+def render_endpoint(
+    api_info: Dict,
+    folder_path: str,
+    context: Optional[RenderContext] = None
+) -> Tuple[str, float, Dict[str, str], Optional[Dict[str, Any]], Optional[Tuple[str, Optional[str]]]]:
+    """渲染单个端点并返回 (MDX 内容, 渲染耗时秒数, 引用的共享 snippet, 搜索索引记录, 请求示例缓存结果)
+
+    并行渲染时在工作进程中计时，耗时不包含进程间传输和排队等待。
+    """
+    start = time.perf_counter()
+    content, snippets, search, sample = build_api_doc(api_info, folder_path, context)
+    return content, time.perf_counter() - start, snippets, search, sample
+
+class NavigationNode:
+    """导航树节点
+
+    children 保持插入顺序（决定 mint.json 中的页面顺序），
+    另外按名称索引文件夹子节点，查找子文件夹为 O(1)。
+    索引在加入第一个子文件夹时才创建，API 叶子节点和只含 API 的文件夹共享一个只读的空映射。
+    """
+    __slots__ = ('name', 'is_folder', 'children', 'file_path', '_folders')
+
+    _NO_FOLDERS: 'MappingProxyType[str, NavigationNode]' = MappingProxyType({})
+
+    def __init__(self, name: str, is_folder: bool = True):
+        self.name = name
+        self.is_folder = is_folder
+        self.children: List[NavigationNode] = []
+        self.file_path: Optional[str] = None
+        self._folders = self._NO_FOLDERS
+
+    def add_child(self, child: 'NavigationNode'):
+        self.children.append(child)
+        # 同名文件夹以先加入的为准，与按顺序线性查找的结果一致
+        if child.is_folder and child.name not in self._folders:
+            if self._folders is self._NO_FOLDERS:
+                self._folders = {}
+            self._folders[child.name] = child
+
+    def get_folder(self, name: str) -> Optional['NavigationNode']:
+        """按名称查找文件夹子节点"""
+        return self._folders.get(name)
+
+    def get_or_add_folder(self, name: str) -> 'NavigationNode':
+        """查找文件夹子节点，不存在时在末尾创建"""
+        folder = self._folders.get(name)
+        if folder is None:
+            folder = NavigationNode(name, is_folder=True)
+            self.add_child(folder)
+        return folder
+
+    def to_dict(self) -> Dict:
+        """转换为 mint.json 的导航格式"""
+        if not self.is_folder:
+            # 叶子节点：直接返回文件路径
+            return self.file_path
+        else:
+            # 文件夹节点：返回包含子节点的字典
+            if not self.children:
+                return {}
+
+            result = {
+                "group": self.name,
+                "pages": []
+            }
+
+            for child in self.children:
+                child_dict = child.to_dict()
+                if child_dict:  # 只添加非空的子节点
+                    result["pages"].append(child_dict)
+
+            return result if result["pages"] else {}
+
+def compute_item_hash(item: Dict) -> str:
+    """计算单个 API 输入项的内容哈希
+
+    Args:
+        item: Apifox 中的 API 定义
+
+    Returns:
+        SHA-256 十六进制摘要（键排序后序列化，与原始字段顺序无关）
+    """
+    payload = json.dumps(item, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class BuildManifest:
+    """增量生成清单
+
+    记录每个端点输入项的哈希、输出路径以及生成器版本，
+    下次运行时只有新增或变更的端点会被重新渲染和写入。
+    上次生成过而本次不再生成的输出路径即为需要清理的孤立文件。
+    """
+    def __init__(self, path: Path, settings: Dict[str, Any], previous: Optional[Dict[str, Dict]] = None,
+                 previous_outputs: Optional[Iterable[str]] = None,
+                 previous_snippets: Optional[Iterable[str]] = None):
+        self.path = path
+        self.settings = settings
+        self.previous: Dict[str, Dict] = previous or {}
+        # 上次运行已知的全部输出路径；即使设置变化或 --force 忽略了哈希，也仍然需要据此清理
+        if previous_outputs is None:
+            previous_outputs = (entry.get('output') for entry in self.previous.values())
+        self.previous_outputs = {output for output in previous_outputs if output}
+        if previous_snippets is None:
+            previous_snippets = (name for entry in self.previous.values() for name in entry.get('snippets', []))
+        self.previous_snippets = set(previous_snippets)
+        self.entries: Dict[str, Dict] = {}
+        self.seen: set = set()
+        self.claimed: set = set()
+        self.orphans: List[str] = []
+        self.orphan_snippets: List[str] = []
+        self.stats = {'added': 0, 'changed': 0, 'unchanged': 0, 'removed': 0}
+
+    @classmethod
+    def load(cls, path: Path, settings: Dict[str, Any], force: bool = False) -> 'BuildManifest':
+        """读取已有清单；生成设置（版本、基础URL）不一致时视为全部变更
+
+        Args:
+            path: 清单文件路径
+            settings: 当前运行的生成设置
+            force: 为 True 时忽略已有清单中的哈希（仍保留输出路径用于清理孤立文件）
+
+        Returns:
+            清单对象
+        """
+        previous: Dict[str, Dict] = {}
+        previous_outputs: List[str] = []
+        previous_snippets: List[str] = []
+        if path.exists():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                endpoints = data.get('endpoints', {})
+                previous_outputs = [entry.get('output') for entry in endpoints.values()]
+                previous_outputs.extend(data.get('orphans', []))
+                previous_snippets = [name for entry in endpoints.values() for name in entry.get('snippets', [])]
+                previous_snippets.extend(data.get('orphan_snippets', []))
+                if data.get('settings') != settings:
+                    logger.info("Generator settings changed, regenerating all endpoints")
+                elif not force:
+                    previous = endpoints
+            except (OSError, json.JSONDecodeError, AttributeError) as e:
+                logger.warning(f"Failed to read manifest {path}: {e}")
+        return cls(path, settings, previous, previous_outputs, previous_snippets)
+
+    def needs_render(self, key: str, item_hash: str, relative_path: str, filepath: Path) -> bool:
+        """判断端点是否需要重新生成，并累计 added/changed/unchanged 计数
+
+        同一次运行中重复出现的 key 总是重新生成，避免互相覆盖后被误判为未变更。
+        """
+        old = self.previous.get(key)
+        self.claimed.add(relative_path)
+        if key in self.seen:
+            self.stats['changed'] += 1
+            return True
+        self.seen.add(key)
+        if old is None:
+            self.stats['added'] += 1
+            return True
+        if old.get('hash') != item_hash or old.get('output') != relative_path or not filepath.exists():
+            self.stats['changed'] += 1
+            return True
+        self.stats['unchanged'] += 1
+        return False
+
+    def record(self, key: str, item_hash: str, relative_path: str, snippets: Optional[List[str]] = None,
+               search: Optional[Dict[str, Any]] = None):
+        """记录本次运行中成功生成（或确认未变更）的端点
+
+        snippets 和 search 为 None（端点未重新渲染）时沿用上次记录的共享 snippet 和搜索索引记录。
+        """
+        previous = self.previous.get(key, {})
+        if snippets is None:
+            snippets = previous.get('snippets', [])
+        if search is None:
+            search = previous.get('search')
+        entry = {'hash': item_hash, 'output': relative_path}
+        if snippets:
+            entry['snippets'] = snippets
+        if search is not None:
+            entry['search'] = search
+        self.entries[key] = entry
+
+    def finalize(self) -> List[str]:
+        """统计已被移除的端点
+
+        Returns:
+            上次存在而本次未出现的端点 key 列表
+        """
+        removed = [key for key in self.previous if key not in self.seen]
+        self.stats['removed'] = len(removed)
+        return removed
+
+    def stale_outputs(self) -> List[str]:
+        """上次生成过、本次没有任何端点再生成的输出路径（已排序）
+
+        本次渲染失败的端点仍然占用其输出路径，旧文件不会被当作孤立文件。
+        """
+        return sorted(self.previous_outputs - self.claimed)
+
+    def stale_snippets(self) -> List[str]:
+        """上次引用过、本次没有任何端点再引用的共享 snippet 名称（已排序）
+
+        本次渲染失败的端点仍保留旧页面，其引用的 snippet 不会被当作孤立文件。
+        """
+        referenced = {name for entry in self.entries.values() for name in entry.get('snippets', [])}
+        for key in self.seen - self.entries.keys():
+            referenced.update(self.previous.get(key, {}).get('snippets', []))
+        return sorted(self.previous_snippets - referenced)
+
+    def save(self, writer: Optional[OutputWriter] = None):
+        """写回清单文件（内容未变化时不写入）
+
+        未能清理（或仅预览）的孤立文件记录在 orphans 中，下次运行继续清理。
+        """
+        data = {
+            'settings': self.settings,
+            'endpoints': self.entries
+        }
+        if self.orphans:
+            data['orphans'] = self.orphans
+        if self.orphan_snippets:
+            data['orphan_snippets'] = self.orphan_snippets
+        (writer or OutputWriter()).write_json(self.path, data)
+
+def output_file_path(output_base: Path, relative_path: str) -> Optional[Path]:
+    """将清单中的输出路径（docs/api/...，不含扩展名）还原为输出目录下的 .mdx 文件
+
+    路径不在 docs/api/ 下或包含 .. 时返回 None，避免清理到输出目录之外。
+    """
+    prefix = 'docs/api/'
+    if not relative_path.startswith(prefix):
+        return None
+    parts = relative_path[len(prefix):].split('/')
+    if any(part in ('', '.', '..') for part in parts):
+        return None
+    return output_base.joinpath(*parts[:-1], f"{parts[-1]}.mdx")
+
+def prune_outputs(manifest: BuildManifest, output_base: Path, dry_run: bool = False) -> List[Path]:
+    """删除不再生成的孤立文件，以及因此变空的目录
+
+    只处理清单中记录的过期输出，不遍历输出目录，耗时与孤立文件数量成正比。
+    删除失败的文件记录到 manifest.orphans，下次运行继续清理。
+
+    Args:
+        manifest: 已完成本次生成的清单
+        output_base: 输出基础路径
+        dry_run: 为 True 时只列出将被删除的文件和目录
+
+    Returns:
+        已删除（或 dry_run 时将被删除）的文件和目录列表
+    """
+    pruned: List[Path] = []
+    removed: set = set()
+    candidates: set = set()
+    orphans: List[str] = []
+
+    for relative_path in manifest.stale_outputs():
+        filepath = output_file_path(output_base, relative_path)
+        if filepath is None:
+            logger.warning(f"Ignoring invalid output path in manifest: {relative_path}")
+            continue
+        if not filepath.exists():
+            continue
+        if dry_run:
+            orphans.append(relative_path)
+        else:
+            try:
+                filepath.unlink()
+            except OSError as e:
+                logger.warning(f"Failed to remove stale file {filepath}: {e}")
+                orphans.append(relative_path)
+                continue
+        pruned.append(filepath)
+        removed.add(filepath)
+        candidates.add(filepath.parent)
+
+    # 自底向上删除变空的目录（不删除输出根目录本身）
+    root = output_base.resolve()
+    for directory in sorted(candidates, key=lambda path: len(path.parts), reverse=True):
+        while directory.resolve() != root and directory not in removed:
+            try:
+                if any(child not in removed for child in directory.iterdir()):
+                    break
+                if not dry_run:
+                    directory.rmdir()
+            except OSError:
+                break
+            pruned.append(directory)
+            removed.add(directory)
+            directory = directory.parent
+
+    manifest.orphans = orphans
+    return pruned
+
+def prune_snippets(manifest: BuildManifest, snippets_dir: Path, dry_run: bool = False) -> List[Path]:
+    """删除不再被任何页面引用的共享 snippet 文件
+
+    Args:
+        manifest: 已完成本次生成的清单
+        snippets_dir: 共享 snippet 目录
+        dry_run: 为 True 时只列出将被删除的文件
+
+    Returns:
+        已删除（或 dry_run 时将被删除）的文件列表
+    """
+    pruned: List[Path] = []
+    orphans: List[str] = []
+
+    for name in manifest.stale_snippets():
+        if not _SNIPPET_NAME_RE.fullmatch(name):
+            logger.warning(f"Ignoring invalid snippet name in manifest: {name}")
+            continue
+        filepath = snippets_dir / f"{name}.mdx"
+        if not filepath.exists():
+            continue
+        if dry_run:
+            orphans.append(name)
+        else:
+            try:
+                filepath.unlink()
+            except OSError as e:
+                logger.warning(f"Failed to remove stale snippet {filepath}: {e}")
+                orphans.append(name)
+                continue
+        pruned.append(filepath)
+
+    # snippet 目录由生成器独占，清空后一并删除
+    if pruned and not dry_run:
+        try:
+            snippets_dir.rmdir()
+            pruned.append(snippets_dir)
+        except OSError:
+            pass
+
+    manifest.orphan_snippets = orphans
+    return pruned
+
+def register_folder(folder_path: List[str], navigation_tree: Dict[str, NavigationNode]):
+    """进入含子项的目录时登记顶级分类节点
+
+    Args:
+        folder_path: 目录路径列表（包含当前目录）
+        navigation_tree: 导航树字典，key 为顶级分类名
+    """
+    # 确定顶级分类（第一层目录）
+    top_category = folder_path[0] if folder_path else 'Other'
+
+    # 创建或获取导航节点
+    if top_category not in navigation_tree:
+        navigation_tree[top_category] = NavigationNode(top_category, is_folder=True)
+
+class EndpointJob:
+    """单个端点的生成任务：规划好的输出路径和是否需要重新渲染"""
+    __slots__ = ('item', 'folder_path', 'api_name', 'filepath', 'relative_path',
+                 'endpoint_key', 'item_hash', 'needs_render', 'snippets', 'search')
+
+    def __init__(self, item: Dict, folder_path: List[str], api_name: str, filepath: Path,
+                 relative_path: str, endpoint_key: str, item_hash: str, needs_render: bool):
+        self.item = item
+        self.folder_path = folder_path
+        self.api_name = api_name
+        self.filepath = filepath
+        self.relative_path = relative_path
+        self.endpoint_key = endpoint_key
+        self.item_hash = item_hash
+        self.needs_render = needs_render
+        # 渲染后引用的共享 snippet 名称和搜索索引记录；未渲染时为 None
+        self.snippets: Optional[List[str]] = None
+        self.search: Optional[Dict[str, Any]] = None
+
+class ApiRecord:
+    """成功生成的单个端点的摘要记录（导航名称、所在文件夹、输出路径和清单键）"""
+    __slots__ = ('name', 'folder_path', 'relative_path', 'endpoint_key')
+
+    def __init__(self, name: str, folder_path: List[str], relative_path: str, endpoint_key: str):
+        self.name = name
+        self.folder_path = folder_path
+        self.relative_path = relative_path
+        self.endpoint_key = endpoint_key
+
+class ApiTally:
+    """端点提取结果的计数，每提交一个端点即时累加
+
+    _summary.json 只需要端点总数和生成的文件数；只有需要逐个端点的信息时
+    （构建搜索索引）才保留 ApiRecord 列表，否则内存不随端点数增长。
+    """
+    __slots__ = ('total', 'generated', 'failed', 'records')
+
+    def __init__(self, keep_records: bool = False):
+        self.total = 0
+        self.generated = 0
+        self.failed = 0
+        self.records: Optional[List[ApiRecord]] = [] if keep_records else None
+
+    def add(self, record: Optional[ApiRecord], generated: int):
+        """累加一个端点的提交结果；record 为 None 表示生成失败"""
+        self.generated += generated
+        if record is None:
+            self.failed += 1
+            return
+        self.total += 1
+        if self.records is not None:
+            self.records.append(record)
+
+class OutputPlanner:
+    """输出路径规划
+
+    缓存每个文件夹路径的清理结果和输出目录，每个目录只创建一次；
+    按输入顺序分配输出文件，名称清理后相同的端点不会互相覆盖：
+    先出现的端点保留原文件名，之后的端点依次加上 -2、-3 等后缀。
+    """
+    def __init__(self, output_base: Path, writer: Optional[OutputWriter] = None):
+        self.output_base = output_base
+        self.writer = writer or OutputWriter()
+        self.folders: Dict[Tuple[str, ...], Tuple[Path, List[str]]] = {}
+        self.created: set = set()
+        self.claimed: Dict[str, str] = {}
+        self.keys: Dict[str, int] = {}
+        self.collisions = 0
+
+    def folder(self, folder_path: List[str]) -> Tuple[Path, List[str]]:
+        """返回文件夹路径对应的 (输出目录, 清理后的路径片段)，首次出现时创建目录"""
+        cache_key = tuple(folder_path)
+        cached = self.folders.get(cache_key)
+        if cached is None:
+            # 第一级目录作为主分类，后续路径作为子目录
+            parts = [sanitize_folder_name(name) for name in folder_path]
+            output_dir = self.output_base.joinpath(*parts)
+            if output_dir not in self.created:
+                self.writer.ensure_dir(output_dir)
+                self.created.add(output_dir)
+            cached = self.folders[cache_key] = (output_dir, parts)
+        return cached
+
+    def plan(self, item: Dict, folder_path: List[str], manifest: Optional[BuildManifest] = None) -> Optional[EndpointJob]:
+        """确定单个 API 的输出路径，并根据清单判断是否需要重新渲染
+
+        Args:
+            item: API 定义（包含 request 字段）
+            folder_path: API 所在的文件夹路径列表
+            manifest: 增量生成清单；为 None 时总是重新生成
+
+        Returns:
+            生成任务；顶层的 API 没有分类，返回 None
+        """
+        api_name = item.get('name', 'Unnamed')
+
+        # 确定输出路径（顶层的 API 没有分类，不生成文档）
+        if len(folder_path) < 1:
+            return None
+
+        output_dir, parts = self.folder(folder_path)
+
+        # 端点标识：目录路径 + API 名称；同一目录下的同名 API 加上序号区分
+        endpoint_key = '/'.join(folder_path + [api_name])
+        occurrence = self.keys.get(endpoint_key, 0) + 1
+        self.keys[endpoint_key] = occurrence
+        if occurrence > 1:
+            endpoint_key = f"{endpoint_key}#{occurrence}"
+
+        # 生成文件名和相对于 docs/api 的路径（用于 mint.json）
+        prefix = "docs/api/" + "/".join(parts) + "/"
+        filename = sanitize_filename(api_name)
+        relative_path = prefix + filename
+        if relative_path in self.claimed:
+            suffix = 2
+            while f"{relative_path}-{suffix}" in self.claimed:
+                suffix += 1
+            logger.warning(
+                f"Output path collision: '{endpoint_key}' and '{self.claimed[relative_path]}' "
+                f"both map to {relative_path}.mdx, using {filename}-{suffix}.mdx"
+            )
+            filename = f"{filename}-{suffix}"
+            relative_path = prefix + filename
+            self.collisions += 1
+        self.claimed[relative_path] = endpoint_key
+        filepath = output_dir / f"{filename}.mdx"
+
+        item_hash = compute_item_hash(item) if manifest else ''
+        needs_render = manifest is None or manifest.needs_render(endpoint_key, item_hash, relative_path, filepath)
+
+        return EndpointJob(item, folder_path, api_name, filepath, relative_path,
+                           endpoint_key, item_hash, needs_render)
+
+def plan_api_item(
+    item: Dict,
+    folder_path: List[str],
+    planner: OutputPlanner,
+    manifest: Optional[BuildManifest] = None
+) -> Optional[EndpointJob]:
+    """确定单个 API 的输出路径，并根据清单判断是否需要重新渲染
+
+    Args:
+        item: API 定义（包含 request 字段）
+        folder_path: API 所在的文件夹路径列表
+        planner: 本次运行共用的路径规划器，在整个序列中检测文件名冲突
+        manifest: 增量生成清单；为 None 时总是重新生成
+
+    Returns:
+        生成任务；顶层的 API 没有分类，返回 None
+    """
+    return planner.plan(item, folder_path, manifest)
+
+def add_api_to_navigation(
+    navigation_tree: Dict[str, NavigationNode],
+    folder_path: List[str],
+    api_name: str,
+    relative_path: str
+):
+    """将 API 页面加入导航树，按需创建中间的文件夹节点"""
+    top_category = folder_path[0]
+    if top_category not in navigation_tree:
+        return
+
+    # 找到或创建正确的父节点
+    current_node = navigation_tree[top_category]
+
+    # 遍历中间路径，创建必要的文件夹节点
+    for i in range(1, len(folder_path)):
+        current_node = current_node.get_or_add_folder(folder_path[i])
+
+    # 添加 API 文件节点
+    api_node = NavigationNode(api_name, is_folder=False)
+    api_node.file_path = relative_path
+    current_node.add_child(api_node)
+
+def write_api_job(
+    job: EndpointJob,
+    content: str,
+    writer: Optional[OutputWriter] = None,
+    snippets: Optional[Dict[str, str]] = None,
+    snippet_store: Optional[SnippetStore] = None
+) -> float:
+    """写入渲染结果（内容与磁盘一致时跳过），可在写入线程中执行
+
+    Args:
+        job: 生成任务
+        content: MDX 内容
+        writer: 文件输出层；为 None 时使用一次性的 OutputWriter
+        snippets: 页面引用的共享 snippet，先于页面写入
+        snippet_store: 共享 snippet 输出
+
+    Returns:
+        写入耗时（秒）
+    """
+    start = time.perf_counter()
+    if snippets:
+        if snippet_store is None:
+            raise ValueError("shared snippets were rendered but no snippet store is configured")
+        snippet_store.add(snippets)
+    if (writer or OutputWriter()).write_text(job.filepath, content):
+        logger.debug(f"Generated: {job.filepath}")
+    else:
+        logger.debug(f"Up to date: {job.filepath}")
+    return time.perf_counter() - start
+
+def commit_api_job(
+    job: EndpointJob,
+    complete: Optional[Callable[[], Tuple[float, float]]],
+    navigation_tree: Dict[str, NavigationNode],
+    manifest: Optional[BuildManifest] = None,
+    metrics: Optional[BuildMetrics] = None
+) -> Tuple[Optional[ApiRecord], int]:
+    """确认端点已渲染并写入，记录清单并加入导航树
+
+    Args:
+        job: 生成任务
+        complete: 等待渲染和写入完成并返回 (渲染耗时, 写入耗时) 的回调，
+            渲染或写入失败时抛出异常；job.needs_render 为 False 时不会被调用
+        navigation_tree: 导航树字典
+        manifest: 增量生成清单
+        metrics: 耗时统计；记录每个重新渲染的端点的渲染和写入耗时
 
-            # 生成文件名和路径
-            filename = sanitize_filename(api_name)
-            filepath = output_dir / f"{filename}.mdx"
+    Returns:
+        (API 摘要记录，失败时为 None, 生成的文件数量)
+    """
+    generated_count = 0
+
+    try:
+        if job.needs_render:
+            render_seconds, write_seconds = complete()
+            if metrics is not None:
+                metrics.record_endpoint(job.endpoint_key, render_seconds, write_seconds)
+
+            generated_count += 1
+        else:
+            logger.debug(f"Unchanged: {job.filepath}")
+
+        if manifest is not None:
+            manifest.record(job.endpoint_key, job.item_hash, job.relative_path, job.snippets, job.search)
+
+        # 添加到导航树
+        add_api_to_navigation(navigation_tree, job.folder_path, job.api_name, job.relative_path)
+
+        return ApiRecord(job.api_name, job.folder_path, job.relative_path, job.endpoint_key), generated_count
+
+    except Exception as e:
+        logger.error(f"Failed to generate doc for '{job.api_name}': {e}")
+        return None, generated_count
+
+def _resolved(fn: Callable, *args) -> Future:
+    """同步执行 fn，返回保存其结果或异常的已完成 Future"""
+    future: Future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+def generate_endpoints(
+    endpoints: Iterable[Tuple[List[str], Dict]],
+    output_base: Path,
+    navigation_tree: Dict[str, NavigationNode],
+    manifest: Optional[BuildManifest] = None,
+    context: Optional[RenderContext] = None,
+    jobs: int = 1,
+    writer: Optional[OutputWriter] = None,
+    metrics: Optional[BuildMetrics] = None,
+    planner: Optional[OutputPlanner] = None,
+    write_threads: int = DEFAULT_WRITE_THREADS,
+    snippet_store: Optional[SnippetStore] = None,
+    keep_records: bool = False,
+    sample_cache: Optional['SampleCache'] = None
+) -> ApiTally:
+    """为端点序列生成文档
+
+    生成按流水线进行：主线程遍历并规划输出路径，渲染在主线程或工作进程
+    （jobs > 1）中执行，写入交给写入线程池，与后续端点的渲染重叠。
+    清单记录和导航树构建在主线程中按输入顺序进行，输出与串行运行完全一致。
+    各阶段之间的在途任务数有上限，因此流式输入时内存仍然有界。
+
+    Args:
+        endpoints: (文件夹路径列表, API 定义) 序列
+        output_base: 输出基础路径
+        navigation_tree: 导航树字典
+        manifest: 增量生成清单
+        context: 渲染上下文；为 None 时使用全局 Config
+        jobs: 渲染进程数
+        writer: 文件输出层，用于统计实际写入的文件数
+        metrics: 耗时统计
+        planner: 输出路径规划器，在整个序列中检测文件名冲突
+        write_threads: 写入线程数；为 0 时在主线程中同步写入
+        snippet_store: 共享 snippet 输出（context.shared_snippets 为 True 时必需）
+        keep_records: 是否保留每个端点的 ApiRecord（构建搜索索引时需要）
+        sample_cache: 跨运行的请求示例缓存；渲染结果按输入顺序在主线程中记录
+
+    Returns:
+        端点总数、生成的文件数量和（可选的）摘要记录
+    """
+    if context is None:
+        context = RenderContext.from_config()
+    if writer is None:
+        writer = OutputWriter()
+    if planner is None:
+        planner = OutputPlanner(output_base, writer)
+
+    tally = ApiTally(keep_records)
+
+    max_pending = max(jobs, write_threads, 1) * 8
+    # 等待渲染结果的任务（仅 jobs > 1）和等待写入完成的任务，均按输入顺序排列
+    rendering: Deque[Tuple[EndpointJob, Future]] = deque()
+    writing: Deque[Tuple[EndpointJob, Optional[Future]]] = deque()
+
+    with ExitStack() as stack:
+        if sample_cache is not None:
+            # 主进程直接查找缓存本身，工作进程使用启动时的快照，新渲染的代码块交回主进程记录
+            install_sample_blocks(sample_cache.entries)
+            stack.callback(install_sample_blocks, None)
+            pool_options = {'initializer': install_sample_blocks, 'initargs': (dict(sample_cache.entries),)}
+        else:
+            pool_options = {}
+        render_pool = stack.enter_context(
+            ProcessPoolExecutor(max_workers=jobs, **pool_options)
+        ) if jobs > 1 else None
+        write_pool = stack.enter_context(
+            ThreadPoolExecutor(max_workers=write_threads, thread_name_prefix='writer')
+        ) if write_threads > 0 else None
+
+        def commit_oldest():
+            job, future = writing.popleft()
+            tally.add(*commit_api_job(job, future.result if future else None, navigation_tree, manifest, metrics))
+
+        def queue_write(job: EndpointJob, rendered: Optional[Future]):
+            """渲染完成后提交写入；渲染失败的任务直接进入提交队列，由 commit_api_job 记录错误"""
+            future = rendered
+            if rendered is not None and rendered.exception() is None:
+                content, render_seconds, snippets, job.search, sample = rendered.result()
+                job.snippets = sorted(snippets)
+                if sample is not None and sample_cache is not None:
+                    sample_cache.record(*sample)
+
+                def write() -> Tuple[float, float]:
+                    return render_seconds, write_api_job(job, content, writer, snippets, snippet_store)
+
+                future = write_pool.submit(write) if write_pool else _resolved(write)
+            writing.append((job, future))
+            if len(writing) >= max_pending:
+                commit_oldest()
+
+        def write_oldest():
+            queue_write(*rendering.popleft())
+
+        for folder_path, item in endpoints:
+            job = plan_api_item(item, folder_path, planner, manifest)
+            if job is None:
+                continue
+
+            if not job.needs_render:
+                # 未变化的端点也要排队，保证导航顺序与输入一致
+                if rendering:
+                    rendering.append((job, None))
+                else:
+                    queue_write(job, None)
+            elif render_pool is None:
+                queue_write(job, _resolved(render_endpoint, item, '/'.join(folder_path), context))
+            else:
+                rendering.append((job, render_pool.submit(render_endpoint, item, '/'.join(folder_path), context)))
+
+            if len(rendering) >= max_pending:
+                write_oldest()
+
+        while rendering:
+            write_oldest()
+        while writing:
+            commit_oldest()
 
-            # 相对于 docs/api 的路径（用于 mint.json）
-            relative_parts = [category] + sub_folders + [filename]
-            relative_path = "docs/api/" + "/".join(relative_parts)
+    return tally
 
-            # 生成文档内容
+class JsonStreamReader:
+    """分块读取的增量 JSON 读取器
+
+    只在缓冲区中保留尚未消费的文本，调用方按结构逐个读取对象键、数组元素或完整的值，
+    峰值内存取决于单个被完整读取的值，而不是整个文件。
+    """
+    _WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+    def __init__(self, fp, chunk_size: int = 1 << 16):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """丢弃已消费的文本并读取下一块；缓冲区按当前大小倍增以避免重复解析"""
+        if self._eof:
+            return False
+        if self._pos:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        chunk = self._fp.read(max(self._chunk_size, len(self._buf)))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf += chunk
+        return True
+
+    def peek(self) -> str:
+        """跳过空白并返回下一个字符，文件结束时返回空字符串"""
+        while True:
+            self._pos = self._WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str):
+        """消费指定的结构字符"""
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._buf, self._pos)
+        self._pos += 1
+
+    def read_value(self) -> Any:
+        """完整读取下一个 JSON 值"""
+        self.peek()
+        while True:
             try:
-                content = generate_api_doc(item, '/'.join(folder_path))
-
-                # 写入文件
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(content)
-
-                generated_count += 1
-                logger.debug(f"Generated: {filepath}")
-
-                # 添加到导航树
-                top_category = folder_path[0]
-                if top_category in navigation_tree:
-                    # 找到或创建正确的父节点
-                    current_node = navigation_tree[top_category]
-
-                    # 遍历中间路径，创建必要的文件夹节点
-                    for i in range(1, len(folder_path)):
-                        folder_name = folder_path[i]
-                        # 查找是否已存在该文件夹节点
-                        found = False
-                        for child in current_node.children:
-                            if child.is_folder and child.name == folder_name:
-                                current_node = child
-                                found = True
-                                break
-
-                        if not found:
-                            # 创建新的文件夹节点
-                            new_folder_node = NavigationNode(folder_name, is_folder=True)
-                            current_node.add_child(new_folder_node)
-                            current_node = new_folder_node
-
-                    # 添加 API 文件节点
-                    api_node = NavigationNode(api_name, is_folder=False)
-                    api_node.file_path = relative_path
-                    current_node.add_child(api_node)
-
-                apis.append({
-                    'name': api_name,
-                    'folder_path': '/'.join(folder_path),
-                    'file_path': str(filepath),
-                    'relative_path': relative_path
-                })
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # 值恰好结束在缓冲区末尾时（例如被截断的数字）需要读取更多内容确认
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def iter_object(self):
+        """逐个产出对象的键；调用方必须在取下一个键之前消费对应的值"""
+        self.expect('{')
+        if self.peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self.read_value()
+            self.expect(':')
+            yield key
+            char = self.peek()
+            self._pos += 1
+            if char == '}':
+                return
+            if char != ',':
+                raise json.JSONDecodeError("Expecting ',' delimiter", self._buf, self._pos - 1)
+
+    def iter_array(self):
+        """逐个产出数组元素的位置；调用方必须在取下一个元素之前消费该元素"""
+        self.expect('[')
+        if self.peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield
+            char = self.peek()
+            self._pos += 1
+            if char == ']':
+                return
+            if char != ',':
+                raise json.JSONDecodeError("Expecting ',' delimiter", self._buf, self._pos - 1)
+
+def iter_collection_items(
+    sub_items: List[Dict],
+    folder_path: List[str],
+    on_folder: Optional[Callable[[List[str]], None]] = None
+) -> Iterator[Tuple[List[str], Dict]]:
+    """遍历已加载到内存中的集合项，逐个产出 API 定义
 
-            except Exception as e:
-                logger.error(f"Failed to generate doc for '{api_name}': {e}")
+    Args:
+        sub_items: 集合项列表
+        folder_path: 当前文件夹路径列表
+        on_folder: 进入含子项的目录时的回调，参数为目录路径列表
+
+    Yields:
+        (文件夹路径列表, API 定义)
+    """
+    # 显式栈保存每一层尚未遍历的子项，目录层数不受递归深度限制
+    stack: List[Tuple[Iterator[Dict], List[str]]] = [(iter(sub_items), folder_path)]
+    while stack:
+        items, path = stack[-1]
+        for item in items:
+            nested = item.get('item') or item.get('items')
+            if nested:
+                new_path = path + [item.get('name', '')]
+                if on_folder:
+                    on_folder(new_path)
+                stack.append((iter(nested), new_path))
+                break
+            if 'request' in item:
+                yield path, item
+        else:
+            stack.pop()
+
+# next() 的默认值，标记迭代结束
+_END = object()
+
+class _StreamFrame:
+    """流式遍历中正在读取的一个集合项对象"""
+    __slots__ = ('keys', 'path', 'fields', 'is_folder', 'items_key', 'items', 'items_path')
+
+    def __init__(self, reader: JsonStreamReader, path: List[str]):
+        self.keys = reader.iter_object()
+        self.path = path
+        self.fields: Dict[str, Any] = {}
+        self.is_folder = False
+        # 正在流式下钻的子项数组（键名、iter_array 迭代器和子项所在的目录路径）
+        self.items_key: Optional[str] = None
+        self.items: Optional[Iterator[None]] = None
+        self.items_path: List[str] = path
+
+def _iter_stream_item(
+    reader: JsonStreamReader,
+    folder_path: List[str],
+    on_folder: Optional[Callable[[List[str]], None]]
+) -> Iterator[Tuple[List[str], Dict]]:
+    """流式读取一个集合项：目录的子项边读边产出，API 定义读取完整后产出
+
+    显式栈的每一层是一个正在读取的对象，目录层数不受递归深度限制。
+    子项的优先级与 iter_collection_items 一致：非空的 item 优先于 items。只有 item
+    可以直接流式下钻；items 出现时无法确定后面是否还有非空的 item，因此完整读取，
+    在对象结束时与内存遍历一样选择子项。
+    """
+    if reader.peek() != '{':
+        reader.read_value()
+        return
+
+    stack = [_StreamFrame(reader, folder_path)]
+    while stack:
+        frame = stack[-1]
+        fields = frame.fields
+
+        if frame.items is not None:
+            # 读取子项数组的下一个元素
+            if next(frame.items, _END) is _END:
+                frame.items = None
+                if not frame.is_folder:
+                    fields[frame.items_key] = []
+                continue
+            if not frame.is_folder:
+                frame.is_folder = True
+                if on_folder:
+                    on_folder(frame.items_path)
+            if reader.peek() == '{':
+                stack.append(_StreamFrame(reader, frame.items_path))
+            else:
+                reader.read_value()
+            continue
+
+        key = next(frame.keys, _END)
+        if key is _END:
+            stack.pop()
+            if frame.is_folder:
+                continue
+            # 目录名出现在子项之后时，子项已被整体读取，回退为内存遍历
+            sub_items = fields.get('item') or fields.get('items')
+            if sub_items:
+                new_path = frame.path + [fields.get('name', '')]
+                if on_folder:
+                    on_folder(new_path)
+                yield from iter_collection_items(sub_items, new_path, on_folder)
+            elif 'request' in fields:
+                yield frame.path, fields
+            continue
+
+        # 目录名在子项之前出现时（Apifox 导出的顺序）可以直接流式下钻
+        if key == 'item' and not frame.is_folder and 'name' in fields and reader.peek() == '[':
+            frame.items_key = key
+            frame.items = reader.iter_array()
+            frame.items_path = frame.path + [fields['name']]
+        elif key == 'items' and frame.is_folder:
+            # 已经按非空的 item 展开过子项，与 iter_collection_items 一致地忽略
+            reader.read_value()
+        else:
+            fields[key] = reader.read_value()
+
+def iter_apifox_stream(
+    input_path: Path,
+    on_folder: Optional[Callable[[List[str]], None]] = None,
+    chunk_size: int = 1 << 16
+) -> Iterator[Tuple[List[str], Dict]]:
+    """流式遍历 Apifox 导出文件，逐个产出 API 定义
+
+    Args:
+        input_path: Apifox JSON 文件路径
+        on_folder: 进入含子项的目录时的回调，参数为目录路径列表
+        chunk_size: 每次读取的字符数
+
+    Yields:
+        (文件夹路径列表, API 定义)
+    """
+    with open(input_path, 'r', encoding='utf-8') as f:
+        reader = JsonStreamReader(f, chunk_size)
+        for key in reader.iter_object():
+            if key == 'item' and reader.peek() == '[':
+                for _ in reader.iter_array():
+                    yield from _iter_stream_item(reader, [], on_folder)
+            else:
+                reader.read_value()
+
+# 集合条目：(目录路径, API 定义)；API 定义为 None 表示进入一个含子项的目录
+CollectionEntry = Tuple[List[str], Optional[Dict]]
+
+def flatten_collection(apifox_data: Dict) -> List[CollectionEntry]:
+    """将 Apifox 集合展开为按遍历顺序排列的目录和 API 条目列表"""
+    entries: List[CollectionEntry] = []
+
+    def on_folder(path: List[str]):
+        entries.append((path, None))
+
+    for folder_path, item in iter_collection_items(apifox_data.get('item', []), [], on_folder):
+        entries.append((folder_path, item))
+    return entries
+
+def iter_collection_entries(
+    entries: List[CollectionEntry],
+    on_folder: Optional[Callable[[List[str]], None]] = None
+) -> Iterator[Tuple[List[str], Dict]]:
+    """按原遍历顺序重放展开后的集合，与 iter_collection_items 产出相同的序列和回调"""
+    for folder_path, item in entries:
+        if item is None:
+            if on_folder:
+                on_folder(folder_path)
+        else:
+            yield folder_path, item
+
+def merge_sources(
+    sources: List[Iterable[Tuple[List[str], Dict]]],
+    policy: str = 'rename'
+) -> Iterator[Tuple[List[str], Dict]]:
+    """按顺序串联多个输入的端点
+
+    Args:
+        sources: 每个输入文件的 (文件夹路径列表, API 定义) 序列
+        policy: 'rename' 保留所有端点，输出路径冲突由 OutputPlanner 按顺序加后缀；
+            'first' 跳过之前的输入中已出现过的端点（文件夹路径和名称都相同）
+
+    Yields:
+        (文件夹路径列表, API 定义)
+    """
+    if policy == 'rename':
+        yield from chain.from_iterable(sources)
+        return
+
+    earlier: set = set()
+    for source in sources:
+        current = set()
+        for folder_path, item in source:
+            key = '/'.join(folder_path + [item.get('name', 'Unnamed')])
+            if key in earlier:
+                logger.warning(f"Skipping '{key}': already defined by an earlier input")
+                continue
+            current.add(key)
+            yield folder_path, item
+        earlier |= current
+
+# 任务提交端点的 API 定义中附加的查询端点信息（见 link_task_endpoints）
+TASK_QUERY_KEY = '_task_query'
+
+# 查询端点路径中的任务 ID：:task_id / :taskId / :id 变量，或示例中写死的 ID（含数字的长片段）
+_TASK_ID_VARIABLE_RE = re.compile(r':(task_?id|id)', re.IGNORECASE)
+_TASK_ID_SEGMENT_RE = re.compile(r'(?=.*\d)[A-Za-z0-9_-]{16,}')
+_TASK_ID_QUERY_KEYS = ('task_id', 'taskId', 'id', 'ids')
+_TASK_QUERY_NAME_RE = re.compile(r'task|query|result|status|fetch|feed|get|查询|任务', re.IGNORECASE)
+# 名称表明是列表/查询类的非 GET 端点不是任务提交端点
+_TASK_LOOKUP_NAME_RE = re.compile(r'list|query|fetch|search|查询', re.IGNORECASE)
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+def _task_query_base(url_data: Dict) -> Optional[str]:
+    """查询端点自带的绝对地址（协议://主机[:端口]），使用 {{baseUrl}} 或缺少 host 时返回 None
+
+    Apifox 把主机名按点拆分为列表（例如 ["gptproto", "com"]），需要重新拼接。
+    """
+    host = url_data.get('host')
+    if isinstance(host, str):
+        host = host.split('.')
+    if not host or any('{{' in part for part in host):
+        return None
+    base = f"{url_data.get('protocol') or 'https'}://{'.'.join(host)}"
+    return f"{base}:{url_data['port']}" if url_data.get('port') else base
+
+def task_query_target(item: Dict) -> Optional[Dict]:
+    """判断 API 是否为按任务 ID 查询任务状态的 GET 端点
+
+    任务 ID 以外的路径变量替换为 `url.variable` 中的示例值；存在没有示例值的变量时
+    无法构造可用的查询地址，不作为查询端点。
+
+    Returns:
+        查询端点信息（名称、任务 ID 位置替换为 {task_id} 的路径、绝对地址 base
+        （为 None 时使用 base_url）、任务 ID 所在的查询参数名），不是查询端点时返回 None
+    """
+    request = item.get('request') or {}
+    url_data = request.get('url')
+    name = item.get('name', '')
+    if request.get('method', 'GET').upper() != 'GET' or not isinstance(url_data, dict):
+        return None
+    path = list(url_data.get('path') or [])
+    if not _TASK_QUERY_NAME_RE.search(name + '/' + '/'.join(path)):
+        return None
+
+    query_key = None
+    for index, segment in enumerate(path):
+        if _TASK_ID_VARIABLE_RE.fullmatch(segment) or _TASK_ID_SEGMENT_RE.fullmatch(segment):
+            path[index] = '{task_id}'
+            break
+    else:
+        query_key = next((param.get('key') for param in url_data.get('query') or []
+                          if param.get('key') in _TASK_ID_QUERY_KEYS), None)
+        if query_key is None:
+            return None
+
+    variables = {variable.get('key'): variable.get('value') for variable in url_data.get('variable') or []
+                 if isinstance(variable, dict)}
+    for index, segment in enumerate(path):
+        if segment.startswith(':'):
+            value = variables.get(segment[1:])
+            if not value:
+                return None
+            path[index] = str(value)
+    return {'name': name, 'path': path, 'base': _task_query_base(url_data), 'query_key': query_key}
+
+def _link_task_folder(run: List[Tuple[List[str], Dict]]) -> Iterator[Tuple[List[str], Dict]]:
+    """为同一文件夹中的任务提交端点附加查询端点信息
+
+    文件夹中有多个查询端点时，选择名称与提交端点共有单词最多的一个（相同时取第一个）。
+    """
+    queries = []
+    for _, item in run:
+        target = task_query_target(item)
+        if target is not None:
+            queries.append((target, set(_WORD_RE.findall(target['name'].lower()))))
+    if not queries:
+        yield from run
+        return
+
+    for folder_path, item in run:
+        request = item.get('request') or {}
+        body = request.get('body') or {}
+        # 只有 JSON 请求体的非流式提交端点才生成轮询示例
+        if request.get('method', 'GET').upper() == 'GET' or body.get('mode') != 'raw' or \
+                _STREAM_TRUE_RE.search(body.get('raw', '')) or _TASK_LOOKUP_NAME_RE.search(item.get('name', '')):
+            yield folder_path, item
+            continue
+        words = set(_WORD_RE.findall(item.get('name', '').lower()))
+        target = max(queries, key=lambda query: len(words & query[1]))[0]
+        linked = dict(item)
+        linked[TASK_QUERY_KEY] = target
+        yield folder_path, linked
+
+def link_task_endpoints(endpoints: Iterable[Tuple[List[str], Dict]]) -> Iterator[Tuple[List[str], Dict]]:
+    """识别同一文件夹中的异步任务提交/查询端点对
+
+    按文件夹缓冲连续的端点（流式模式下内存只与单个文件夹的大小有关），
+    文件夹中存在查询任务的 GET 端点时，为其中的 POST 等提交端点附加
+    TASK_QUERY_KEY，渲染时生成提交后轮询的示例。查询端点的变化会改变
+    提交端点的内容哈希，增量生成时两者一起更新。
+
+    Yields:
+        (文件夹路径列表, API 定义)，顺序与输入一致
+    """
+    run: List[Tuple[List[str], Dict]] = []
+    for folder_path, item in endpoints:
+        if run and run[0][0] != folder_path:
+            yield from _link_task_folder(run)
+            run = []
+        run.append((folder_path, item))
+    yield from _link_task_folder(run)
+
+# 决定 CollectionCache 中缓存条目内容的解析函数
+_PARSER_FUNCTIONS = (flatten_collection, iter_collection_items)
+
+def _update_code_digest(digest, code) -> None:
+    """把代码对象的字节码、名称和常量（含嵌套函数）写入摘要；不含行号，移动代码位置不影响指纹"""
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode('utf-8'))
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            _update_code_digest(digest, const)
+        else:
+            digest.update(repr(const).encode('utf-8'))
+
+def parser_fingerprint() -> str:
+    """集合解析代码的指纹：生成器版本、Python 版本和解析函数的字节码"""
+    digest = hashlib.sha256(f"{GENERATOR_VERSION}\0{sys.version_info[:2]}".encode('utf-8'))
+    for function in _PARSER_FUNCTIONS:
+        _update_code_digest(digest, function.__code__)
+    return digest.hexdigest()
+
+class CollectionCache:
+    """已解析集合的磁盘缓存
+
+    每个输入文件对应一个 pickle 文件：先是文件头（格式版本、解析代码指纹、输入文件的大小、
+    修改时间和 SHA-256），然后是展开后的条目列表。大小和修改时间一致时直接使用缓存；
+    不一致但内容哈希相同时（例如文件只是被 touch）同样命中，并更新文件头。
+    解析代码指纹包含 GENERATOR_VERSION，生成器升级或解析代码修改后旧缓存一律作废。
+    缓存目录只应由本机的生成器写入，pickle 文件不能来自不可信的来源。
+    read_only 为 True 时（--check）只读取缓存，从不写入缓存目录。
+    """
+    FORMAT_VERSION = 1
+
+    def __init__(self, directory: Path, read_only: bool = False):
+        self.directory = directory
+        self.read_only = read_only
+        self.parser = parser_fingerprint()
+        self.hits = 0
+        self.misses = 0
+
+    def _cache_path(self, input_path: Path) -> Path:
+        key = hashlib.sha256(str(input_path.resolve()).encode('utf-8')).hexdigest()[:16]
+        return self.directory / f"{input_path.stem}-{key}.pickle"
+
+    def load(self, input_path: Path) -> List[CollectionEntry]:
+        """读取输入文件的展开条目，缓存失效时重新解析 JSON 并更新缓存
+
+        Raises:
+            json.JSONDecodeError: 输入文件不是合法的 JSON
+        """
+        stat = input_path.stat()
+        cache_path = self._cache_path(input_path)
+        digest = None
+        header: Dict[str, Any] = {}
+
+        try:
+            with open(cache_path, 'rb') as f:
+                header = pickle.load(f)
+                if header.get('format') == self.FORMAT_VERSION and header.get('parser') == self.parser:
+                    if header.get('size') == stat.st_size and header.get('mtime_ns') == stat.st_mtime_ns:
+                        entries = pickle.load(f)
+                        self.hits += 1
+                        logger.debug(f"Loaded {input_path} from cache {cache_path}")
+                        return entries
+                    digest = hashlib.sha256(input_path.read_bytes()).hexdigest()
+                    if header.get('sha256') == digest:
+                        entries = pickle.load(f)
+                        self.hits += 1
+                        logger.debug(f"Loaded {input_path} from cache {cache_path} (content unchanged)")
+                        self._save(cache_path, stat, digest, entries)
+                        return entries
+        except FileNotFoundError:
+            pass
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache {cache_path}: {e}")
+
+        self.misses += 1
+        data = input_path.read_bytes()
+        entries = flatten_collection(json.loads(data.decode('utf-8')))
+        # 使用读取时的 stat，避免解析期间文件被修改后缓存与内容不一致
+        self._save(cache_path, stat, digest or hashlib.sha256(data).hexdigest(), entries)
+        return entries
+
+    def _save(self, cache_path: Path, stat: os.stat_result, digest: str, entries: List[CollectionEntry]):
+        """原子写入缓存文件；写入失败只记录警告"""
+        if self.read_only:
+            return
+        header = {
+            'format': self.FORMAT_VERSION,
+            'parser': self.parser,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': digest
+        }
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=f'.{cache_path.name}.', suffix='.tmp', dir=self.directory)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+        except (OSError, pickle.PicklingError) as e:
+            logger.warning(f"Failed to write cache {cache_path}: {e}")
+
+def sample_template_fingerprint() -> str:
+    """请求示例模板的指纹：生成器版本、模板修订号、已注册的请求和流式示例模板及其格式字段"""
+    digest = hashlib.sha256(f"{GENERATOR_VERSION}\0{TEMPLATE_REVISION}".encode('utf-8'))
+    for group in ('request', 'streaming'):
+        for language, template in CODE_SAMPLE_GROUPS[group]:
+            digest.update(f"\0{group}\0{language}\0{template.text}".encode('utf-8'))
+    digest.update(json.dumps(STREAM_FORMAT_FIELDS, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+def page_template_fingerprint() -> str:
+    """页面模板的指纹：请求示例模板指纹，加上其余示例分组、段落模板和静态段落
+
+    写入清单设置，任何模板文本的变化都会让所有页面重新生成，不依赖手工递增 TEMPLATE_REVISION。
+    """
+    digest = hashlib.sha256(sample_template_fingerprint().encode('utf-8'))
+    for group, templates in CODE_SAMPLE_GROUPS.items():
+        if group in ('request', 'streaming'):
+            continue
+        for language, template in templates:
+            digest.update(f"\0{group}\0{language}\0{template.text}".encode('utf-8'))
+    for text in PAGE_TEMPLATES:
+        digest.update(f"\0{text}".encode('utf-8'))
+    return digest.hexdigest()
+
+class SampleCache:
+    """跨运行的请求示例代码块缓存
+
+    CodeGroup 代码块按 code_sample_key 保存在缓存目录下的单个 pickle 文件中：
+    先是文件头（格式版本、模板指纹和总字节数），然后是按最近使用顺序排列的代码块。
+    模板指纹不一致时（模板或生成器版本变化）整个缓存作废；总字节数超过上限时
+    淘汰最久未使用的代码块。缓存目录只应由本机的生成器写入，pickle 文件不能来自不可信的来源。
+    """
+    FORMAT_VERSION = 1
+    FILENAME = 'code_samples.pickle'
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.path = directory / self.FILENAME
+        self.max_bytes = max_bytes
+        self.fingerprint = sample_template_fingerprint()
+        self.entries: 'OrderedDict[str, str]' = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        """读取缓存文件；文件不存在、损坏或模板已变化时从空缓存开始"""
+        try:
+            with open(self.path, 'rb') as f:
+                header = pickle.load(f)
+                if header.get('format') != self.FORMAT_VERSION:
+                    return
+                if header.get('fingerprint') != self.fingerprint:
+                    logger.info("Code sample templates changed, starting with an empty sample cache")
+                    self._dirty = True
+                    return
+                self.entries = pickle.load(f)
+                self.bytes = header.get('bytes', 0)
+        except FileNotFoundError:
+            return
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable sample cache {self.path}: {e}")
+            return
+        self._evict()
+
+    def _evict(self):
+        """按最近使用顺序淘汰代码块，直到总字节数不超过上限"""
+        while self.bytes > self.max_bytes and self.entries:
+            _, block = self.entries.popitem(last=False)
+            self.bytes -= len(block.encode('utf-8'))
+            self.evicted += 1
+            self._dirty = True
+
+    def record(self, key: str, block: Optional[str]):
+        """记录一次查找结果：block 为 None 表示命中，否则为未命中后新渲染的代码块"""
+        self._dirty = True
+        if block is None:
+            self.hits += 1
+            if key in self.entries:
+                self.entries.move_to_end(key)
+            return
+        self.misses += 1
+        if key in self.entries:
+            # 并行渲染时同一次运行中相同的代码块可能在多个工作进程中都未命中
+            self.entries.move_to_end(key)
+            return
+        self.entries[key] = block
+        self.bytes += len(block.encode('utf-8'))
+        self._evict()
+
+    def save(self):
+        """原子写入缓存文件（没有变化时跳过）；写入失败只记录警告"""
+        if not self._dirty:
+            return
+        header = {'format': self.FORMAT_VERSION, 'fingerprint': self.fingerprint, 'bytes': self.bytes}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=f'.{self.path.name}.', suffix='.tmp', dir=self.path.parent)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    pickle.dump(self.entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+            self._dirty = False
+        except (OSError, pickle.PicklingError) as e:
+            logger.warning(f"Failed to write sample cache {self.path}: {e}")
+
+    def reset_counts(self):
+        """开始新一次运行的命中统计（--watch 时缓存在多次运行之间保留）"""
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """输出到 _summary.json 的 sample_cache 字段（本次运行的命中情况和缓存大小）"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else None,
+            'entries': len(self.entries),
+            'bytes': self.bytes,
+            'evicted': self.evicted
+        }
+
+# 生成器管理的导航页面前缀；只包含这些页面的分组视为 API 分组
+API_PAGE_PREFIX = 'docs/api/'
+
+_JSON_WHITESPACE_RE = re.compile(r'[ \t\n\r]*')
+
+def _navigation_pages(item: Any) -> Iterator[str]:
+    """递归列出导航项中的所有页面路径"""
+    if isinstance(item, str):
+        yield item
+    elif isinstance(item, dict):
+        for page in item.get('pages', []):
+            yield from _navigation_pages(page)
 
-    return apis, generated_count
+def is_api_group(item: Any, category_names: set) -> bool:
+    """判断顶级导航分组是否由生成器管理
+
+    名称与 API 分类相同（不区分大小写），或所有页面都位于 docs/api/ 下的分组属于生成器；
+    其余分组（如 "Get Started" 或手写的指南）原样保留。
+    """
+    if not isinstance(item, dict):
+        return False
+    if str(item.get('group', '')).lower() in category_names:
+        return True
+    pages = list(_navigation_pages(item))
+    return bool(pages) and all(page.startswith(API_PAGE_PREFIX) for page in pages)
+
+def merge_navigation(existing: List[Any], api_groups: List[Dict]) -> List[Any]:
+    """把新的 API 分组合并到现有导航中
+
+    手写分组保持原有位置；API 分组作为一个连续的整体，放在现有第一个 API 分组的位置
+    （没有时追加到末尾）。
+    """
+    category_names = {str(group.get('group', '')).lower() for group in api_groups}
+    merged: List[Any] = []
+    inserted = False
+    for item in existing:
+        if is_api_group(item, category_names):
+            if not inserted:
+                merged.extend(api_groups)
+                inserted = True
+        else:
+            merged.append(item)
+    if not inserted:
+        merged.extend(api_groups)
+    return merged
+
+def diff_navigation(existing: List[Any], merged: List[Any]) -> Tuple[List[str], List[str], List[str]]:
+    """按分组名称比较新旧导航，返回 (新增, 变化, 删除) 的分组名称"""
+    def by_name(items):
+        return {item.get('group'): item for item in items if isinstance(item, dict)}
+
+    before = by_name(existing)
+    after = by_name(merged)
+    added = [name for name in after if name not in before]
+    changed = [name for name in after if name in before and after[name] != before[name]]
+    removed = [name for name in before if name not in after]
+    return added, changed, removed
+
+def _skip_json_whitespace(text: str, index: int) -> int:
+    return _JSON_WHITESPACE_RE.match(text, index).end()
+
+def _json_value_end(text: str, index: int) -> int:
+    """返回从 index 开始的 JSON 值结束的位置"""
+    return json.JSONDecoder().raw_decode(text, index)[1]
+
+def _json_member_span(text: str, key: str) -> Optional[Tuple[int, int]]:
+    """在顶级 JSON 对象中查找 key 对应值的 (开始, 结束) 位置"""
+    index = _skip_json_whitespace(text, 0)
+    if text[index:index + 1] != '{':
+        return None
+    index = _skip_json_whitespace(text, index + 1)
+    while text[index:index + 1] == '"':
+        name, index = json.decoder.scanstring(text, index + 1)
+        index = _skip_json_whitespace(text, index)
+        if text[index:index + 1] != ':':
+            return None
+        value_start = _skip_json_whitespace(text, index + 1)
+        value_end = _json_value_end(text, value_start)
+        if name == key:
+            return value_start, value_end
+        index = _skip_json_whitespace(text, value_end)
+        if text[index:index + 1] != ',':
+            return None
+        index = _skip_json_whitespace(text, index + 1)
+    return None
+
+def _json_array_element_spans(text: str, start: int) -> List[Tuple[int, int]]:
+    """返回从 start 开始的 JSON 数组中每个元素的 (开始, 结束) 位置"""
+    spans = []
+    index = _skip_json_whitespace(text, start + 1)
+    while text[index:index + 1] != ']':
+        end = _json_value_end(text, index)
+        spans.append((index, end))
+        index = _skip_json_whitespace(text, end)
+        if text[index:index + 1] == ',':
+            index = _skip_json_whitespace(text, index + 1)
+    return spans
+
+def _line_indent(text: str, index: int) -> str:
+    """index 所在行开头的缩进"""
+    line_start = text.rfind('\n', 0, index) + 1
+    return text[line_start:_JSON_WHITESPACE_RE.match(text, line_start).end()] if line_start else ''
+
+def patch_navigation_text(text: str, existing: List[Any], merged: List[Any]) -> Optional[str]:
+    """只替换 mint.json 文本中 navigation 数组变化的分组
+
+    未变化的分组沿用原文本，文件其余部分逐字节保留，变化的分组按文件的缩进重新序列化。
+    无法定位 navigation 数组（或数组为空、写在一行内、使用制表符缩进）时返回 None，由调用方整体重写。
+    """
+    span = _json_member_span(text, 'navigation')
+    if span is None or text[span[0]] != '[':
+        return None
+    array_start, array_end = span
+    element_spans = _json_array_element_spans(text, array_start)
+    if not element_spans or '\n' not in text[array_start:element_spans[0][0]]:
+        return None
+
+    element_indent = _line_indent(text, element_spans[0][0])
+    closing_indent = _line_indent(text, array_end - 1)
+    indent_width = len(element_indent) - len(closing_indent)
+    if indent_width <= 0 or not element_indent.startswith(closing_indent) or element_indent.strip(' '):
+        return None
+
+    originals = [(item, text[start:end]) for item, (start, end) in zip(existing, element_spans)]
+    parts = []
+    for item in merged:
+        for index, (original, original_text) in enumerate(originals):
+            if original == item:
+                parts.append(original_text)
+                del originals[index]
+                break
+        else:
+            dumped = json.dumps(item, ensure_ascii=False, indent=indent_width)
+            parts.append(dumped.replace('\n', '\n' + element_indent))
+
+    array_text = '[\n' + element_indent + (',\n' + element_indent).join(parts) + '\n' + closing_indent + ']'
+    return text[:array_start] + array_text + text[array_end:]
+
+def api_navigation_groups(navigation_tree: Dict[str, NavigationNode]) -> List[Dict]:
+    """由导航树生成 mint.json 中的 API 分组（按分类名排序，带分类图标）"""
+    # 定义分类图标映射
+    category_icons = {
+        'openai': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-draw/AiIcon/GPT.png',
+        'claude': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-draw/AiIcon/Claude.png',
+        'gemini': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-draw/AiIcon/Gemini.png',
+        'grok': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-draw/AiIcon/Grok.png',
+        'midjourney': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-draw/AiIcon/Midjourney.png',
+        'suno': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-draw/AiIcon/Suno.png',
+        'kling': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-draw/AiIcon/Kling.png',
+        'runway': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-draw/AiIcon/Runway.png',
+        'ideogram': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-draw/AiIcon/Ideogram.png',
+        'flux': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/2025/05/30/a0ffa3b5d65f4f23a40698c445048c67.png',
+        'doubao': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-draw/AiIcon/doubao.png',
+        'higgsfield': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-content/1754623057482-20250808-111710.png',
+        'qwen': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-content/1755663073115-111.png',
+        'minimax': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-content/1757932596487-20250915-183623.png',
+        'gptproto': 'https://oss.heyoos.com/2025/10/23/2df4295950b8433998e058f6539d9e1c.png?x-oss-process=image/format,webp/quality,q_100/resize,w_160,h_160,m_fill'
+    }
 
-def update_mint_json(navigation_tree: Dict[str, NavigationNode], mint_json_path: Path):
+    # 构建 API 导航项
+    api_groups = []
+    for category_name, node in sorted(navigation_tree.items()):
+        nav_item = node.to_dict()
+        if nav_item and nav_item.get('pages'):
+            # 添加图标
+            category_key = sanitize_folder_name(category_name)
+            if category_key in category_icons:
+                nav_item['icon'] = category_icons[category_key]
+
+            api_groups.append(nav_item)
+
+    return api_groups
+
+def update_mint_json(
+    navigation_tree: Dict[str, NavigationNode],
+    mint_json_path: Path,
+    writer: Optional[OutputWriter] = None
+) -> bool:
     """更新 mint.json 的 navigation 配置
 
+    与现有导航做结构比较：结果等价时不写文件；否则只重写变化的分组，
+    手写的非 API 分组和文件其余部分保持原样。
+
     Args:
         navigation_tree: 导航树字典
         mint_json_path: mint.json 文件路径
+        writer: 文件输出层
+
+    Returns:
+        是否写入了 mint.json
     """
+    return write_api_navigation(api_navigation_groups(navigation_tree), mint_json_path, writer)
+
+def write_api_navigation(
+    api_groups: List[Dict],
+    mint_json_path: Path,
+    writer: Optional[OutputWriter] = None
+) -> bool:
+    """把 API 分组合并到 mint.json 的 navigation 中（见 update_mint_json）"""
     try:
         # 读取现有的 mint.json
         with open(mint_json_path, 'r', encoding='utf-8') as f:
-            mint_data = json.load(f)
+            text = f.read()
+        mint_data = json.loads(text)
 
-        # 保留非 API 相关的导航项（如 "Get Started"）
         existing_navigation = mint_data.get('navigation', [])
-        non_api_navigation = [
-            item for item in existing_navigation
-            if item.get('group', '').lower() not in [key.lower() for key in navigation_tree.keys()]
-            and 'get started' in item.get('group', '').lower()
-        ]
-
-        # 构建新的导航配置
-        new_navigation = non_api_navigation.copy()
-
-        # 定义分类图标映射
-        category_icons = {
-            'openai': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-draw/AiIcon/GPT.png',
-            'claude': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-draw/AiIcon/Claude.png',
-            'gemini': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-draw/AiIcon/Gemini.png',
-            'grok': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-draw/AiIcon/Grok.png',
-            'midjourney': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-draw/AiIcon/Midjourney.png',
-            'suno': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-draw/AiIcon/Suno.png',
-            'kling': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-draw/AiIcon/Kling.png',
-            'runway': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-draw/AiIcon/Runway.png',
-            'ideogram': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-draw/AiIcon/Ideogram.png',
-            'flux': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/2025/05/30/a0ffa3b5d65f4f23a40698c445048c67.png',
-            'doubao': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-draw/AiIcon/doubao.png',
-            'higgsfield': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-content/1754623057482-20250808-111710.png',
-            'qwen': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-content/1755663073115-111.png',
-            'minimax': 'https://heyoo.oss-ap-southeast-1.aliyuncs.com/ai-content/1757932596487-20250915-183623.png',
-            'gptproto': 'https://oss.heyoos.com/2025/10/23/2df4295950b8433998e058f6539d9e1c.png?x-oss-process=image/format,webp/quality,q_100/resize,w_160,h_160,m_fill'
+        new_navigation = merge_navigation(existing_navigation, api_groups)
+        if new_navigation == existing_navigation:
+            logger.debug("mint.json navigation unchanged")
+            return False
+
+        added, changed, removed = diff_navigation(existing_navigation, new_navigation)
+        patched = patch_navigation_text(text, existing_navigation, new_navigation)
+        if patched is None:
+            # 无法局部修改时整体重写
+            mint_data['navigation'] = new_navigation
+            patched = json.dumps(mint_data, ensure_ascii=False, indent=2)
+
+        written = (writer or OutputWriter()).write_text(mint_json_path, patched)
+
+        # 检查模式只比较内容，mint.json 的差异由 --check 的结果报告
+        log = logger.debug if isinstance(writer, CheckWriter) else logger.info
+        log(f"mint.json navigation: {len(added)} added, {len(changed)} changed, {len(removed)} removed")
+        for label, names in (('added', added), ('changed', changed), ('removed', removed)):
+            if names:
+                logger.debug(f"  {label}: {', '.join(str(name) for name in names)}")
+        return written
+
+    except Exception as e:
+        logger.error(f"Failed to update mint.json: {e}")
+        raise
+
+def unpack_pack(
+    pack_path: Path,
+    root: Path,
+    mint_json_path: Optional[Path] = None,
+    writer: Optional[OutputWriter] = None
+) -> int:
+    """把 --format pack 生成的归档还原为普通的文档目录树，并把归档中的导航合并到 mint.json
+
+    内容与磁盘相同的文件不会重写；归档中没有的旧文件不会被删除。
+    写入前先校验所有路径和文件内容，归档损坏或含有非法路径时不会写入任何文件。
+
+    Args:
+        pack_path: 归档路径
+        root: 文档根目录（归档中的路径相对于该目录）
+        mint_json_path: 要更新导航的 mint.json；为 None 或文件不存在时跳过
+        writer: 文件输出层
+
+    Returns:
+        还原的文件数
+
+    Raises:
+        ValueError: 不是合法的归档、内容损坏，或其中的路径会写到根目录之外
+    """
+    writer = writer or OutputWriter()
+    with PackReader(pack_path) as pack:
+        targets = []
+        for key in pack.paths():
+            parts = key.split('/')
+            # 拒绝绝对路径、.. 和 Windows 的盘符或反斜杠分隔
+            if any(part in ('', '.', '..') or '\\' in part or ':' in part or '\0' in part for part in parts):
+                raise ValueError(f"Invalid path in pack {pack_path}: {key}")
+            pack.read_text(key)
+            targets.append((key, root.joinpath(*parts)))
+
+        created: set = set()
+        for key, target in targets:
+            if target.parent not in created:
+                writer.ensure_dir(target.parent)
+                created.add(target.parent)
+            writer.write_text(target, pack.read_text(key))
+        if pack.navigation is not None and mint_json_path is not None and mint_json_path.exists():
+            write_api_navigation(pack.navigation, mint_json_path, writer)
+        return len(pack)
+
+_SEARCH_TOKEN_RE = re.compile(
+    r'[0-9a-z]+(?:[._-][0-9a-z]+)*'
+    r'|[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af]+'
+)
+_SEARCH_TOKEN_SEPARATORS_RE = re.compile(r'[._-]')
+
+def _cjk_bigrams(run: str) -> List[str]:
+    """中日韩文字没有词间空格，按相邻两字切分；单个字作为一个词"""
+    if len(run) == 1:
+        return [run]
+    return [run[i:i + 2] for i in range(len(run) - 1)]
+
+def search_tokens(text: str) -> Iterator[str]:
+    """把文本切分为小写的搜索词
+
+    含有 _、-、. 的标识符（如 response_format、gpt-4o）既作为整体、也按分隔符拆开后编入索引；
+    中日韩文字按相邻两字编入索引（如 任务查询 → 任务、务查、查询）。
+    """
+    for match in _SEARCH_TOKEN_RE.finditer(text.lower()):
+        token = match.group()
+        if not token.isascii():
+            yield from _cjk_bigrams(token)
+            continue
+        yield token
+        if _SEARCH_TOKEN_SEPARATORS_RE.search(token):
+            yield from (part for part in _SEARCH_TOKEN_SEPARATORS_RE.split(token) if part)
+
+class SearchIndexBuilder:
+    """客户端搜索的倒排索引
+
+    endpoints 只保存展示用的名称、页面、方法和路径（参数名只出现在索引中）；
+    tokens 是排好序的搜索词列表，postings[i] 是 tokens[i] 的命中列表，每一项为
+    [端点序号, 命中字段]，字段用 fields 中的单字母表示；前缀查找在 tokens 上二分即可。
+    """
+    FIELDS = {'n': 'name', 'c': 'category', 'm': 'method', 'u': 'path', 'p': 'parameter'}
+
+    def __init__(self):
+        self.endpoints: List[Dict[str, Any]] = []
+        self.postings: Dict[str, Dict[int, str]] = defaultdict(dict)
+
+    def add(self, title: str, folder_path: str, page: str, record: Dict[str, Any]):
+        """加入一个端点
+
+        Args:
+            title: API 名称
+            folder_path: 以 / 连接的文件夹路径
+            page: 文档页面路径（与 mint.json 中的一致）
+            record: search_record 返回的方法、路径和参数名
+        """
+        doc = len(self.endpoints)
+        self.endpoints.append({
+            'title': title,
+            'page': page,
+            'method': record['method'],
+            'path': record['path']
+        })
+        for field, texts in (('n', [title]), ('c', [folder_path]), ('m', [record['method']]),
+                             ('u', [record['path']]), ('p', record['params'])):
+            for text in texts:
+                for token in search_tokens(text):
+                    fields = self.postings[token].get(doc, '')
+                    if field not in fields:
+                        self.postings[token][doc] = fields + field
+
+    def to_dict(self) -> Dict[str, Any]:
+        """输出到 _search_index.json 的内容"""
+        tokens = sorted(self.postings)
+        return {
+            'version': 1,
+            'fields': self.FIELDS,
+            'endpoints': self.endpoints,
+            'tokens': tokens,
+            'postings': [[[doc, fields] for doc, fields in self.postings[token].items()] for token in tokens]
         }
 
-        # 添加 API 导航项
-        for category_name, node in sorted(navigation_tree.items()):
-            nav_item = node.to_dict()
-            if nav_item and nav_item.get('pages'):
-                # 添加图标
-                category_key = sanitize_folder_name(category_name)
-                if category_key in category_icons:
-                    nav_item['icon'] = category_icons[category_key]
+def build_search_index(apis: List[ApiRecord], manifest: BuildManifest) -> Dict[str, Any]:
+    """按导航顺序为成功生成的端点构建搜索索引（记录来自清单，未重新渲染的端点沿用上次的记录）"""
+    builder = SearchIndexBuilder()
+    for api in apis:
+        record = manifest.entries.get(api.endpoint_key, {}).get('search')
+        if record is not None:
+            builder.add(api.name, '/'.join(api.folder_path), api.relative_path, record)
+    return builder.to_dict()
 
-                new_navigation.append(nav_item)
+def lookup_search_index(index: Dict[str, Any], query: str) -> List[Tuple[Dict[str, Any], str]]:
+    """在搜索索引中按前缀查找
 
-        # 更新 navigation
-        mint_data['navigation'] = new_navigation
+    查询中的每个词都作为前缀匹配，多个词时取交集；中日韩文字与索引一样按相邻两字切分，
+    单个字匹配以它开头的所有两字词。
 
-        # 写回 mint.json
-        with open(mint_json_path, 'w', encoding='utf-8') as f:
-            json.dump(mint_data, f, ensure_ascii=False, indent=2)
+    Args:
+        index: _search_index.json 的内容
+        query: 查询文本
 
-        logger.info(f"Updated mint.json with {len(navigation_tree)} categories")
+    Returns:
+        (端点, 命中字段) 列表，按端点在索引中的顺序排列
+    """
+    tokens = index['tokens']
+    matches: Optional[Dict[int, str]] = None
+    prefixes = []
+    for token in _SEARCH_TOKEN_RE.findall(query.lower()):
+        prefixes.extend(_cjk_bigrams(token) if not token.isascii() else [token])
+    for prefix in prefixes:
+        hits: Dict[int, str] = {}
+        position = bisect.bisect_left(tokens, prefix)
+        while position < len(tokens) and tokens[position].startswith(prefix):
+            for doc, fields in index['postings'][position]:
+                hits[doc] = ''.join(dict.fromkeys(hits.get(doc, '') + fields))
+            position += 1
+        if matches is None:
+            matches = hits
+        else:
+            matches = {doc: ''.join(dict.fromkeys(matches[doc] + fields))
+                       for doc, fields in hits.items() if doc in matches}
+    return [(index['endpoints'][doc], fields) for doc, fields in sorted((matches or {}).items())]
 
-    except Exception as e:
-        logger.error(f"Failed to update mint.json: {e}")
-        raise
+class DocBuilder:
+    """文档生成流程
+
+    封装一次完整的生成：读取输入、渲染端点、更新 mint.json、保存清单和摘要。
+    watch 模式下同一个实例被反复调用，清单和导航结构保存在内存中，
+    每次只重新渲染变化的端点，导航未变化时不触碰 mint.json。
+    """
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.input_paths = [Path(path) for path in args.input]
+        self.output_path = Path(args.output)
+        self.mint_json_path = Path(args.mint_json)
+        self.settings = {'generator_version': GENERATOR_VERSION,
+                         'template_fingerprint': page_template_fingerprint(),
+                         'base_url': args.base_url}
+        if args.shared_snippets:
+            self.settings['shared_snippets'] = True
+        # 搜索索引记录保存在清单中，开启后需要重新渲染一次所有端点
+        if args.search_index:
+            self.settings['search_index'] = True
+        if args.production_samples:
+            self.settings['production_samples'] = True
+        self.context = RenderContext(base_url=args.base_url, shared_snippets=args.shared_snippets,
+                                     search_index=args.search_index, production_samples=args.production_samples)
+        self.snippets_dir = self.mint_json_path.parent / SNIPPETS_DIRNAME
+        # 流式模式不把整个集合保存在内存中，也就不使用解析缓存
+        # --check 不写入任何文件，缓存只读不写
+        self.cache = CollectionCache(Path(args.cache_dir), read_only=args.check) \
+            if not (args.no_cache or args.stream) else None
+        self.sample_cache = SampleCache(Path(args.cache_dir), args.sample_cache_size << 20) \
+            if not args.no_cache and args.sample_cache_size > 0 else None
+        self.pack_path = Path(args.pack_file) if args.pack_file else \
+            self.output_path.parent / (self.output_path.name + '.pack')
+        self.manifest: Optional[BuildManifest] = None
+        self.navigation: Optional[List[Dict]] = None
+        self.drift: List[Tuple[str, str]] = []
+
+    def _load_manifest(self) -> BuildManifest:
+        """首次运行从磁盘读取清单，之后沿用内存中上一次的结果"""
+        path = self.output_path / MANIFEST_FILENAME
+        if self.args.format == 'pack':
+            # 归档每次整体重建，所有端点都重新渲染；清单随页面一起写入归档
+            return BuildManifest(path, self.settings)
+        if self.manifest is None:
+            # --check 重新渲染所有端点，与磁盘上的文件逐一比较
+            return BuildManifest.load(path, self.settings, force=self.args.force or self.args.check)
+        # 与 BuildManifest.load 一样沿用上一次未能清理的孤立页面和 snippet
+        previous = self.manifest.entries
+        previous_outputs = [entry['output'] for entry in previous.values()] + self.manifest.orphans
+        previous_snippets = [name for entry in previous.values() for name in entry.get('snippets', [])] + \
+            self.manifest.orphan_snippets
+        return BuildManifest(path, self.settings, previous=previous, previous_outputs=previous_outputs,
+                             previous_snippets=previous_snippets)
+
+    def _load_input(self, input_path: Path) -> List[CollectionEntry]:
+        """读取单个输入文件并展开为目录和 API 条目（优先使用解析缓存）"""
+        if self.cache is not None:
+            return self.cache.load(input_path)
+        with open(input_path, 'r', encoding='utf-8') as f:
+            return flatten_collection(json.load(f))
+
+    def _load_inputs(self) -> Optional[List[List[CollectionEntry]]]:
+        """按顺序读取所有输入文件，任一文件读取或解析失败时返回 None
+
+        json.load 和 pickle.load 都持有 GIL，多线程读取不会更快；
+        放到工作进程中解析则要把展开后的条目再序列化传回主进程，同样没有收益。
+        """
+        sources = []
+        for path in self.input_paths:
+            try:
+                sources.append(self._load_input(path))
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse JSON file {path}: {e}")
+                return None
+            except Exception as e:
+                logger.error(f"Failed to read input file {path}: {e}")
+                return None
+        return sources
+
+    def run(self) -> bool:
+        """执行一次生成
+
+        多个输入文件按命令行顺序合并：同名的顶级分类和目录合并为一个导航节点，
+        先出现的输入排在前面；同一端点出现在多个输入中时按 --merge-policy 处理。
+
+        Returns:
+            输入文件读取和解析成功时返回 True；所有端点都生成失败时返回 False
+        """
+        args = self.args
+        metrics = BuildMetrics(slowest=args.slowest)
+        cache_hits = self.cache.hits if self.cache is not None else 0
+        if self.sample_cache is not None:
+            self.sample_cache.reset_counts()
+        logger.info(f"Reading API data from: {', '.join(str(path) for path in self.input_paths)}")
+
+        # 读取 Apifox.json（流式模式下边解析边生成，不预先加载整个文件）
+        sources: List[List[CollectionEntry]] = []
+        if not args.stream:
+            with metrics.phase('load'):
+                sources = self._load_inputs()
+            if sources is None:
+                return False
+            logger.info("Successfully loaded Apifox data")
+
+        # 创建输出目录（--check 不修改文件树，--format pack 只写入归档）
+        output_path = self.output_path
+        if args.check:
+            writer: OutputWriter = CheckWriter()
+        elif args.format == 'pack':
+            writer = PackWriter(self.pack_path, self.mint_json_path.parent)
+        else:
+            writer = OutputWriter()
+        writer.ensure_dir(output_path)
+        logger.info(f"Output directory: {args.output}")
+
+        # 提取所有 API 并生成文档
+        logger.info("Extracting API endpoints and generating documentation...")
+
+        # 读取增量生成清单
+        manifest = self._load_manifest()
+
+        navigation_tree: Dict[str, NavigationNode] = {}
+        planner = OutputPlanner(output_path, writer)
+        snippet_store = SnippetStore(self.snippets_dir, writer) if args.shared_snippets else None
+
+        def on_folder(path: List[str]):
+            register_folder(path, navigation_tree)
+
+        # 所有输入的端点串联为同一条流水线，渲染进程和写入线程在输入之间不会空闲
+        if args.stream:
+            # 流式模式：逐个读取 API 定义并立即生成文档
+            endpoints = merge_sources(
+                [iter_apifox_stream(path, on_folder=on_folder) for path in self.input_paths], args.merge_policy
+            )
+        else:
+            # Apifox 导出格式使用 'item'，已展开为目录和 API 条目列表
+            endpoints = merge_sources(
+                [iter_collection_entries(entries, on_folder=on_folder) for entries in sources], args.merge_policy
+            )
+
+        endpoints = link_task_endpoints(endpoints)
+
+        if args.jobs > 1:
+            logger.info(f"Rendering with {args.jobs} worker processes")
+
+        try:
+            # 流式模式下读取与生成交织在一起，解析耗时计入 generate 阶段
+            with metrics.phase('generate'):
+                tally = generate_endpoints(
+                    endpoints,
+                    output_path,
+                    navigation_tree,
+                    manifest,
+                    context=self.context,
+                    jobs=args.jobs,
+                    writer=writer,
+                    metrics=metrics,
+                    planner=planner,
+                    # 归档是单个顺序追加的文件，写入线程没有收益，同步写入还使归档中的顺序与输入一致
+                    write_threads=0 if args.format == 'pack' else args.write_threads,
+                    snippet_store=snippet_store,
+                    keep_records=args.search_index,
+                    sample_cache=self.sample_cache
+                )
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse JSON file: {e}")
+            if isinstance(writer, PackWriter):
+                writer.abort()
+            return False
+        if self.sample_cache is not None:
+            if not args.check:
+                self.sample_cache.save()
+            sample_stats = self.sample_cache.stats()
+            if sample_stats['hit_rate'] is not None:
+                logger.info(f"Code sample cache: {sample_stats['hits']} hits, {sample_stats['misses']} misses "
+                            f"({sample_stats['hit_rate']:.0%} hit rate)")
+
+        manifest.finalize()
+        changes = manifest.stats
+        self.manifest = manifest
+
+        logger.info(f"Found {tally.total} API endpoints")
+        if args.check:
+            # 检查模式不写入文件，结果由 _check 报告为有无差异
+            logger.info(f"Rendered {tally.generated} documentation files for comparison")
+        else:
+            logger.info(f"Generated {tally.generated} documentation files")
+        if planner.collisions:
+            logger.warning(f"{planner.collisions} endpoints were renamed to avoid output path collisions")
+        if not args.check:
+            logger.info(
+                f"Endpoints: {changes['added']} added, {changes['changed']} changed, "
+                f"{changes['unchanged']} unchanged, {changes['removed']} removed"
+            )
+
+        if not tally.total:
+            if isinstance(writer, PackWriter):
+                writer.abort()
+            if tally.failed:
+                logger.error(f"All {tally.failed} API endpoints failed to generate")
+                return False
+            logger.warning("No APIs found in the input file")
+            return True
+
+        # 生成客户端搜索索引
+        search_index_path = output_path / SEARCH_INDEX_FILENAME
+        if args.search_index:
+            with metrics.phase('search_index'):
+                search_index = build_search_index(tally.records, manifest)
+                writer.write_text(search_index_path,
+                                  json.dumps(search_index, ensure_ascii=False, separators=(',', ':')))
+            logger.info(f"Search index: {len(search_index['tokens'])} tokens for "
+                        f"{len(search_index['endpoints'])} endpoints")
+
+        if args.check:
+            return self._check(navigation_tree, manifest, writer, metrics)
+
+        # 清理不再生成的孤立文件和空目录（归档每次整体重建，不涉及文件树）
+        pruned: List[Path] = []
+        if args.format != 'pack':
+            with metrics.phase('prune'):
+                pruned = prune_outputs(manifest, output_path, dry_run=args.prune_dry_run)
+                pruned += prune_snippets(manifest, self.snippets_dir, dry_run=args.prune_dry_run)
+        if args.prune_dry_run:
+            for path in pruned:
+                logger.info(f"Would prune: {path}")
+            logger.info(f"Dry run: {len(pruned)} stale files/directories would be pruned")
+        elif pruned:
+            for path in pruned:
+                logger.debug(f"Pruned: {path}")
+            logger.info(f"Pruned {len(pruned)} stale files/directories")
+
+        # 更新 mint.json（导航结构与上一次相同时跳过）
+        navigation = [node.to_dict() for _, node in sorted(navigation_tree.items())]
+        mint_json_path = self.mint_json_path
+        if isinstance(writer, PackWriter):
+            # 导航保存在归档中，--unpack 时再合并到 mint.json
+            writer.navigation = api_navigation_groups(navigation_tree)
+        elif navigation == self.navigation:
+            logger.info("Navigation unchanged, mint.json left untouched")
+        elif mint_json_path.exists():
+            logger.info(f"Updating {args.mint_json}...")
+            try:
+                with metrics.phase('mint_json'):
+                    updated = update_mint_json(navigation_tree, mint_json_path, writer)
+                self.navigation = navigation
+                logger.info("Successfully updated mint.json" if updated else "mint.json unchanged")
+            except Exception as e:
+                logger.error(f"Failed to update mint.json: {e}")
+        else:
+            logger.warning(f"mint.json not found at {args.mint_json}, skipping navigation update")
+
+        # 保存增量生成清单
+        try:
+            with metrics.phase('manifest'):
+                manifest.save(writer)
+            logger.info(f"Manifest saved to: {manifest.path}")
+        except Exception as e:
+            logger.warning(f"Failed to save manifest: {e}")
+
+        # 输出统计信息
+        logger.info("\n" + "="*50)
+        logger.info("Documentation generation completed!")
+        logger.info("="*50)
+        logger.info(f"  Total APIs: {tally.total}")
+        logger.info(f"  Generated docs: {tally.generated}")
+        logger.info(f"  Categories: {len(navigation_tree)}")
+        logger.info(f"  Added / changed / unchanged / removed: "
+                    f"{changes['added']} / {changes['changed']} / {changes['unchanged']} / {changes['removed']}")
+        logger.info(f"  Files written / unchanged: {writer.written} / {writer.unchanged}")
+        logger.info(f"  Pruned: {0 if args.prune_dry_run else len(pruned)}")
+        logger.info(f"  Output path collisions: {planner.collisions}")
+        if snippet_store is not None:
+            snippet_stats = snippet_store.stats()
+            logger.info(f"  Shared snippets: {snippet_stats['files']} files for {snippet_stats['references']} "
+                        f"code samples, {snippet_stats['bytes_saved']} bytes saved")
+        timing = metrics.to_dict()
+        memory = peak_memory_bytes()
+        logger.info(f"  Time: {timing['total_seconds']:.2f}s "
+                    f"({', '.join(f'{name} {seconds:.2f}s' for name, seconds in timing['phases'].items())})")
+        if memory is not None:
+            logger.info(f"  Peak memory: {memory / (1 << 20):.1f} MiB")
+
+        # 生成摘要文件
+        summary_path = output_path / "_summary.json"
+        summary = {
+            'generated_at': datetime.now().isoformat(),
+            'total_apis': tally.total,
+            'generated_docs': tally.generated,
+            'changes': changes,
+            'files_written': writer.written,
+            'files_unchanged': writer.unchanged,
+            'bytes_written': writer.bytes_written,
+            'pruned': [] if args.prune_dry_run else [str(path) for path in pruned],
+            'collisions': planner.collisions,
+            'inputs': [str(path) for path in self.input_paths],
+            'cache_hits': self.cache.hits - cache_hits if self.cache is not None else None,
+            'sample_cache': self.sample_cache.stats() if self.sample_cache is not None else None,
+            'snippets': snippet_store.stats() if snippet_store is not None else None,
+            'peak_memory_bytes': memory,
+            'timing': timing,
+            'categories': list(navigation_tree.keys())
+        }
+
+        try:
+            writer.write_json(summary_path, summary)
+            logger.info(f"\nSummary saved to: {summary_path}")
+        except Exception as e:
+            logger.warning(f"Failed to save summary: {e}")
+
+        if isinstance(writer, PackWriter):
+            try:
+                size = writer.finish()
+            except OSError as e:
+                logger.error(f"Failed to write pack {self.pack_path}: {e}")
+                return False
+            logger.info(f"Pack saved to: {self.pack_path} ({len(writer.entries)} files, {size} bytes)")
+
+        return True
+
+    def _check(self, navigation_tree: Dict[str, NavigationNode], manifest: BuildManifest,
+               writer: CheckWriter, metrics: BuildMetrics) -> bool:
+        """--check：比较 mint.json 和清单，列出与输入不一致的文件
+
+        除了内容不一致或缺失的文件，输出目录和 snippet 目录中不会再生成的 .mdx 文件
+        （即实际运行时会被清理的文件）也记录为 stale。结果保存在 self.drift 中。
+
+        Returns:
+            总是返回 True（输入已成功读取）
+        """
+        if self.mint_json_path.exists():
+            with metrics.phase('mint_json'):
+                update_mint_json(navigation_tree, self.mint_json_path, writer)
+        else:
+            logger.warning(f"mint.json not found at {self.args.mint_json}, skipping navigation check")
+        with metrics.phase('manifest'):
+            manifest.save(writer)
+
+        drift = sorted((str(path), status) for path, status in writer.differences.items())
+        for directory in (self.output_path, self.snippets_dir):
+            if directory.is_dir():
+                drift.extend(sorted((str(path), 'stale') for path in directory.rglob('*.mdx')
+                                    if path not in writer.targets))
+        self.drift = drift
+
+        elapsed = metrics.to_dict()['total_seconds']
+        if drift:
+            logger.error(f"Check failed: drift in {len(drift)} files ({elapsed:.2f}s)")
+            for path, status in drift:
+                logger.error(f"  {status}: {path}")
+        else:
+            logger.info(f"Check passed: no drift, {len(writer.targets)} files up to date ({elapsed:.2f}s)")
+        return True
+
+def _file_signature(paths: List[Path]) -> Optional[Tuple[Tuple[int, int], ...]]:
+    """返回所有文件的 (mtime_ns, size)，任一文件不存在时返回 None"""
+    signature = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+def watch_input(builder: DocBuilder, interval: float = 0.5):
+    """轮询输入文件，任一文件变化后增量重新生成
+
+    只依赖标准库的 stat 轮询；检测到变化后等待文件大小和修改时间稳定，
+    避免读取到 Apifox 正在写入的半个文件。
+
+    Args:
+        builder: 已完成首次生成的 DocBuilder
+        interval: 轮询间隔（秒）
+    """
+    settle = min(interval, 0.1)
+    paths = builder.input_paths
+    names = ', '.join(str(path) for path in paths)
+    last_signature = _file_signature(paths)
+    logger.info(f"Watching {names} for changes (press Ctrl+C to stop)...")
+
+    try:
+        while True:
+            time.sleep(interval)
+            signature = _file_signature(paths)
+            if signature is None or signature == last_signature:
+                continue
+
+            # 等待写入完成
+            time.sleep(settle)
+            if _file_signature(paths) != signature:
+                continue
+
+            last_signature = signature
+            logger.info(f"Change detected in {names}, regenerating...")
+            start = time.perf_counter()
+            if builder.run():
+                logger.info(f"Regenerated in {time.perf_counter() - start:.2f}s")
+    except KeyboardInterrupt:
+        logger.info("Stopped watching")
 
 def main():
     """主函数"""
@@ -753,13 +4308,29 @@ Examples:
   %(prog)s                                    # 使用默认路径
   %(prog)s -i data.json -o ./docs           # 指定输入输出路径
   %(prog)s -i data.json -o ./docs -v        # 详细输出模式
+  %(prog)s -i openai.json -i google.json    # 合并多个 Apifox 导出
   %(prog)s --base-url https://api.example.com  # 指定基础URL
+  %(prog)s --force                          # 忽略清单，全量重新生成
+  %(prog)s --stream                         # 流式解析大型导出文件
+  %(prog)s --jobs 8                         # 使用 8 个进程并行渲染
+  %(prog)s --watch                          # 监视输入文件，变化时增量重新生成
+  %(prog)s --check                          # CI 中检查文档是否与输入一致（不写入）
+  %(prog)s --format pack                    # 所有页面和导航写入单个归档 docs/api.pack
+  %(prog)s --unpack docs/api.pack           # 把归档还原为目录树并更新 mint.json
+  %(prog)s --force --profile build.prof     # 全量生成并保存 cProfile 统计
         """
     )
     parser.add_argument(
         '-i', '--input',
-        default='Apifox.json',
-        help='Path to Apifox JSON file (default: ./Apifox.json)'
+        action='append',
+        help='Path to Apifox JSON file; repeat to merge several exports (default: ./Apifox.json)'
+    )
+    parser.add_argument(
+        '--merge-policy',
+        choices=['rename', 'first'],
+        default='rename',
+        help='How endpoints defined by several -i inputs are merged: keep all with -2/-3 suffixes (rename, default) '
+             'or keep only the earliest input\'s definition (first)'
     )
     parser.add_argument(
         '-o', '--output',
@@ -776,6 +4347,111 @@ Examples:
         default='https://gptproto.com',
         help='Base URL for API endpoints (default: https://gptproto.com)'
     )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Parse the input incrementally, keeping only one endpoint in memory at a time'
+    )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='Number of worker processes used to render pages (default: 1, output is identical to a serial run)'
+    )
+    parser.add_argument(
+        '--write-threads',
+        type=int,
+        default=DEFAULT_WRITE_THREADS,
+        help=f'Number of threads writing pages while rendering continues (default: {DEFAULT_WRITE_THREADS}, 0 writes synchronously)'
+    )
+    parser.add_argument(
+        '-w', '--watch',
+        action='store_true',
+        help='Keep running and regenerate changed endpoints whenever the input file changes'
+    )
+    parser.add_argument(
+        '--watch-interval',
+        type=float,
+        default=0.5,
+        help='Polling interval in seconds for --watch (default: 0.5)'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help=f'Ignore {MANIFEST_FILENAME} and regenerate every endpoint'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        default=DEFAULT_CACHE_DIR,
+        help=f'Directory for the parsed-input and code-sample caches (default: ./{DEFAULT_CACHE_DIR})'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the parsed-input and code-sample caches'
+    )
+    parser.add_argument(
+        '--sample-cache-size',
+        type=int,
+        default=DEFAULT_SAMPLE_CACHE_MB,
+        help=f'Size limit in MiB of the cross-run code-sample cache, 0 disables it (default: {DEFAULT_SAMPLE_CACHE_MB})'
+    )
+    parser.add_argument(
+        '--shared-snippets',
+        action='store_true',
+        help=f'Write each distinct request example once under {SNIPPETS_DIRNAME}/ (next to mint.json) and import it from the pages'
+    )
+    parser.add_argument(
+        '--production-samples',
+        action='store_true',
+        help='Add a "Production Client" section with pooled, concurrency-limited clients that retry 429/503 '
+             'with jittered backoff (Python httpx, JavaScript, Go)'
+    )
+    parser.add_argument(
+        '--search-index',
+        action='store_true',
+        help=f'Write an inverted index of endpoint names, categories, methods, paths and parameters to '
+             f'{SEARCH_INDEX_FILENAME} in the output directory for client-side search'
+    )
+    parser.add_argument(
+        '--prune-dry-run',
+        action='store_true',
+        help='List stale files and empty directories that would be pruned without deleting them'
+    )
+    parser.add_argument(
+        '--format',
+        choices=['tree', 'pack'],
+        default='tree',
+        help='Write pages as a directory tree of .mdx files (tree, default) or as one indexed archive holding all '
+             'pages, snippets and the navigation (pack)'
+    )
+    parser.add_argument(
+        '--pack-file',
+        help='Archive written by --format pack (default: the output directory path plus .pack, e.g. docs/api.pack)'
+    )
+    parser.add_argument(
+        '--unpack',
+        metavar='PACK',
+        help='Extract an archive written by --format pack into the directory of mint.json, merge its navigation '
+             'into mint.json, and exit'
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Render in memory and compare with the files on disk, mint.json and the manifest without writing anything; '
+             'exit with status 1 and list the differing files if any'
+    )
+    parser.add_argument(
+        '--slowest',
+        type=int,
+        default=10,
+        help='Number of slowest endpoints listed in _summary.json (default: 10)'
+    )
+    parser.add_argument(
+        '--profile',
+        metavar='FILE',
+        help='Write cProfile statistics of the initial build to FILE (inspect with python -m pstats FILE)'
+    )
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -791,93 +4467,53 @@ Examples:
     # 设置全局配置
     Config.set_base_url(args.base_url)
 
-    # 验证输入文件
-    input_path = Path(args.input)
-    if not input_path.exists():
-        logger.error(f"Input file not found: {args.input}")
-        sys.exit(1)
-
-    logger.info(f"Reading API data from: {args.input}")
+    # 还原归档：不需要输入文件
+    if args.unpack:
+        mint_json_path = Path(args.mint_json)
+        try:
+            count = unpack_pack(Path(args.unpack), mint_json_path.parent, mint_json_path)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to unpack {args.unpack}: {e}")
+            sys.exit(1)
+        logger.info(f"Unpacked {count} files from {args.unpack} into {mint_json_path.parent}")
+        return
 
-    # 读取 Apifox.json
-    try:
-        with open(args.input, 'r', encoding='utf-8') as f:
-            apifox_data = json.load(f)
-        logger.info("Successfully loaded Apifox data")
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse JSON file: {e}")
+    # 验证输入文件
+    if not args.input:
+        args.input = ['Apifox.json']
+    for input_file in args.input:
+        if not Path(input_file).exists():
+            logger.error(f"Input file not found: {input_file}")
+            sys.exit(1)
+    if args.check and args.watch:
+        logger.error("--check cannot be combined with --watch")
         sys.exit(1)
-    except Exception as e:
-        logger.error(f"Failed to read input file: {e}")
+    if args.check and args.format == 'pack':
+        logger.error("--check compares the directory tree and cannot be combined with --format pack")
         sys.exit(1)
 
-    # 创建输出目录
-    output_path = Path(args.output)
-    output_path.mkdir(parents=True, exist_ok=True)
-    logger.info(f"Output directory: {args.output}")
-
-    # 提取所有 API 并生成文档
-    logger.info("Extracting API endpoints and generating documentation...")
-
-    navigation_tree: Dict[str, NavigationNode] = {}
-    all_apis = []
-    total_generated = 0
-
-    # Apifox 导出格式使用 'item'
-    collections = apifox_data.get('item', [])
-
-    for collection in collections:
-        apis, count = extract_apis_recursive(
-            collection,
-            [],
-            output_path,
-            navigation_tree
-        )
-        all_apis.extend(apis)
-        total_generated += count
-
-    logger.info(f"Found {len(all_apis)} API endpoints")
-    logger.info(f"Generated {total_generated} documentation files")
-
-    if not all_apis:
-        logger.warning("No APIs found in the input file")
-        return
-
-    # 更新 mint.json
-    mint_json_path = Path(args.mint_json)
-    if mint_json_path.exists():
-        logger.info(f"Updating {args.mint_json}...")
-        try:
-            update_mint_json(navigation_tree, mint_json_path)
-            logger.info("Successfully updated mint.json")
-        except Exception as e:
-            logger.error(f"Failed to update mint.json: {e}")
+    builder = DocBuilder(args)
+    if args.format == 'pack':
+        # 归档中的路径相对 mint.json 所在目录，输出目录和 snippet 目录都必须在其中
+        root = os.path.abspath(builder.mint_json_path.parent)
+        for directory in (builder.output_path, builder.snippets_dir):
+            if os.path.commonpath([root, os.path.abspath(directory)]) != root:
+                logger.error(f"--format pack requires {directory} to be inside the mint.json directory {root}")
+                sys.exit(1)
+    if args.profile:
+        # 只分析主进程；--jobs 大于 1 时渲染耗时在工作进程中，不会出现在统计里
+        profiler = cProfile.Profile()
+        succeeded = profiler.runcall(builder.run)
+        profiler.dump_stats(args.profile)
+        logger.info(f"Profile saved to: {args.profile}")
     else:
-        logger.warning(f"mint.json not found at {args.mint_json}, skipping navigation update")
-
-    # 输出统计信息
-    logger.info("\n" + "="*50)
-    logger.info("Documentation generation completed!")
-    logger.info("="*50)
-    logger.info(f"  Total APIs: {len(all_apis)}")
-    logger.info(f"  Generated docs: {total_generated}")
-    logger.info(f"  Categories: {len(navigation_tree)}")
-
-    # 生成摘要文件
-    summary_path = output_path / "_summary.json"
-    summary = {
-        'generated_at': datetime.now().isoformat(),
-        'total_apis': len(all_apis),
-        'generated_docs': total_generated,
-        'categories': list(navigation_tree.keys())
-    }
+        succeeded = builder.run()
+    if not succeeded or builder.drift:
+        sys.exit(1)
 
-    try:
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, ensure_ascii=False, indent=2)
-        logger.info(f"\nSummary saved to: {summary_path}")
-    except Exception as e:
-        logger.warning(f"Failed to save summary: {e}")
+    # 监视模式：保持进程运行，输入文件变化时增量重新生成
+    if args.watch:
+        watch_input(builder, args.watch_interval)
 
 if __name__ == '__main__':
     main()
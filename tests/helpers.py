@@ -0,0 +1,59 @@
+"""
+测试共用的辅助函数：构造 Apifox 导出、运行 main、记录目录快照
+"""
+
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import generate_docs  # noqa: E402
+
+def endpoint(name, method='POST', url=None, raw='{"model": "gpt-4o"}'):
+    """构造一个 Apifox API 条目；raw 为 None 时没有请求体"""
+    if url is None:
+        url = {'host': ['{{baseUrl}}'], 'path': ['v1', 'chat', 'completions']}
+    request = {'method': method, 'url': url, 'header': []}
+    if raw is not None:
+        request['body'] = {'mode': 'raw', 'raw': raw}
+    return {'name': name, 'request': request, 'response': []}
+
+def folder(name, *items):
+    """构造一个 Apifox 目录条目"""
+    return {'name': name, 'item': list(items)}
+
+def write_export(path, *items):
+    """写入 Apifox 导出文件；不指定条目时只包含 OpenAI/Chat 一个端点"""
+    if not items:
+        items = (folder('OpenAI', endpoint('Chat')),)
+    data = {'info': {'name': 'test'}, 'item': list(items)}
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+
+def write_mint_json(path, navigation=None):
+    """写入只包含 navigation 的 mint.json"""
+    path.write_text(json.dumps({'navigation': navigation or []}, indent=2) + '\n', encoding='utf-8')
+
+def run_main(monkeypatch, *argv):
+    """以给定的命令行参数运行 main，返回退出码"""
+    monkeypatch.setattr(sys, 'argv', ['generate_docs.py', *map(str, argv)])
+    try:
+        generate_docs.main()
+    except SystemExit as e:
+        return e.code
+    return 0
+
+def site_args(root, *extra):
+    """root 下的标准布局（Apifox.json、docs/api、mint.json、缓存目录）对应的命令行参数"""
+    return ['-i', root / 'Apifox.json', '-o', root / 'docs' / 'api', '-m', root / 'mint.json',
+            '--cache-dir', root / '.cache', *extra]
+
+def summary(root):
+    """读取 root/docs/api/_summary.json"""
+    return json.loads((root / 'docs' / 'api' / '_summary.json').read_text(encoding='utf-8'))
+
+def snapshot(directory):
+    """目录中所有文件的 (路径, 修改时间, 大小)"""
+    return sorted((str(path), path.stat().st_mtime_ns, path.stat().st_size)
+                  for path in directory.rglob('*') if path.is_file())
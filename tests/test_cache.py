@@ -0,0 +1,43 @@
+"""
+解析缓存：CollectionCache 只复用同一生成器版本和解析代码写入的缓存
+"""
+
+from helpers import endpoint, folder, generate_docs, write_export
+
+def _load(tmp_path):
+    cache = generate_docs.CollectionCache(tmp_path / 'cache')
+    entries = cache.load(tmp_path / 'Apifox.json')
+    return cache, entries
+
+def test_cache_hit_with_same_version(tmp_path):
+    write_export(tmp_path / 'Apifox.json', folder('OpenAI', endpoint('Chat')))
+    _, entries = _load(tmp_path)
+    cache, cached = _load(tmp_path)
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert cached == entries
+
+def test_cache_from_other_generator_version_is_rejected(tmp_path, monkeypatch):
+    write_export(tmp_path / 'Apifox.json', folder('OpenAI', endpoint('Chat')))
+    with monkeypatch.context() as patch:
+        patch.setattr(generate_docs, 'GENERATOR_VERSION', '0.1')
+        # 旧版本写入的缓存内容与当前解析结果不同
+        patch.setattr(generate_docs, 'flatten_collection', lambda data: [(['Stale'], None)])
+        _, stale = _load(tmp_path)
+    assert stale == [(['Stale'], None)]
+
+    cache, entries = _load(tmp_path)
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert entries == generate_docs.flatten_collection(
+        {'item': [folder('OpenAI', endpoint('Chat'))]})
+
+def test_cache_from_other_parser_is_rejected(tmp_path, monkeypatch):
+    write_export(tmp_path / 'Apifox.json', folder('OpenAI', endpoint('Chat')))
+    _load(tmp_path)
+
+    def iter_collection_items(sub_items, folder_path, on_folder=None):
+        yield from ()
+
+    monkeypatch.setattr(generate_docs, '_PARSER_FUNCTIONS',
+                        (generate_docs.flatten_collection, iter_collection_items))
+    cache, _ = _load(tmp_path)
+    assert (cache.hits, cache.misses) == (0, 1)
@@ -0,0 +1,153 @@
+"""
+generate_docs.py 的回归测试
+
+使用方法:
+    python -m pytest -q tests
+"""
+
+import json
+import logging
+import re
+
+from helpers import (REPO_ROOT, endpoint, folder, generate_docs, run_main, site_args, snapshot, write_export,
+                     write_mint_json)
+
+def _polling_urls(items, folder='Kling/Official Format'):
+    """关联同一文件夹中的任务端点，返回每个提交端点页面中 Python 轮询示例的 QUERY_URL"""
+    context = generate_docs.RenderContext(base_url='https://gptproto.com')
+    folder_path = folder.split('/')
+    urls = {}
+    for _, item in generate_docs.link_task_endpoints((folder_path, item) for item in items):
+        content = generate_docs.generate_api_doc(item, folder, context)
+        match = re.search(r'^QUERY_URL = "([^"]*)"$', content, re.MULTILINE)
+        urls[item['name']] = match.group(1) if match else None
+    return urls
+
+def test_task_polling_query_url_is_absolute():
+    submit = endpoint('Text to Video', 'POST', {
+        'raw': '{{baseUrl}}/api/v3/kling/text-to-video',
+        'host': ['{{baseUrl}}'], 'path': ['api', 'v3', 'kling', 'text-to-video']
+    }, raw='{"prompt": "a cat"}')
+    query = endpoint('Query Task', 'GET', {
+        'raw': 'https://gptproto.com/api/v3/predictions/df39e0baac8c4d9bbbaafb37259fb76d/result',
+        'protocol': 'https', 'host': ['gptproto', 'com'],
+        'path': ['api', 'v3', 'predictions', 'df39e0baac8c4d9bbbaafb37259fb76d', 'result']
+    }, raw=None)
+    url = _polling_urls([submit, query])['Text to Video']
+    assert url == 'https://gptproto.com/api/v3/predictions/{task_id}/result'
+
+def test_task_polling_substitutes_path_variables():
+    submit = endpoint('Text to Video', 'POST', {
+        'host': ['{{baseUrl}}'], 'path': ['kling', 'v1', 'videos', 'text2video']
+    }, raw='{"prompt": "a cat"}')
+    query = endpoint('Query Task', 'GET', {
+        'host': ['{{baseUrl}}'], 'path': ['kling', 'v1', ':action', ':action2', ':task_id'],
+        'variable': [{'key': 'action', 'value': 'videos'}, {'key': 'action2', 'value': 'text2video'},
+                     {'key': 'task_id'}]
+    }, raw=None)
+    url = _polling_urls([submit, query])['Text to Video']
+    assert url == 'https://gptproto.com/kling/v1/videos/text2video/{task_id}'
+    assert not re.search(r'/:\w', url)
+
+def test_task_polling_skips_unresolved_path_variables():
+    submit = endpoint('Text to Video', 'POST', {
+        'host': ['{{baseUrl}}'], 'path': ['kling', 'v1', 'videos', 'text2video']
+    }, raw='{"prompt": "a cat"}')
+    query = endpoint('Query Task', 'GET', {
+        'host': ['{{baseUrl}}'], 'path': ['kling', 'v1', ':action', ':action2', ':task_id'],
+        'variable': [{'key': 'action', 'value': 'videos'}, {'key': 'action2', 'description': 'text2video'},
+                     {'key': 'task_id'}]
+    }, raw=None)
+    assert _polling_urls([submit, query])['Text to Video'] is None
+
+def test_task_polling_urls_in_export_are_absolute():
+    with open(REPO_ROOT / 'Apifox.json', 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    context = generate_docs.RenderContext(base_url='https://gptproto.com')
+    linked = 0
+    for folder_path, item in generate_docs.link_task_endpoints(
+            generate_docs.iter_collection_items(data.get('item', []), [])):
+        if generate_docs.TASK_QUERY_KEY not in item:
+            continue
+        url, _ = generate_docs.task_query_url(item[generate_docs.TASK_QUERY_KEY], context)
+        assert re.match(r'https?://[^/]+\.[^/]+/', url), url
+        assert not re.search(r'/:\w', url), url
+        linked += 1
+    assert linked
+
+def test_pack_rejects_output_outside_mint_json_directory(tmp_path, monkeypatch):
+    write_export(tmp_path / 'Apifox.json')
+    (tmp_path / 'site').mkdir()
+    write_mint_json(tmp_path / 'site' / 'mint.json')
+    code = run_main(monkeypatch, '-i', str(tmp_path / 'Apifox.json'), '--format', 'pack', '--no-cache',
+                     '-o', str(tmp_path / 'elsewhere' / 'api'), '-m', str(tmp_path / 'site' / 'mint.json'))
+    assert code == 1
+    assert not (tmp_path / 'elsewhere').exists()
+
+def test_run_fails_when_every_endpoint_fails(tmp_path, monkeypatch):
+    write_export(tmp_path / 'Apifox.json')
+    write_mint_json(tmp_path / 'mint.json')
+
+    def broken(*args, **kwargs):
+        raise RuntimeError('render failed')
+
+    monkeypatch.setattr(generate_docs, 'render_endpoint', broken)
+    code = run_main(monkeypatch, '-i', str(tmp_path / 'Apifox.json'), '--format', 'pack', '--no-cache',
+                     '-o', str(tmp_path / 'docs' / 'api'), '-m', str(tmp_path / 'mint.json'))
+    assert code == 1
+    assert not (tmp_path / 'docs' / 'api.pack').exists()
+
+def test_check_writes_nothing(tmp_path, monkeypatch):
+    write_export(tmp_path / 'Apifox.json')
+    write_mint_json(tmp_path / 'mint.json')
+    base = ['-i', str(tmp_path / 'Apifox.json'), '-o', str(tmp_path / 'docs' / 'api'),
+            '-m', str(tmp_path / 'mint.json')]
+    assert run_main(monkeypatch, *base, '--cache-dir', str(tmp_path / 'build-cache')) == 0
+    assert (tmp_path / 'build-cache').is_dir()
+
+    # 已有缓存目录和全新缓存目录都不能被 --check 写入
+    before = snapshot(tmp_path)
+    assert run_main(monkeypatch, *base, '--check', '--cache-dir', str(tmp_path / 'build-cache')) == 0
+    assert run_main(monkeypatch, *base, '--check', '--cache-dir', str(tmp_path / 'check-cache')) == 0
+    assert snapshot(tmp_path) == before
+    assert not (tmp_path / 'check-cache').exists()
+
+def test_check_reports_drift_instead_of_generated_counts(tmp_path, monkeypatch, caplog):
+    write_export(tmp_path / 'Apifox.json')
+    write_mint_json(tmp_path / 'mint.json')
+    assert run_main(monkeypatch, *site_args(tmp_path)) == 0
+
+    def check_messages():
+        caplog.clear()
+        with caplog.at_level(logging.INFO):
+            code = run_main(monkeypatch, *site_args(tmp_path, '--check'))
+        messages = [record.getMessage() for record in caplog.records if record.levelno >= logging.INFO]
+        assert not [message for message in messages if 'Generated' in message or ' added' in message]
+        return code, messages
+
+    code, messages = check_messages()
+    assert code == 0
+    assert any(message.startswith('Check passed: no drift') for message in messages)
+
+    write_export(tmp_path / 'Apifox.json', folder('OpenAI', endpoint('Chat'), endpoint('Edit')))
+    code, messages = check_messages()
+    assert code == 1
+    assert any(message.startswith('Check failed: drift in ') for message in messages)
+
+def test_task_polling_escapes_task_id():
+    submit = endpoint('Text to Video', 'POST', {
+        'host': ['{{baseUrl}}'], 'path': ['kling', 'v1', 'videos', 'text2video']
+    }, raw='{"prompt": "a cat"}')
+    query = endpoint('Query Task', 'GET', {
+        'host': ['{{baseUrl}}'], 'path': ['kling', 'v1', 'videos', ':task_id'], 'variable': [{'key': 'task_id'}]
+    }, raw=None)
+    context = generate_docs.RenderContext(base_url='https://gptproto.com')
+    (_, linked), _ = generate_docs.link_task_endpoints([(['Kling'], submit), (['Kling'], query)])
+    content = generate_docs.generate_api_doc(linked, 'Kling', context)
+
+    blocks = [block.split('\n```', 1)[0] for block in content.split('```python Python\n')[1:]]
+    python = next(block for block in blocks if 'QUERY_URL = ' in block)
+    compile(python, 'polling.py', 'exec')
+    assert 'QUERY_URL.format(task_id=quote(str(task_id), safe=""))' in python
+    assert 'encodeURIComponent(taskId)' in content
+    assert 'url.PathEscape(taskID)' in content
@@ -0,0 +1,44 @@
+"""
+增量生成清单：变更计数和模板指纹
+"""
+
+from helpers import endpoint, folder, generate_docs, run_main, site_args, summary, write_export, write_mint_json
+
+def _build(monkeypatch, root, *items):
+    write_export(root / 'Apifox.json', *items)
+    assert run_main(monkeypatch, *site_args(root)) == 0
+    return summary(root)['changes']
+
+def test_change_counts(tmp_path, monkeypatch):
+    write_mint_json(tmp_path / 'mint.json')
+    changes = _build(monkeypatch, tmp_path, folder('OpenAI', endpoint('Chat'), endpoint('Edit'), endpoint('Old')))
+    assert changes == {'added': 3, 'changed': 0, 'unchanged': 0, 'removed': 0}
+
+    # Chat 不变，Edit 修改请求体，Old 删除，New 新增
+    changes = _build(monkeypatch, tmp_path, folder('OpenAI', endpoint('Chat'),
+                                                    endpoint('Edit', raw='{"model": "gpt-4o-mini"}'),
+                                                    endpoint('New')))
+    assert changes == {'added': 1, 'changed': 1, 'unchanged': 1, 'removed': 1}
+    assert not (tmp_path / 'docs' / 'api' / 'openai' / 'old.mdx').exists()
+
+def test_template_change_regenerates_all_pages(tmp_path, monkeypatch):
+    write_mint_json(tmp_path / 'mint.json')
+    items = (folder('OpenAI', endpoint('Chat'), endpoint('Edit')),)
+    _build(monkeypatch, tmp_path, *items)
+    assert _build(monkeypatch, tmp_path, *items)['unchanged'] == 2
+
+    # 修改任一页面模板而不递增 TEMPLATE_REVISION，清单指纹随之变化
+    monkeypatch.setattr(generate_docs, 'PAGE_TEMPLATES', generate_docs.PAGE_TEMPLATES + ('## Changed\n\n',))
+    assert _build(monkeypatch, tmp_path, *items)['unchanged'] == 0
+    assert summary(tmp_path)['generated_docs'] == 2
+
+def test_code_sample_template_change_changes_fingerprint(monkeypatch):
+    before = generate_docs.page_template_fingerprint()
+    for group in generate_docs.CODE_SAMPLE_GROUPS:
+        templates = list(generate_docs.CODE_SAMPLE_GROUPS[group])
+        monkeypatch.setitem(generate_docs.CODE_SAMPLE_GROUPS, group, templates)
+        language, template = templates[0]
+        templates[0] = (language, generate_docs.SectionTemplate(template.text + '\n'))
+        assert generate_docs.page_template_fingerprint() != before
+        monkeypatch.undo()
+    assert generate_docs.page_template_fingerprint() == before
@@ -0,0 +1,87 @@
+"""
+mint.json 导航合并：merge_navigation 和 patch_navigation_text
+"""
+
+import json
+import os
+
+import pytest
+
+from helpers import endpoint, folder, run_main, site_args, write_export
+
+GET_STARTED = '''{
+      "group": "Get Started",
+      "pages": ["introduction",   "quickstart"]
+    }'''
+GUIDES = '''{ "group": "Guides", "pages": [ "guides/streaming" ] }'''
+MINT_JSON = '''{
+  "name": "GPTProto",
+  "colors": {"primary": "#0D9373"},
+  "navigation": [
+    %s,
+    %s
+  ],
+  "footerSocials": {}
+}
+''' % (GET_STARTED, GUIDES)
+
+OPENAI = folder('OpenAI', endpoint('Chat'))
+CLAUDE = folder('Claude', endpoint('Messages'))
+
+def _build(monkeypatch, root, *items):
+    write_export(root / 'Apifox.json', *items)
+    assert run_main(monkeypatch, *site_args(root)) == 0
+    return json.loads((root / 'mint.json').read_text(encoding='utf-8'))
+
+def _groups(mint):
+    return [group['group'] for group in mint['navigation']]
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    """mint.json 中的 API 分组插在两个手写分组之间"""
+    (tmp_path / 'mint.json').write_text(MINT_JSON.replace(GUIDES, json.dumps(
+        {'group': 'OpenAI', 'pages': ['docs/api/openai/old']}) + ',\n    ' + GUIDES), encoding='utf-8')
+    _build(monkeypatch, tmp_path, OPENAI, CLAUDE)
+    return tmp_path
+
+def test_unchanged_navigation_is_not_rewritten(site, monkeypatch):
+    mint_json = site / 'mint.json'
+    os.utime(mint_json, ns=(1_000_000_000, 1_000_000_000))
+    before = mint_json.read_bytes()
+    _build(monkeypatch, site, OPENAI, CLAUDE)
+    assert mint_json.read_bytes() == before
+    assert mint_json.stat().st_mtime_ns == 1_000_000_000
+
+def test_hand_written_groups_keep_position_and_content(site):
+    text = (site / 'mint.json').read_text(encoding='utf-8')
+    mint = json.loads(text)
+    # API 分组替换原来的 OpenAI 分组，作为整体留在两个手写分组之间
+    assert _groups(mint) == ['Get Started', 'Claude', 'OpenAI', 'Guides']
+    assert mint['navigation'][2]['pages'] == ['docs/api/openai/chat']
+    # 手写分组和文件其余部分逐字节保留
+    assert GET_STARTED in text and GUIDES in text
+    assert text.startswith('{\n  "name": "GPTProto",\n  "colors": {"primary": "#0D9373"},\n')
+    assert text.endswith('\n  ],\n  "footerSocials": {}\n}\n')
+
+def test_removed_category_is_dropped(site, monkeypatch):
+    before = (site / 'mint.json').read_text(encoding='utf-8')
+    mint = _build(monkeypatch, site, OPENAI)
+    assert _groups(mint) == ['Get Started', 'OpenAI', 'Guides']
+    text = (site / 'mint.json').read_text(encoding='utf-8')
+    assert GET_STARTED in text and GUIDES in text
+    # 未变化的 OpenAI 分组沿用原文本
+    openai = before[before.index('{\n      "group": "OpenAI"'):]
+    assert openai[:openai.index('}') + 1] in text
+
+@pytest.mark.parametrize('navigation_text', [
+    # navigation 写在一行内
+    '[%s, %s]' % (json.dumps(json.loads(GET_STARTED)), GUIDES),
+    # 使用制表符缩进
+    '[\n\t\t%s,\n\t\t%s\n\t]' % (json.dumps(json.loads(GET_STARTED)), GUIDES),
+])
+def test_unpatchable_navigation_falls_back_to_full_rewrite(tmp_path, monkeypatch, navigation_text):
+    text = '{\n\t"name": "GPTProto",\n\t"navigation": %s\n}\n' % navigation_text
+    (tmp_path / 'mint.json').write_text(text, encoding='utf-8')
+    mint = _build(monkeypatch, tmp_path, OPENAI)
+    assert _groups(mint) == ['Get Started', 'Guides', 'OpenAI']
+    assert (tmp_path / 'mint.json').read_text(encoding='utf-8') == json.dumps(mint, ensure_ascii=False, indent=2)
@@ -0,0 +1,117 @@
+"""
+单文件归档：--format pack 和 --unpack 的往返，以及损坏归档的处理
+"""
+
+import json
+
+import pytest
+
+from helpers import endpoint, folder, generate_docs, run_main, site_args, snapshot, write_export, write_mint_json
+
+ITEMS = (folder('OpenAI', endpoint('Chat'), folder('Images', endpoint('Edit', raw='{"model": "dall-e-2"}'))),
+         folder('Claude', endpoint('Messages', raw='{"model": "claude-sonnet-4"}')))
+NAVIGATION = [{'group': 'Get Started', 'pages': ['introduction']}]
+
+def _site(root, monkeypatch, *extra):
+    root.mkdir()
+    write_export(root / 'Apifox.json', *ITEMS)
+    write_mint_json(root / 'mint.json', NAVIGATION)
+    assert run_main(monkeypatch, *site_args(root, '--shared-snippets', *extra)) == 0
+    return root
+
+def _tree(root):
+    """docs/ 和 snippets/ 下的文件内容（不含每次运行都不同的 _summary.json）"""
+    return {str(path.relative_to(root)): path.read_bytes() for base in ('docs', 'snippets')
+            for path in (root / base).rglob('*') if path.is_file() and path.name != '_summary.json'}
+
+@pytest.fixture
+def pack_site(tmp_path, monkeypatch):
+    """以 --format pack 生成的站点，只有 docs/api.pack"""
+    site = _site(tmp_path / 'pack', monkeypatch, '--format', 'pack')
+    assert sorted(path.name for path in (site / 'docs').iterdir()) == ['api.pack']
+    return site
+
+def _unpack(monkeypatch, site):
+    return run_main(monkeypatch, '--unpack', site / 'docs' / 'api.pack', '-m', site / 'mint.json')
+
+def test_pack_then_unpack_rebuilds_the_tree(tmp_path, monkeypatch, pack_site):
+    tree = _site(tmp_path / 'tree', monkeypatch)
+    assert _unpack(monkeypatch, pack_site) == 0
+    (pack_site / 'docs' / 'api.pack').unlink()
+    assert _tree(pack_site) == _tree(tree)
+    assert (pack_site / 'mint.json').read_bytes() == (tree / 'mint.json').read_bytes()
+
+def _pack_parts(data):
+    """把归档拆分为 (文件头和内容, 索引)"""
+    index_offset, index_length, _ = generate_docs._PACK_TRAILER.unpack(data[-generate_docs._PACK_TRAILER.size:])
+    return data[:index_offset], json.loads(data[index_offset:index_offset + index_length])
+
+def _flip(data, position):
+    return data[:position] + bytes([data[position] ^ 0xff]) + data[position + 1:]
+
+def _repack(body, index, index_offset=None):
+    encoded = json.dumps(index).encode('utf-8')
+    offset = len(body) if index_offset is None else index_offset
+    return body + encoded + generate_docs._PACK_TRAILER.pack(offset, len(encoded), generate_docs.PACK_MAGIC)
+
+def _with_entry(data, key, entry=None):
+    """在索引末尾加入一个条目（默认复用第一个文件的内容）"""
+    body, index = _pack_parts(data)
+    index['entries'][key] = entry or next(iter(index['entries'].values()))
+    return _repack(body, index)
+
+def _with_first_entry(data, entry):
+    body, index = _pack_parts(data)
+    key = next(iter(index['entries']))
+    index['entries'][key] = entry(index['entries'][key], len(body))
+    return _repack(body, index)
+
+CORRUPTIONS = {
+    'empty': lambda data: b'',
+    'header only': lambda data: data[:len(generate_docs.PACK_MAGIC)],
+    'truncated in the middle': lambda data: data[:len(data) // 2],
+    'truncated trailer': lambda data: data[:-1],
+    'bad magic': lambda data: b'NOTAPACK' + data[8:],
+    'flipped content byte': lambda data: _flip(data, len(generate_docs.PACK_MAGIC) + 10),
+    'flipped index byte': lambda data: _flip(data, len(_pack_parts(data)[0]) + 1),
+    'index offset past the end': lambda data: _repack(*_pack_parts(data), index_offset=len(data)),
+    'index offset inside the header': lambda data: _repack(*_pack_parts(data), index_offset=0),
+    'index is not an object': lambda data: _repack(_pack_parts(data)[0], []),
+    'old format version': lambda data: _repack(_pack_parts(data)[0], dict(_pack_parts(data)[1], version=1)),
+    'entries is not an object': lambda data: _repack(_pack_parts(data)[0], dict(_pack_parts(data)[1], entries=[])),
+    'navigation is not a list': lambda data: _repack(_pack_parts(data)[0],
+                                                     dict(_pack_parts(data)[1], navigation='x')),
+    'entry offset past the content': lambda data: _with_first_entry(
+        data, lambda entry, end: [end - 1, 2, entry[2]]),
+    'entry offset inside the header': lambda data: _with_first_entry(data, lambda entry, end: [0, 4, entry[2]]),
+    'negative entry length': lambda data: _with_first_entry(data, lambda entry, end: [entry[0], -1, entry[2]]),
+    'entry without checksum': lambda data: _with_first_entry(data, lambda entry, end: entry[:2]),
+    'wrong entry checksum': lambda data: _with_first_entry(data, lambda entry, end: [entry[0], entry[1],
+                                                                                     entry[2] ^ 1]),
+    'parent directory member': lambda data: _with_entry(data, 'docs/../../escaped.mdx'),
+    'absolute member': lambda data: _with_entry(data, '/tmp/escaped.mdx'),
+    'empty member part': lambda data: _with_entry(data, 'docs//escaped.mdx'),
+    'windows drive member': lambda data: _with_entry(data, 'C:/escaped.mdx'),
+    'backslash member': lambda data: _with_entry(data, 'docs\\..\\..\\escaped.mdx'),
+}
+
+@pytest.mark.parametrize('corruption', CORRUPTIONS)
+def test_unpack_fails_cleanly_on_broken_pack(pack_site, monkeypatch, corruption):
+    pack_path = pack_site / 'docs' / 'api.pack'
+    pack_path.write_bytes(CORRUPTIONS[corruption](pack_path.read_bytes()))
+    before = snapshot(pack_site.parent)
+    assert _unpack(monkeypatch, pack_site) == 1
+    assert snapshot(pack_site.parent) == before
+
+@pytest.mark.parametrize('key', ['docs/../../escaped.mdx', '../escaped.mdx', '/tmp/escaped.mdx', 'docs/./x.mdx'])
+def test_unpack_pack_refuses_paths_outside_root(tmp_path, key):
+    root = tmp_path / 'root'
+    root.mkdir()
+    writer = generate_docs.PackWriter(tmp_path / 'evil.pack', root)
+    writer.write_text(root / 'docs' / 'api' / 'ok.mdx', 'ok')
+    writer.finish()
+    (tmp_path / 'evil.pack').write_bytes(_with_entry((tmp_path / 'evil.pack').read_bytes(), key))
+
+    with pytest.raises(ValueError, match='Invalid path'):
+        generate_docs.unpack_pack(tmp_path / 'evil.pack', root)
+    assert list(tmp_path.rglob('*.mdx')) == []
@@ -0,0 +1,97 @@
+"""
+孤立文件清理：prune_outputs 和 prune_snippets
+"""
+
+import json
+import logging
+
+import pytest
+
+from helpers import endpoint, folder, run_main, site_args, summary, write_export, write_mint_json
+
+CHAT = endpoint('Chat', raw='{"model": "gpt-4o"}')
+EDIT = endpoint('Edit', raw='{"model": "gpt-4o-mini"}')
+IMAGE = endpoint('Image', raw='{"model": "dall-e-3"}')
+
+def _build(monkeypatch, root, items, *extra):
+    write_export(root / 'Apifox.json', *items)
+    assert run_main(monkeypatch, *site_args(root, '--shared-snippets', *extra)) == 0
+
+def _files(root):
+    """docs/ 和 snippets/ 下的所有文件和目录（相对 root，不含 _ 开头的清单和摘要）"""
+    return sorted(str(path.relative_to(root)) for base in ('docs', 'snippets') if (root / base).exists()
+                  for path in (root / base).rglob('*') if not path.name.startswith('_'))
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    """已生成 OpenAI/Chat、OpenAI/Images/Edit、OpenAI/Images/Image 的站点"""
+    write_mint_json(tmp_path / 'mint.json')
+    _build(monkeypatch, tmp_path, [folder('OpenAI', CHAT, folder('Images', EDIT, IMAGE))])
+    return tmp_path
+
+def test_removed_endpoint_prunes_page_and_snippet(site, monkeypatch):
+    snippets = sorted((site / 'snippets' / 'api').glob('*.mdx'))
+    assert len(snippets) == 3
+    _build(monkeypatch, site, [folder('OpenAI', CHAT, folder('Images', IMAGE))])
+
+    assert not (site / 'docs' / 'api' / 'openai' / 'images' / 'edit.mdx').exists()
+    assert (site / 'docs' / 'api' / 'openai' / 'images' / 'image.mdx').exists()
+    assert len(list((site / 'snippets' / 'api').glob('*.mdx'))) == 2
+    assert summary(site)['pruned'] == [str(site / 'docs' / 'api' / 'openai' / 'images' / 'edit.mdx')] + \
+        [str(path) for path in snippets if not path.exists()]
+
+def test_directory_with_live_files_is_kept(site, monkeypatch):
+    notes = site / 'docs' / 'api' / 'openai' / 'images' / 'notes.md'
+    notes.write_text('hand-written', encoding='utf-8')
+    _build(monkeypatch, site, [folder('OpenAI', CHAT)])
+
+    # images/ 中只剩手写文件，目录保留；openai/ 仍有页面
+    assert sorted(path.name for path in (site / 'docs' / 'api' / 'openai' / 'images').iterdir()) == ['notes.md']
+    assert (site / 'docs' / 'api' / 'openai' / 'chat.mdx').exists()
+
+def test_emptied_directory_is_removed(site, monkeypatch):
+    _build(monkeypatch, site, [folder('OpenAI', CHAT)])
+    assert not (site / 'docs' / 'api' / 'openai' / 'images').exists()
+    assert (site / 'docs' / 'api' / 'openai').is_dir()
+    assert str(site / 'docs' / 'api' / 'openai' / 'images') in summary(site)['pruned']
+
+def test_dry_run_deletes_nothing_and_reports_the_same_set(site, monkeypatch, caplog):
+    before = _files(site)
+    with caplog.at_level(logging.INFO):
+        _build(monkeypatch, site, [folder('OpenAI', CHAT)], '--prune-dry-run')
+    assert _files(site) == before
+    previewed = sorted(record.getMessage()[len('Would prune: '):] for record in caplog.records
+                       if record.getMessage().startswith('Would prune: '))
+    assert previewed
+
+    # 预览过的孤立文件记录在清单中，下一次实际运行全部清理
+    manifest = json.loads((site / 'docs' / 'api' / '_manifest.json').read_text(encoding='utf-8'))
+    assert manifest['orphans'] and manifest['orphan_snippets']
+    _build(monkeypatch, site, [folder('OpenAI', CHAT)])
+    assert sorted(summary(site)['pruned']) == previewed
+    assert not (site / 'docs' / 'api' / 'openai' / 'images').exists()
+    assert len(list((site / 'snippets' / 'api').glob('*.mdx'))) == 1
+
+@pytest.mark.parametrize('output', ['docs/api/../../victim', 'docs/api//victim', 'docs/victim', '../victim',
+                                    'docs/api/openai/../../../victim'])
+def test_manifest_paths_outside_output_are_never_unlinked(site, monkeypatch, output):
+    victims = [site / 'victim.mdx', site / 'docs' / 'victim.mdx']
+    for victim in victims:
+        victim.write_text('keep me', encoding='utf-8')
+    manifest_path = site / 'docs' / 'api' / '_manifest.json'
+    manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    manifest['endpoints']['OpenAI/Evil'] = {'hash': 'x', 'output': output}
+    manifest['orphans'] = [output]
+    manifest['orphan_snippets'] = ['../../victim', 'code-../../victim']
+    manifest_path.write_text(json.dumps(manifest), encoding='utf-8')
+
+    _build(monkeypatch, site, [folder('OpenAI', CHAT, folder('Images', EDIT, IMAGE))])
+    for victim in victims:
+        assert victim.read_text(encoding='utf-8') == 'keep me'
+
+@pytest.mark.parametrize('extra', [['--force'], ['--base-url', 'https://api.example.com']])
+def test_force_and_settings_change_still_prune(site, monkeypatch, extra):
+    _build(monkeypatch, site, [folder('OpenAI', CHAT)], *extra)
+    assert not (site / 'docs' / 'api' / 'openai' / 'images').exists()
+    assert len(list((site / 'snippets' / 'api').glob('*.mdx'))) == 1
+    assert summary(site)['changes']['unchanged'] == 0
@@ -0,0 +1,31 @@
+"""
+客户端搜索索引：切词和前缀查找
+"""
+
+import json
+
+from helpers import endpoint, folder, generate_docs, run_main, site_args, write_export, write_mint_json
+
+def test_search_tokens():
+    assert list(generate_docs.search_tokens('response_format')) == ['response_format', 'response', 'format']
+    assert list(generate_docs.search_tokens('任务查询(feed)')) == ['任务', '务查', '查询', 'feed']
+    assert list(generate_docs.search_tokens('Midjourney 任务')) == ['midjourney', '任务']
+    assert list(generate_docs.search_tokens('图')) == ['图']
+
+def test_chinese_query_finds_endpoint(tmp_path, monkeypatch):
+    write_export(tmp_path / 'Apifox.json', folder(
+        'Midjourney', endpoint('Imagine'), endpoint('任务查询', 'GET', raw=None),
+        endpoint('查询任务(feed)', 'GET', raw=None)))
+    write_mint_json(tmp_path / 'mint.json')
+    assert run_main(monkeypatch, *site_args(tmp_path, '--search-index')) == 0
+    index = json.loads((tmp_path / 'docs' / 'api' / '_search_index.json').read_text(encoding='utf-8'))
+
+    def titles(query):
+        return [found['title'] for found, _ in generate_docs.lookup_search_index(index, query)]
+
+    assert titles('任务') == ['任务查询', '查询任务(feed)']
+    assert titles('任务查询') == ['任务查询']
+    assert titles('任') == ['任务查询', '查询任务(feed)']
+    assert titles('midjourney 任务') == ['任务查询', '查询任务(feed)']
+    assert titles('任务 feed') == ['查询任务(feed)']
+    assert titles('图片') == []
@@ -0,0 +1,71 @@
+"""
+流式解析：iter_apifox_stream 与内存遍历的结果一致
+"""
+
+import json
+
+import pytest
+
+from helpers import REPO_ROOT, endpoint, folder, generate_docs, run_main, site_args, write_export, write_mint_json
+
+def _in_memory(path):
+    """内存遍历的 (目录回调序列, 端点序列)"""
+    folders = []
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    items = list(generate_docs.iter_collection_items(data.get('item', []), [], on_folder=folders.append))
+    return folders, items
+
+def _streamed(path, chunk_size):
+    """流式遍历的 (目录回调序列, 端点序列)"""
+    folders = []
+    items = list(generate_docs.iter_apifox_stream(path, on_folder=folders.append, chunk_size=chunk_size))
+    return folders, items
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 4096])
+def test_stream_matches_in_memory_on_export(chunk_size):
+    path = REPO_ROOT / 'Apifox.json'
+    assert _streamed(path, chunk_size) == _in_memory(path)
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 4096])
+def test_stream_item_precedence(tmp_path, chunk_size):
+    path = tmp_path / 'Apifox.json'
+    write_export(
+        path,
+        # 非空的 item 优先于 items，与键的顺序无关
+        {'items': [endpoint('From items')], 'name': 'A', 'item': [endpoint('From item')]},
+        {'name': 'B', 'items': [endpoint('From items')], 'item': [endpoint('From item')]},
+        # item 为空时使用 items
+        {'name': 'C', 'item': [], 'items': [endpoint('From items')]},
+        # 目录名出现在子项之后
+        {'item': [endpoint('Late name')], 'name': 'D'},
+        # 子项非空时是目录，request 被忽略
+        dict(folder('E', endpoint('Child')), request={'method': 'GET'}),
+        folder('F', folder('G', endpoint('Nested')), endpoint('Sibling')),
+    )
+    streamed = _streamed(path, chunk_size)
+    assert streamed == _in_memory(path)
+    assert [(path, item['name']) for path, item in streamed[1]] == [
+        (['A'], 'From item'), (['B'], 'From item'), (['C'], 'From items'), (['D'], 'Late name'),
+        (['E'], 'Child'), (['F', 'G'], 'Nested'), (['F'], 'Sibling'),
+    ]
+
+def test_stream_rejects_truncated_input(tmp_path):
+    source = tmp_path / 'Apifox.json'
+    write_export(source, folder('OpenAI', endpoint('Chat'), folder('Nested', endpoint('Edit'))))
+    text = source.read_text(encoding='utf-8')
+    truncated = tmp_path / 'truncated.json'
+    for end in range(len(text)):
+        truncated.write_text(text[:end], encoding='utf-8')
+        with pytest.raises(json.JSONDecodeError):
+            list(generate_docs.iter_apifox_stream(truncated, chunk_size=7))
+
+def test_stream_build_fails_on_truncated_input(tmp_path, monkeypatch):
+    write_export(tmp_path / 'Apifox.json', folder('OpenAI', endpoint('Chat'), endpoint('Edit')))
+    text = (tmp_path / 'Apifox.json').read_text(encoding='utf-8')
+    (tmp_path / 'Apifox.json').write_text(text[:len(text) // 2], encoding='utf-8')
+    write_mint_json(tmp_path / 'mint.json')
+    before = (tmp_path / 'mint.json').read_bytes()
+    assert run_main(monkeypatch, *site_args(tmp_path, '--stream')) == 1
+    assert (tmp_path / 'mint.json').read_bytes() == before
+    assert not (tmp_path / 'docs' / 'api' / '_manifest.json').exists()
@@ -0,0 +1,42 @@
+"""
+监视模式：同一个 DocBuilder 反复运行时的增量状态
+"""
+
+from pathlib import Path
+
+from helpers import endpoint, folder, generate_docs, run_main, site_args, write_export, write_mint_json
+
+def _snippets(root):
+    return sorted(path.name for path in (root / 'snippets' / 'api').glob('*.mdx'))
+
+def test_watch_rebuild_prunes_snippets_orphaned_earlier(tmp_path, monkeypatch):
+    write_mint_json(tmp_path / 'mint.json')
+    chat = endpoint('Chat', raw='{"model": "gpt-4o"}')
+    edit = endpoint('Edit', raw='{"model": "gpt-4o-mini"}')
+    write_export(tmp_path / 'Apifox.json', folder('OpenAI', chat, edit))
+    unlink = Path.unlink
+    states = []
+
+    def failing_unlink(path, *args, **kwargs):
+        if path.suffix == '.mdx' and path.parent.name == 'api' and path.parent.parent.name == 'snippets':
+            raise OSError('busy')
+        return unlink(path, *args, **kwargs)
+
+    def watch(builder, interval):
+        states.append(_snippets(tmp_path))
+        # Edit 被删除，但它的 snippet 这次删除失败，记录为孤立 snippet
+        write_export(tmp_path / 'Apifox.json', folder('OpenAI', chat))
+        monkeypatch.setattr(Path, 'unlink', failing_unlink)
+        assert builder.run()
+        monkeypatch.setattr(Path, 'unlink', unlink)
+        states.append(_snippets(tmp_path))
+        # 输入没有变化的下一次重新生成应当清理之前遗留的孤立 snippet
+        assert builder.run()
+        states.append(_snippets(tmp_path))
+
+    monkeypatch.setattr(generate_docs, 'watch_input', watch)
+    assert run_main(monkeypatch, *site_args(tmp_path, '--shared-snippets', '--watch')) == 0
+    initial, orphaned, pruned = states
+    assert len(initial) == 2
+    assert orphaned == initial
+    assert len(pruned) == 1